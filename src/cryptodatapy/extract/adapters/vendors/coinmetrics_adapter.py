@@ -1,22 +1,46 @@
-from typing import Dict, Optional, Union, Any, List
+import asyncio
+from typing import Callable, Dict, Optional, Union, Any, List, Tuple
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 import logging
-from time import sleep
 from tqdm import tqdm
 
-from coinmetrics.api_client import CoinMetricsClient
-
 from cryptodatapy.extract.adapters.base_adapter import BaseAPIAdapter
 from cryptodatapy.extract.params.vendors.coinmetrics_param_converter import CoinMetricsParamConverter
 from cryptodatapy.util.datacredentials import DataCredentials
 from cryptodatapy.core.data_request import DataRequest
-from cryptodatapy.util.api_requester import APIRequester
+from cryptodatapy.util.api_requester import APIRequester, AsyncAPIRequester
+from cryptodatapy.util.paginator import Paginator
+from cryptodatapy.util.partitioned_writer import PartitionedWriter
 from cryptodatapy.transform.wranglers.coinmetrics_wrangler import CoinMetricsWrangler
-from cryptodatapy.extract.config.coinmetrics_config import COINMETRICS_ENDPOINTS
+from cryptodatapy.extract.config.coinmetrics_config import (COINMETRICS_ENDPOINTS, COINMETRICS_FIELDS,
+                                                            COINMETRICS_META_ENDPOINTS, COINMETRICS_RATE_LIMITS)
+from cryptodatapy.util.catalog_cache import catalog_cache
+from cryptodatapy.util.column_buffer import ColumnBuffer, STREAM_DECODERS
+from cryptodatapy.util.rate_limiter import rate_limiters
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 logger = logging.getLogger(__name__)
 
+# schemas of market trades and quotes spilled to disk, with timestamps in UTC
+TRADES_SCHEMA = pa.schema([
+    ('time', pa.timestamp('us')),
+    ('coin_metrics_id', pa.string()),
+    ('price', pa.float64()),
+    ('amount', pa.float64()),
+    ('side', pa.string())
+])
+QUOTES_SCHEMA = pa.schema([
+    ('time', pa.timestamp('us')),
+    ('coin_metrics_id', pa.string()),
+    ('ask_price', pa.float64()),
+    ('ask_size', pa.float64()),
+    ('bid_price', pa.float64()),
+    ('bid_size', pa.float64())
+])
+
 
 class CoinMetricsAdapter(BaseAPIAdapter):
     """
@@ -42,7 +66,12 @@ class CoinMetricsAdapter(BaseAPIAdapter):
         # hardcoded defaults
         default_config = {
             'api_key': data_cred.coinmetrics_api_key,
-            'base_url': data_cred.coinmetrics_base_url
+            'base_url': data_cred.coinmetrics_base_url,
+            'max_concurrency': 4,  # max number of requests in flight
+            'time_partitions': 1,  # number of time windows each request is split into
+            'max_tickers_per_partition': None,  # max number of markets/assets/indexes per request
+            'response_format': 'json',  # 'json', or 'csv'/'json_stream' for bulk pulls
+            **COINMETRICS_RATE_LIMITS['pro' if data_cred.coinmetrics_api_key else 'community']
         }
 
         # user-provided config (if any) overrides the defaults
@@ -51,8 +80,13 @@ class CoinMetricsAdapter(BaseAPIAdapter):
         # initialize BaseAdapter/BaseAPIAdapter with the merged configuration
         super().__init__(final_config)
 
-        # initialize and store the CoinMetrics SDK client
-        self.client = CoinMetricsClient(api_key=final_config.get('api_key'))
+        # shared token-bucket rate limiter, seeded from the rate limit info
+        rate_limit = self.get_rate_limit_info()
+        self._rate_limiter = rate_limiters.configure(
+            'coinmetrics',
+            rate=rate_limit['rate_limit_rpm'] / 60,
+            burst=rate_limit['rate_limit_burst']
+        )
 
         # initialize properties for caching/metadata
         self.assets: Optional[Union[pd.DataFrame, list]] = None
@@ -65,26 +99,50 @@ class CoinMetricsAdapter(BaseAPIAdapter):
     # --- 1. Helper Methods: Metadata Requests ---
     # --------------------------------------------------------------------------
 
-    def _fetch_raw_meta(self, info_type: str, **kwargs) -> Dict[str, Any]:
+    def _fetch_raw_meta(self, info_type: str, **kwargs) -> List[Dict[str, Any]]:
         """
         Helper method to fetch raw metadata (assets, markets, fields, exchanges, etc.)
 
+        Requests go through the shared requester, so metadata is served from the on-disk response cache
+        when it is enabled. All pages of the metadata are fetched.
+
         Parameters
         ----------
         info_type : str
-            The type of metadata to fetch (e.g., 'assets', 'markets', 'fields', 'exchanges', 'indexes', etc).
-        kwwargs : additional keyword arguments to pass to the CoinMetrics client method.
+            The type of metadata to fetch (e.g., 'reference_data_assets', 'reference_data_markets', etc).
+        kwargs : additional query parameters for the metadata endpoint, e.g. exchange for markets.
 
         Returns
         -------
-        Dict[str, Any]
-            The raw metadata response from CoinMetrics API.
+        List[Dict[str, Any]]
+            The raw metadata records from CoinMetrics API.
         """
-        try:
-            raw_data = getattr(self.client, info_type)(**kwargs)
-        except AttributeError:
+        endpoint = COINMETRICS_META_ENDPOINTS.get(info_type)
+        if endpoint is None:
             raise ValueError(f"Unknown CoinMetrics info_type: {info_type}")
 
+        def _fetch(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return APIRequester.get_request(
+                url=request['url'], params=request['params'], rate_limiter=self._rate_limiter
+            )
+
+        def _next_request(request: Dict[str, Any], page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            # params are part of the next_page_url, so None is passed to avoid re-adding them
+            next_page_url = page.get('next_page_url')
+            return {'url': next_page_url, 'params': None} if next_page_url else None
+
+        params = {**kwargs, 'page_size': 10000, 'api_key': self._config.get('api_key')}
+        paginator = Paginator(
+            fetch=_fetch,
+            first_request={'url': self._config.get('base_url', '') + endpoint, 'params': params},
+            next_request=_next_request,
+            parse=lambda page: page.get('data', [])
+        )
+
+        raw_data = [record for records in paginator for record in records]
+        if not raw_data:
+            raise Exception(f"No {info_type} metadata returned from CoinMetrics API.")
+
         return raw_data
 
     def get_exchanges_info(self, as_list: bool = False) -> Union[pd.DataFrame, list]:
@@ -206,95 +264,295 @@ class CoinMetricsAdapter(BaseAPIAdapter):
 
         return self.fields
 
+    def _get_catalog(self, catalog: str, **kwargs) -> List[str]:
+        """
+        Gets a catalog as a list, from the shared catalog cache or else from the CoinMetrics API.
+
+        Parameters
+        ----------
+        catalog : str, {'indexes', 'markets', 'assets', 'asset_fields'}
+            The catalog to get.
+        kwargs : additional keyword arguments to pass to the catalog's get method, e.g. exchange for markets.
+
+        Returns
+        -------
+        List[str]
+            List of catalog entries, e.g. asset tickers.
+        """
+        getters = {
+            'indexes': self.get_indexes_info,
+            'markets': self.get_markets_info,
+            'assets': self.get_assets_info,
+            'asset_fields': self.get_available_fields,
+        }
+        if catalog not in getters:
+            raise ValueError(f"Unknown CoinMetrics catalog: {catalog}")
+
+        # catalogs depend on the api key's access, community or pro
+        key = catalog_cache.make_key(
+            'coinmetrics', catalog, access='pro' if self._config.get('api_key') else 'community', **kwargs
+        )
+
+        return catalog_cache.get_or_fetch(key, lambda: getters[catalog](as_list=True, **kwargs))
+
     def get_rate_limit_info(self) -> Optional[Any]:
         """
-        Gets and updates the number of API calls made and remaining.
+        Gets the rate limit used to pace requests.
 
         Returns
         -------
         Optional[Any]
-            Rate limit information if available.
+            Rate limit information, as requests per minute and burst size.
         """
-        # CoinMetrics community API does not provide rate limit info
-        return None
+        # CoinMetrics API does not provide rate limit info, use the configured (documented) limits
+        return {
+            'rate_limit_rpm': self._config['rate_limit_rpm'],
+            'rate_limit_burst': self._config['rate_limit_burst']
+        }
 
     # --------------------------------------------------------------------------
     # --- 2. Internal Data Fetcher (Consolidated and improved pagination) ---
     # --------------------------------------------------------------------------
 
-    def _fetch_all_raw_data(self,
-                            pause: float,
-                            endpoint: str,
-                            params: Dict[str, Union[str, int, float]]) -> pd.DataFrame:
+    async def _fetch_all_pages(self,
+                               requests: List[Dict[str, Any]],
+                               trials: int = 3,
+                               pause: float = 0.1,
+                               on_page: Optional[Callable[[int, Any], None]] = None) -> List[ColumnBuffer]:
         """
-        Internal method to handle the API request, including fetching all pages (pagination),
+        Internal method to fetch all pages (pagination) for a list of requests concurrently,
         with an indeterminate progress bar.
 
+        The page chain of each request is followed by its own task, and the next page of a chain is requested
+        as soon as its next_page_url is known, while the current page is handled. Chains share the CoinMetrics
+        rate limiter and concurrency cap, so a slow or retrying chain doesn't hold up the others.
+
+        The 'data' array of each page is decoded straight into columns, which are packed into Arrow buffers
+        as pages arrive. Requests with a streaming format (csv or json_stream) return all their data in one
+        response, parsed by a vectorized reader.
+
         Parameters
         ----------
-        pause: float
-            Time to pause between API requests to respect rate limits.
-        endpoint: str
-            API endpoint to target (e.g., '/timeseries/market-candles').
-        params: Dict[str, Union[str, int, float]]
-            Converted query parameters for the initial API request.
+        requests: List[Dict[str, Any]]
+            Converted query parameters for each initial API request, including the 'endpoint' key.
+        trials: int, default 3
+            Maximum number of attempts for each request.
+        pause: float, default 0.1
+            Time to pause between failed attempts.
+        on_page: Callable, optional, default None
+            Function called with the request index and the columns of each page as it arrives, e.g. to write
+            the page to disk. If provided, pages are not buffered.
 
         Returns
         -------
-        df: pd.DataFrame
-            DataFrame with all raw time series data combined.
+        List[ColumnBuffer]
+            Buffer of pages for each request, in request order. Empty if on_page is provided.
         """
-        url = self._config.get('base_url', '') + endpoint
-        all_data: List[Dict[str, Any]] = []
-        next_page_url: Optional[str] = url
+        base_url = self._config.get('base_url', '')
+        decoder = self._get_decoder()
+        all_data = [ColumnBuffer() for _ in requests]
+        n_records = 0
+
+        async def _get(url: str, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            try:
+                return await AsyncAPIRequester.get_request(
+                    url=url,
+                    params=params,
+                    trials=trials,
+                    pause=pause,
+                    vendor='coinmetrics',
+                    max_concurrency=self._config.get('max_concurrency', 4),
+                    rate_limiter=self._rate_limiter,
+                    columns_key='data',
+                    decoder=decoder
+                )
+            except Exception as e:
+                logger.error(f"Unexpected error during API call to {url}: {e}")
+                return None
+
+        async def _follow_chain(i: int, request: Dict[str, Any], pbar: tqdm) -> None:
+            nonlocal n_records
 
-        # initial request uses params, subsequent requests use the next_page_url
-        current_params = params
+            # initial requests use params, subsequent requests use the next_page_url
+            url = base_url + request['endpoint']
+            next_page = asyncio.ensure_future(_get(url, {k: v for k, v in request.items() if k != 'endpoint'}))
+            try:
+                while next_page is not None:
+                    data_resp = await next_page
+                    next_page = None
+
+                    # check if data_resp is None (indicating a permanent failure)
+                    if data_resp is None:
+                        logger.error(f"API request failed permanently for {url} "
+                                     f"(Likely 401/403/404 after retries). Stopping pagination.")
+                        break
+
+                    # request the next page before handling this one
+                    # params are part of the next_page_url, so None is passed to avoid re-adding them
+                    url = data_resp.get('next_page_url')
+                    if url:
+                        next_page = asyncio.ensure_future(_get(url, None))
+
+                    # the response structure needs to be checked against CoinMetrics format
+                    if data_resp.get('data'):
+                        n_records += self._count_records(data_resp['data'])
+                        if on_page is not None:
+                            on_page(i, data_resp['data'])
+                        else:
+                            all_data[i].append(data_resp['data'])
+
+                    # update progress bar with the page and number of records
+                    pbar.update(1)
+                    pbar.set_postfix_str(f"Records: {n_records:,}")
+            finally:
+                if next_page is not None:
+                    next_page.cancel()
 
         # Use tqdm to show progress (indeterminate/iterator mode)
         with tqdm(unit='page', desc='Fetching data pages from CoinMetrics') as pbar:
-            while next_page_url:
-                if all_data:  # Only pause after the first request
-                    sleep(pause)
+            await asyncio.gather(*(_follow_chain(i, request, pbar) for i, request in enumerate(requests)))
 
-                try:
-                    # use the next_page_url if available, otherwise use the base URL + params
-                    request_url = next_page_url if next_page_url != url else url
+        return all_data
 
-                    # if using the initial URL, pass params. Otherwise, params are included in next_page_url
-                    if next_page_url == url:
-                        data_resp = APIRequester.get_request(url=request_url, params=current_params)
-                    else:
-                        # when using the next_page_url, the params are usually part of the URL itself
-                        # We pass None for params to avoid re-adding them.
-                        data_resp = APIRequester.get_request(url=request_url, params=None)
+    def _get_decoder(self) -> Optional[Callable[[bytes], Dict[str, Any]]]:
+        """
+        Gets the decoder of the configured response format, or None for paginated JSON.
+        """
+        return STREAM_DECODERS.get(self._config.get('response_format', 'json'))
 
-                except Exception as e:
-                    logger.error(f"API request failed for {request_url}: {e}")
-                    # return partial data if failure occurs during pagination
-                    break
+    @staticmethod
+    def _count_records(data: Union[Dict[str, List[Any]], pa.Table]) -> int:
+        """
+        Returns the number of records in a page of columns.
+        """
+        if isinstance(data, pa.Table):
+            return data.num_rows
 
-                # check if data_resp is None (indicating a permanent failure)
-                if data_resp is None:
-                    logger.error(f"API request failed permanently for {request_url} "
-                                 f"(Likely 401/403/404 after retries). Stopping pagination.")
-                    break
+        return len(next(iter(data.values()))) if data else 0
 
-                # the response structure needs to be checked against CoinMetrics format
-                page_data = data_resp.get('data', [])
-                next_page_url = data_resp.get('next_page_url')
+    @staticmethod
+    def _get_time_windows(start_time: Optional[str],
+                          end_time: Optional[str],
+                          n_windows: int) -> List[Tuple[str, Optional[str]]]:
+        """
+        Splits a date range into consecutive time windows of equal length, aligned to the hour.
 
-                if not page_data and not next_page_url and not all_data:
-                    raise Exception("No data returned from CoinMetrics API for the given request parameters.")
+        Parameters
+        ----------
+        start_time: str, optional
+            Start time of the request in UTC, e.g. '2020-01-01' or '2020-01-01T00:00:00Z'. Defaults to 2009-01-01.
+        end_time: str, optional
+            End time of the request in UTC. Defaults to now.
+        n_windows: int
+            Number of windows.
 
-                all_data.extend(page_data)
+        Returns
+        -------
+        List[Tuple[str, Optional[str]]]
+            List of (start_time, end_time) tuples. The last window keeps the request's end time.
+        """
+        def _to_utc_naive(time: Union[str, pd.Timestamp]) -> pd.Timestamp:
+            # bounds may be naive or tz-aware, e.g. '2020-01-01' and '2020-01-01T00:00:00Z'
+            time = pd.Timestamp(time)
+            return time.tz_convert('UTC').tz_localize(None) if time.tzinfo is not None else time
+
+        start = _to_utc_naive(start_time or '2009-01-01')
+        end = _to_utc_naive(end_time if end_time else pd.Timestamp.now(tz='UTC'))
+
+        bounds = pd.date_range(start, end, periods=n_windows + 1).floor('h').unique()
+        bounds = [start] + [bound for bound in bounds[1:-1] if start < bound < end]
+        fmt = '%Y-%m-%dT%H:%M:%SZ'
+
+        return [
+            (bound.strftime(fmt), bounds[i + 1].strftime(fmt) if i + 1 < len(bounds) else end_time)
+            for i, bound in enumerate(bounds)
+        ]
+
+    def _partition_requests(self,
+                            requests: List[Dict[str, Any]],
+                            time_partitions: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        Splits requests into partitions by time window and/or by list of markets, assets or indexes, so their
+        page chains can be followed concurrently.
 
-                # update progress bar with the number of records in this page
-                pbar.set_postfix_str(f"Records: {len(all_data):,}")
-                pbar.update(1)  # increment page count
+        Time windows don't overlap: every window but the last excludes its end time.
 
-        # convert to df
-        return pd.DataFrame(all_data)
+        Parameters
+        ----------
+        requests: List[Dict[str, Any]]
+            Converted query parameters for each request, including the 'endpoint' key.
+        time_partitions: int, optional, default None
+            Number of time windows each request is split into. Defaults to the configured time_partitions.
+
+        Returns
+        -------
+        partitions: List[Dict[str, Any]]
+            Converted query parameters for each partition, in request, ticker and time order.
+        owners: List[int]
+            Index of the request each partition belongs to.
+        """
+        if time_partitions is None:
+            time_partitions = self._config.get('time_partitions')
+        n_windows = max(int(time_partitions or 1), 1)
+        max_tickers = self._config.get('max_tickers_per_partition')
+
+        partitions, owners = [], []
+        for i, request in enumerate(requests):
+            # ticker partitions
+            ticker_parts = [{}]
+            ticker_key = next((key for key in ['markets', 'assets', 'indexes'] if key in request), None)
+            if max_tickers and ticker_key:
+                tickers = request[ticker_key].split(',')
+                ticker_parts = [{ticker_key: ','.join(tickers[j: j + max_tickers])}
+                                for j in range(0, len(tickers), max_tickers)]
+
+            # time partitions
+            time_parts = [{}]
+            if n_windows > 1:
+                windows = self._get_time_windows(request.get('start_time'), request.get('end_time'), n_windows)
+                time_parts = [
+                    {'start_time': start, 'end_time': end, **({'end_inclusive': 'false'}
+                                                              if j < len(windows) - 1 else {})}
+                    for j, (start, end) in enumerate(windows)
+                ]
+
+            for ticker_part in ticker_parts:
+                for time_part in time_parts:
+                    partitions.append({**request, **ticker_part, **time_part})
+                    owners.append(i)
+
+        return partitions, owners
+
+    async def _fetch_all_partitions(self,
+                                    requests: List[Dict[str, Any]],
+                                    trials: int = 3,
+                                    pause: float = 0.1) -> List[ColumnBuffer]:
+        """
+        Fetches all pages for a list of requests, splitting each request into partitions whose page chains are
+        followed concurrently within the rate limit, then merging the pages of each request.
+
+        Parameters
+        ----------
+        requests: List[Dict[str, Any]]
+            Converted query parameters for each initial API request, including the 'endpoint' key.
+        trials: int, default 3
+            Maximum number of attempts for each request.
+        pause: float, default 0.1
+            Time to pause between failed attempts.
+
+        Returns
+        -------
+        List[ColumnBuffer]
+            Buffer of pages for each request, in request order.
+        """
+        partitions, owners = self._partition_requests(requests)
+        partition_data = await self._fetch_all_pages(requests=partitions, trials=trials, pause=pause)
+
+        all_data = [ColumnBuffer() for _ in requests]
+        for i, pages in zip(owners, partition_data):
+            all_data[i].extend(pages)
+
+        return all_data
 
     # --------------------------------------------------------------------------
     # --- 3. ETL Pipeline Contract Implementation (The Template Method Steps) ---
@@ -315,53 +573,45 @@ class CoinMetricsAdapter(BaseAPIAdapter):
         Dict[str, Any]
             Vendor-specific parameters for the API request, including the 'endpoint' key.
         """
-        # indexes
-        self.indexes = self.get_indexes_info(as_list=True)
-        index_fields = ['price_open', 'price_close', 'price_high', 'price_low', 'vwap', 'volume']
-        sleep(data_req.pause)
+        # initialize converter
+        converter = CoinMetricsParamConverter(data_req, response_format=self._config.get('response_format', 'json'))
 
-        # markets
+        # fetch only the catalogs the request needs, from the shared catalog cache
+        catalogs = converter.get_catalogs()
         exch = 'binance' if data_req.exch is None else data_req.exch.lower()
-        self.markets = self.get_markets_info(exchange=exch, as_list=True)
-        market_fields = ['price_open', 'price_close', 'price_high', 'price_low', 'vwap', 'volume',
-                      'candle_usd_volume', 'candle_trades_count']
-        sleep(data_req.pause)
-
-        # assets
-        self.assets = self.get_assets_info(as_list=True)
-        asset_fields = self.get_available_fields(as_list=True)
-        sleep(data_req.pause)
-
-        # oi fields
-        oi_fields = ['contract_count']
-
-        # funding rate fields
-        fr_fields = ['rate']
-
-        # trades fields
-        trades_fields = ['price', 'amount', 'side']
-
-        # quotes fields
-        quotes_fields = ['bid_price', 'ask_price', 'bid_size', 'ask_size']
-
-        # initialize converter
-        converter = CoinMetricsParamConverter(data_req)
+        if 'indexes' in catalogs:
+            self.indexes = self._get_catalog('indexes')
+        if 'markets' in catalogs:
+            self.markets = self._get_catalog('markets', exchange=exch)
+        if 'assets' in catalogs:
+            self.assets = self._get_catalog('assets')
+        asset_fields = self._get_catalog('asset_fields') if 'asset_fields' in catalogs else None
 
         # convert parameters based on data type
-        vendor_params = converter.convert(self.indexes, index_fields, self.markets, market_fields,
-                                          self.assets, asset_fields, oi_fields, fr_fields,
-                                          trades_fields, quotes_fields)
+        vendor_params = converter.convert(
+            index_tickers=self.indexes if 'indexes' in catalogs else None,
+            index_fields=COINMETRICS_FIELDS['index'],
+            market_tickers=self.markets if 'markets' in catalogs else None,
+            market_fields=COINMETRICS_FIELDS['ohlcv'],
+            asset_tickers=self.assets if 'assets' in catalogs else None,
+            asset_fields=asset_fields,
+            oi_fields=COINMETRICS_FIELDS['open_interest'],
+            rate_fields=COINMETRICS_FIELDS['funding_rates'],
+            trade_fields=COINMETRICS_FIELDS['trades'],
+            quote_fields=COINMETRICS_FIELDS['quotes']
+        )
 
         return vendor_params
 
     def _fetch_raw_data(self, data_req: DataRequest, vendor_params: Dict[str, Any]) -> pd.DataFrame:
         """
         EXTRACT: Submits the vendor-specific parameters to the API and returns the raw response.
+        Requests for each endpoint, and their time and ticker partitions if configured, are paginated concurrently.
 
         Parameters
         ----------
         data_req : DataRequest
-            The standardized data request object (needed for 'pause' value).
+            The standardized data request object (needed for 'trials' and 'pause' values).
         vendor_params : Dict[str, Any]
             Vendor-specific parameters, *including* the 'endpoint' key retrieved from the conversion step.
 
@@ -370,26 +620,25 @@ class CoinMetricsAdapter(BaseAPIAdapter):
         pd.DataFrame
             Raw data response from CoinMetrics API.
         """
-        raw_data = pd.DataFrame()
         requests = vendor_params['requests']
 
-        for request in requests:
-
-            endpoint = request.pop('endpoint')
+        all_data = AsyncAPIRequester.run(
+            self._fetch_all_partitions(requests=requests, trials=data_req.trials, pause=data_req.pause)
+        )
 
-            try:
-                data_resp = self._fetch_all_raw_data(
-                    pause=data_req.pause,
-                    endpoint=endpoint,
-                    params=request  # Only the URL parameters remain
-                )
-            except Exception as e:
-                logger.error(f"Error fetching data from endpoint {endpoint}: {e}")
+        # pages of all endpoints are concatenated once
+        raw_data = ColumnBuffer()
+        for request, pages in zip(requests, all_data):
+            if not pages:
+                logger.error(f"Error fetching data from endpoint {request['endpoint']}: "
+                             f"No data returned from CoinMetrics API for the given request parameters.")
                 continue
+            raw_data.extend(pages)
 
-            raw_data = pd.concat([raw_data, data_resp], ignore_index=True)
+        if not raw_data:
+            return pd.DataFrame()
 
-        return raw_data
+        return raw_data.to_frame()
 
     def _transform_raw_response(self, data_req: DataRequest, raw_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -417,6 +666,38 @@ class CoinMetricsAdapter(BaseAPIAdapter):
 
         return tidy_data
 
+    @staticmethod
+    def _write_tick_page(writer: PartitionedWriter, data: Union[Dict[str, List[Any]], pa.Table]) -> None:
+        """
+        Converts a page of market trades or quotes to the writer's schema and writes it, by market.
+
+        Parameters
+        ----------
+        writer: PartitionedWriter
+            Writer of the partitioned dataset.
+        data: Union[Dict[str, List[Any]], pa.Table]
+            Page of columns, including the market and time columns.
+        """
+        df = data.to_pandas() if isinstance(data, pa.Table) else pd.DataFrame(data)
+        if df.empty:
+            return
+
+        # convert columns to the schema types
+        times = pd.to_datetime(df['time'], utc=True, format='ISO8601').dt.tz_convert(None)
+        columns = {'time': times.to_numpy(dtype='datetime64[us]')}
+        for field in writer.schema:
+            if field.name == 'time':
+                continue
+            if field.name not in df.columns:
+                columns[field.name] = np.full(len(df), None, dtype=object)
+            elif pa.types.is_floating(field.type):
+                columns[field.name] = pd.to_numeric(df[field.name], errors='coerce').to_numpy(dtype=np.float64)
+            else:
+                columns[field.name] = np.where(df[field.name].isna(), None, df[field.name].astype(str))
+
+        for market, idx in df.groupby('market', sort=False).indices.items():
+            writer.write(market, {name: values[idx] for name, values in columns.items()})
+
     # ----------------------------------------------------------------------
     # --- 4. Public Interface (The Template Method) ---
     # ----------------------------------------------------------------------
@@ -446,3 +727,65 @@ class CoinMetricsAdapter(BaseAPIAdapter):
         tidy_data = self._transform_raw_response(data_req, raw_data)
 
         return tidy_data
+
+    def get_tick_data(self,
+                      data_req: DataRequest,
+                      path: str,
+                      file_format: str = 'parquet',
+                      chunk_rows: int = 1_000_000) -> ds.Dataset:
+        """
+        Gets market trades or quotes specified by data request, spilling them to partitioned columnar files on disk.
+
+        Pages are written as they arrive, partitioned by market and day, so histories much larger than memory can
+        be downloaded. Tick data is not resampled or wrangled into a tidy DataFrame. Each market is paginated in
+        its own concurrent page chain, paged from the start time. Time partitions are not used, so the pages of
+        each market arrive in ascending time order, as the writer expects.
+
+        Parameters
+        ----------
+        data_req : DataRequest
+            The standardized data request object, with trades fields (e.g. 'price', 'amount', 'side') and
+            freq='tick', or quotes fields (e.g. 'bid_price', 'ask_price').
+        path : str
+            Root directory of the dataset. Market and day partitions already in the path are replaced when they
+            are written again, so re-running a download doesn't duplicate rows. Other partitions are kept.
+        file_format : str, {'parquet', 'ipc'}, default 'parquet'
+            Format of the files.
+        chunk_rows : int, default 1,000,000
+            Maximum number of rows buffered per market and day before they are written to a file.
+
+        Returns
+        -------
+        ds.Dataset
+            Lazy handle to the trades or quotes, with TRADES_SCHEMA or QUOTES_SCHEMA columns and ticker (market)
+            and date partition columns.
+        """
+        # convert parameters, keeping trades and quotes requests
+        vendor_params = self._convert_params_to_vendor(data_req)
+        endpoints = {self.ENDPOINT_MAP['trades']: TRADES_SCHEMA, self.ENDPOINT_MAP['quotes']: QUOTES_SCHEMA}
+        requests = [request for request in vendor_params['requests'] if request['endpoint'] in endpoints]
+        if not requests:
+            raise ValueError("No trades or quotes found for the data request. Check the markets, fields and "
+                             "frequency and try again.")
+        if len(requests) > 1:
+            raise ValueError("Trades and quotes are stored in separate datasets. Request trades or quotes fields "
+                             "and try again.")
+
+        # one page chain per market, paged from the start and with no time windows, so the pages of each market
+        # arrive in ascending time order and the writer can flush finished days (the API pages from the end)
+        request = requests[0]
+        partitions, _ = self._partition_requests(
+            [{**request, 'markets': market, 'paging_from': 'start'} for market in request['markets'].split(',')],
+            time_partitions=1
+        )
+
+        with PartitionedWriter(path, endpoints[request['endpoint']], time_col='time', file_format=file_format,
+                               chunk_rows=chunk_rows) as writer:
+            AsyncAPIRequester.run(
+                self._fetch_all_pages(requests=partitions,
+                                      trials=data_req.trials,
+                                      pause=data_req.pause,
+                                      on_page=lambda i, data: self._write_tick_page(writer, data))
+            )
+
+        return writer.dataset()
@@ -1,15 +1,14 @@
 from typing import Dict, Optional, Union, Any, List
 import pandas as pd
 import numpy as np
-import time
 import logging
-from tqdm import tqdm
 
 from cryptodatapy.extract.adapters.base_adapter import BaseAPIAdapter
 from cryptodatapy.util.datacredentials import DataCredentials
 from cryptodatapy.core.data_request import DataRequest
 from cryptodatapy.extract.params.vendors.defillama_param_converter import DefiLlamaParamConverter
-from cryptodatapy.util.api_requester import APIRequester
+from cryptodatapy.util.api_requester import APIRequester, AsyncAPIRequester
+from cryptodatapy.util.rate_limiter import rate_limiters
 from cryptodatapy.transform.wranglers.defillama_wrangler import DefiLlamaWrangler
 
 # Set up logging for clarity
@@ -40,7 +39,9 @@ class DefiLlamaAdapter(BaseAPIAdapter):
             'api_key': data_cred.defillama_api_key,
             'base_url': data_cred.defillama_base_url,
             'api_endpoints': data_cred.defillama_endpoints,
-            'rate_limit_rpm': 10  # Default RPM setting
+            'rate_limit_rpm': 10,  # Default RPM setting
+            'rate_limit_burst': 1,  # Default number of back-to-back requests allowed
+            'max_concurrency': 5  # Default max number of requests in flight
         }
 
         # 2. Merge: User-provided config (if any) overrides the defaults.
@@ -53,6 +54,13 @@ class DefiLlamaAdapter(BaseAPIAdapter):
         # self._config is now set in the base class and contains the final, merged configuration.
         # You can remove the redundant line `self._config = final_config` if the base class handles it.
 
+        # 4. Shared token-bucket rate limiter, paces every DefiLlama request in the process
+        self._rate_limiter = rate_limiters.configure(
+            'defillama',
+            rate=self._config['rate_limit_rpm'] / 60,
+            burst=self._config['rate_limit_burst']
+        )
+
         self.assets = None
         self.fields = None
         self.stablecoins = None
@@ -88,7 +96,9 @@ class DefiLlamaAdapter(BaseAPIAdapter):
                 raise ValueError(f"Unknown DefiLlama info_type: {info_type}")
             url = self._base_url + endpoint
 
-        raw_data = APIRequester.get_request(url=url, params={'api_key': self._api_key})
+        raw_data = APIRequester.get_request(
+            url=url, params={'api_key': self._api_key}, rate_limiter=self._rate_limiter
+        )
 
         return raw_data
 
@@ -593,7 +603,9 @@ class DefiLlamaAdapter(BaseAPIAdapter):
             return None
         else:
             try:
-                raw_data = APIRequester.get_request(url=url, params={'api_key': self._api_key})
+                raw_data = APIRequester.get_request(
+                    url=url, params={'api_key': self._api_key}, rate_limiter=self._rate_limiter
+                )
                 return raw_data
             except Exception as e:
                 logging.error(f"Error fetching rate limit info: {e}")
@@ -639,7 +651,7 @@ class DefiLlamaAdapter(BaseAPIAdapter):
 
     def _fetch_all_raw_data(self, requests_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Fetches raw data for all requests in the list, implementing rate limiting.
+        Fetches raw data for all requests in the list concurrently, implementing rate limiting.
 
         Parameters
         ----------
@@ -654,78 +666,50 @@ class DefiLlamaAdapter(BaseAPIAdapter):
         all_data = []
         num_requests = len(requests_list)
 
-        # calculate the required delay between requests based on the rate limit (RPS)
+        # requests are paced by the shared rate limiter (RPM)
         rate_limit_rpm = self._config.get('rate_limit_rpm', 10)
-        min_delay_seconds = 60 / rate_limit_rpm
-
-        backoff_delay = 0.0  # Exponential backoff factor
+        max_concurrency = self._config.get('max_concurrency', 5)
 
         logger.info(f"Starting batch fetch of {num_requests} requests.")
 
-        # Wrap the iterable with tqdm for progress visualization
-        pbar_desc = f"Fetching DefiLlama Data (Delay: {min_delay_seconds:.2f}s)"
-
-        for i, request_dict in enumerate(tqdm(requests_list, desc=pbar_desc, unit="req", position=0, leave=True)):
-            start_time = time.time()
+        # url and params
+        http_requests = []
+        for request_dict in requests_list:
+            url, params = self._build_single_request_params(request_dict)
+            http_requests.append({'url': url, 'params': params})
+
+        # fetch data
+        data_resps = AsyncAPIRequester.run(
+            AsyncAPIRequester.get_many(
+                http_requests,
+                vendor='defillama',
+                max_concurrency=max_concurrency,
+                rate_limiter=self._rate_limiter,
+                desc=f"Fetching DefiLlama Data ({rate_limit_rpm} RPM)"
+            )
+        )
 
+        # process raw data
+        for request_dict, http_request, data_resp in zip(requests_list, http_requests, data_resps):
             ticker = request_dict.get('ticker')
             field = request_dict.get('field')
 
-            # url and params
-            url, params = self._build_single_request_params(request_dict)
-
-            # fetch data
-            data_resp = None
-            try:
-                logger.debug(f"[{i + 1}/{num_requests}] Fetching {ticker}/{field} from: {url}")
-                # APIRequester should handle retries and return None on final failure
-                data_resp = APIRequester.get_request(url=url, params=params)
-
-            except Exception as e:
-                # Catch unexpected exceptions during the request process
-                logger.error(f"FATAL REQUEST ERROR for {ticker}/{field} (URL: {url}): {type(e).__name__} - {e}")
-                # Continue to the next iteration as raw_data is None
-
-            # process raw data
             if data_resp is None:
-                # apply additional backoff to increase the inter-request delay
-                backoff_delay = min(backoff_delay * 2 + 1, 30)  # Increase backoff, limit to 30s
-
-                logger.warning(
-                    f"Request failed or returned None for {ticker}/{field}. "
-                    f"Applying additional backoff of {backoff_delay:.2f}s before next request. URL: {url}"
-                )
+                logger.warning(f"Request failed or returned None for {ticker}/{field}. URL: {http_request['url']}")
                 continue
 
-            else:
-                # if request succeeded, gradually reduce backoff delay
-                if backoff_delay > 0:
-                    backoff_delay = max(0, backoff_delay - 1)
-
-                # attach metadata to the data response
-                raw_data = {
-                    'metadata': {
-                        'ticker': ticker,
-                        'field': field,
-                        'type': request_dict.get('type'),
-                        'category': request_dict.get('category')
-                    },
-                    'data': data_resp
-                }
-
-                all_data.append(raw_data)
-
-            # implement rate limiting delay
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-
-            total_required_sleep = min_delay_seconds + backoff_delay
-            sleep_duration = total_required_sleep - elapsed_time
-
-            if sleep_duration > 0 and i < num_requests - 1:  # Don't sleep after the last request
-                logger.debug(f"Sleeping for {sleep_duration:.2f}s "
-                             f"(Base: {min_delay_seconds:.2f}s + Backoff: {backoff_delay:.2f}s)")
-                time.sleep(sleep_duration)
+            # attach metadata to the data response
+            raw_data = {
+                'metadata': {
+                    'ticker': ticker,
+                    'field': field,
+                    'type': request_dict.get('type'),
+                    'category': request_dict.get('category')
+                },
+                'data': data_resp
+            }
+
+            all_data.append(raw_data)
 
         return all_data
 
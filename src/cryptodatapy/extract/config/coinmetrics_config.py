@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 # Mapping of data type to CoinMetrics API endpoint
@@ -10,4 +10,32 @@ COINMETRICS_ENDPOINTS: Dict[str, str] = {
     'funding_rates': '/timeseries/market-funding-rates',
     'trades': '/timeseries/market-trades',
     'quotes': '/timeseries/market-quotes',
-}
\ No newline at end of file
+}
+
+# Mapping of metadata type to CoinMetrics API endpoint
+COINMETRICS_META_ENDPOINTS: Dict[str, str] = {
+    'reference_data_exchanges': '/reference-data/exchanges',
+    'reference_data_indexes': '/reference-data/indexes',
+    'reference_data_assets': '/reference-data/assets',
+    'reference_data_markets': '/reference-data/markets',
+    'reference_data_asset_metrics': '/reference-data/asset-metrics',
+    'catalog_asset_metrics_v2': '/catalog-v2/asset-metrics',
+}
+
+# Documented CoinMetrics API rate limits, used to seed the shared token-bucket rate limiter.
+# Community API: 10 requests per 6 seconds per IP. Pro API: 6000 requests per 20 seconds per key.
+COINMETRICS_RATE_LIMITS: Dict[str, Dict[str, Any]] = {
+    'community': {'rate_limit_rpm': 100, 'rate_limit_burst': 10},
+    'pro': {'rate_limit_rpm': 18000, 'rate_limit_burst': 6000},
+}
+
+# CoinMetrics fields, by data type. Asset metrics are not listed, they are looked up in the asset metrics catalog.
+COINMETRICS_FIELDS: Dict[str, List[str]] = {
+    'index': ['price_open', 'price_close', 'price_high', 'price_low', 'vwap', 'volume'],
+    'ohlcv': ['price_open', 'price_close', 'price_high', 'price_low', 'vwap', 'volume',
+              'candle_usd_volume', 'candle_trades_count'],
+    'open_interest': ['contract_count'],
+    'funding_rates': ['rate'],
+    'trades': ['price', 'amount', 'side'],
+    'quotes': ['bid_price', 'ask_price', 'bid_size', 'ask_size'],
+}
@@ -9,7 +9,12 @@ from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData, WrangleInfo
+from cryptodatapy.extract.config.coinmetrics_config import COINMETRICS_RATE_LIMITS
+from cryptodatapy.util.column_buffer import ColumnBuffer
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.json_decoder import json_decoder
+from cryptodatapy.util.paginator import Paginator
+from cryptodatapy.util.rate_limiter import rate_limiters
 
 # data credentials
 data_cred = DataCredentials()
@@ -332,34 +337,39 @@ class CoinMetrics(DataVendor):
         # url
         url = self.base_url + data_type
 
-        # data request
-        self.data_resp = data_req.get_req(url=url, params=params)
+        # shared rate limiter, seeded from the documented rate limits
+        rate_limit = COINMETRICS_RATE_LIMITS['pro' if self.api_key else 'community']
+        rate_limiter = rate_limiters.get(
+            'coinmetrics', rate=rate_limit['rate_limit_rpm'] / 60, burst=rate_limit['rate_limit_burst']
+        )
 
-        # raise error if data is None
-        if self.data_resp is None:
-            raise Exception("Failed to fetch data after multiple attempts.")
-        # retrieve data
-        else:
-            # data
-            data, next_page_url = self.data_resp.get('data', []), self.data_resp.get('next_page_url')
+        def _fetch(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return data_req.get_req(url=request['url'], params=request['params'], rate_limiter=rate_limiter)
 
-            # while loop
-            while next_page_url:
-                # wait to avoid exceeding rate limit
-                sleep(data_req.pause)
+        def _next_request(request: Dict[str, Any], data_resp: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            # params are part of the next_page_url
+            next_page_url = data_resp.get('next_page_url')
+            return {'url': next_page_url, 'params': None} if next_page_url else None
 
-                # request next page
-                next_page_data_resp = data_req.get_req(url=next_page_url, params=None)
-                next_page_data, next_page_url = next_page_data_resp.get('data', []), next_page_data_resp.get(
-                    'next_page_url')
+        # data request, the next page is requested while the current page is packed into columns
+        paginator = Paginator(
+            fetch=_fetch,
+            first_request={'url': url, 'params': params},
+            next_request=_next_request,
+            parse=lambda data_resp: json_decoder.records_to_columns(data_resp.get('data', []))
+        )
+        pages = ColumnBuffer()
+        for columns in paginator:
+            pages.append(columns)
 
-                # add data to list
-                data.extend(next_page_data)
+        # raise error if data is None
+        if not pages:
+            raise Exception("Failed to fetch data after multiple attempts.")
 
-            # convert to df
-            df = pd.DataFrame(data)
+        # convert to df
+        df = pages.to_frame()
 
-            return df
+        return df
 
     def wrangle_data_resp(self, data_req: DataRequest, data_resp: pd.DataFrame()) -> pd.DataFrame():
         """
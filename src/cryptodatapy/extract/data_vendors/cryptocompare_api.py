@@ -1,5 +1,4 @@
 import logging
-from time import sleep
 from typing import Dict, Optional, Union, Any, List
 
 import pandas as pd
@@ -9,6 +8,8 @@ from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData, WrangleInfo
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.paginator import Paginator
+from cryptodatapy.util.rate_limiter import rate_limiters
 
 # data credentials
 data_cred = DataCredentials()
@@ -485,34 +486,42 @@ class CryptoCompare(DataVendor):
         # set params
         url, params = self.set_urls_params(data_req, data_type, ticker)
 
-        # create empty df
-        df = pd.DataFrame()
-        # while loop condition
-        missing_vals = True
-
-        # run a while loop until all data collected
-        while missing_vals:
-
-            # data req
-            self.data_resp = DataRequest().get_req(url=url, params=params)
-
-            # add data resp to df
-            if self.data_resp:
-                if data_type == 'indexes' or data_type == 'social':
-                    df1 = pd.DataFrame(self.data_resp['Data'])
-                else:
-                    df1 = pd.DataFrame(self.data_resp['Data']['Data'])
-                df = pd.concat([df, df1])  # add data to empty df
-
-                # check if all data has been extracted
-                if len(df1) < (self.max_obs_per_call - 1) or df1.time[0] <= self.data_req.source_start_date or \
-                        all(df1.drop(columns=['time']).iloc[0] == 0) or \
-                        all(df1.drop(columns=['time']).iloc[0].astype(str) == 'nan'):
-                    missing_vals = False
-                # reset end date and pause before calling API again
-                else:
-                    params['toTs'] = df1.time[0]
-                    sleep(self.data_req.pause)
+        # shared rate limiter, seeded from the pause between requests
+        rate_limiter = rate_limiters.get(
+            'cryptocompare', rate=1 / self.data_req.pause if self.data_req.pause else None
+        )
+
+        def _records(data_resp: Dict[str, Any]) -> List[Dict[str, Any]]:
+            if data_type == 'indexes' or data_type == 'social':
+                return data_resp['Data']
+            return data_resp['Data']['Data']
+
+        def _fetch(req_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return DataRequest().get_req(url=url, params=req_params, rate_limiter=rate_limiter)
+
+        def _next_request(req_params: Dict[str, Any], data_resp: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            records = _records(data_resp)
+            if not records:
+                return None
+            first_vals = [v for k, v in records[0].items() if k != 'time']
+            # check if all data has been extracted
+            if len(records) < (self.max_obs_per_call - 1) or records[0]['time'] <= self.data_req.source_start_date \
+                    or all(v == 0 for v in first_vals) or all(v is None or v != v for v in first_vals):
+                return None
+            # reset end date before calling API again
+            return {**req_params, 'toTs': records[0]['time']}
+
+        # walk back through the data history, requesting the next page while parsing the current one
+        paginator = Paginator(
+            fetch=_fetch,
+            first_request=params,
+            next_request=_next_request,
+            parse=lambda data_resp: pd.DataFrame(_records(data_resp))
+        )
+        dfs = paginator.collect()
+
+        # create df
+        df = pd.concat(dfs) if dfs else pd.DataFrame()
 
         return df
 
@@ -1,12 +1,12 @@
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
-from time import sleep
 
 import pandas as pd
-import requests
-import logging
 import pytz
 
+from cryptodatapy.util.api_requester import APIRequester
+from cryptodatapy.util.rate_limiter import TokenBucket
+
 
 class DataRequest:
     """
@@ -652,9 +652,13 @@ class DataRequest:
     def get_req(self,
                 url: str,
                 params: Dict[str, Union[str, int]],
-                headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                headers: Optional[Dict[str, str]] = None,
+                rate_limiter: Optional[TokenBucket] = None) -> Dict[str, Any]:
         """
-        Submits get request to API.
+        Submits get request to API through the shared keep-alive session pool. Metadata responses are
+        served from the shared response cache when it is enabled, and identical requests in flight at
+        the same time share one response. Requests are short-circuited while the vendor's circuit
+        breaker is open.
 
         Parameters
         ----------
@@ -664,74 +668,20 @@ class DataRequest:
             Dictionary containing parameter values for get request.
         headers: dict, optional, default None
             Dictionary containing headers for get request.
+        rate_limiter: TokenBucket, optional, default None
+            Vendor rate limiter. If provided, a token is taken before each attempt and its pace is
+            adjusted from the vendor's rate-limit response headers.
 
         Returns
         -------
         resp: dict
-            Data response in JSON format.
-        """
-        # set number of attempts
-        attempts, resp = 0, None
-
-        # run a while loop in case the attempt fails
-        while attempts < self.trials:
-
-            # get request
-            try:
-                resp = requests.get(url, params=params, headers=headers)
-                # check for status code
-                resp.raise_for_status()
-
-                return resp.json()
-
-            # handle HTTP errors
-            except requests.exceptions.HTTPError as http_err:
-                status_code = resp.status_code
-
-                # Tailored handling for different status codes
-                if status_code == 400:
-                    logging.warning(f"Bad Request (400): {resp.text}")
-                elif status_code == 401:
-                    logging.warning("Unauthorized (401): Check the authentication credentials.")
-                elif status_code == 403:
-                    logging.warning("Forbidden (403): You do not have permission to access this resource.")
-                elif status_code == 404:
-                    logging.warning("Not Found (404): The requested resource could not be found.")
-                elif status_code == 500:
-                    logging.error("Internal Server Error (500): The server encountered an error.")
-                elif status_code == 503:
-                    logging.error("Service Unavailable (503): The server is temporarily unavailable.")
-                else:
-                    logging.error(f"HTTP error occurred: {http_err} (Status Code: {status_code})")
-                    logging.error(f"Response Content: {resp.text}")
-
-                # Increment attempts and log warning
-                attempts += 1
-                logging.warning(f"Attempt #{attempts}: Failed to get data due to: {http_err}")
-                sleep(self.pause)  # Pause before retrying
-                if attempts == self.trials:
-                    logging.error("Max attempts reached. Unable to fetch data.")
-                    break
-
-            # handle non-HTTP exceptions (e.g., network issues)
-            except requests.exceptions.RequestException as req_err:
-                attempts += 1
-                logging.warning(f"Request error on attempt #{attempts}: {req_err}. "
-                                f"Retrying after {self.pause} seconds...")
-                sleep(self.pause)
-                if attempts == self.trials:
-                    logging.error("Max attempts reached. Unable to fetch data due to request errors.")
-                    break
-
-            # handle other exceptions
-            except Exception as e:
-                attempts += 1
-                logging.warning(f"An unexpected error occurred: {e}. "
-                                f"Retrying after {self.pause} seconds...")
-                sleep(self.pause)
-                if attempts == self.trials:
-                    logging.error("Max attempts reached. Unable to fetch data due to request errors.")
-                    break
-
-        # return None if the API call fails
-        return None
+            Data response in JSON format, or None if the request failed or the vendor's circuit is open.
+        """
+        return APIRequester.get_request(
+            url=url,
+            params=params,
+            headers=headers,
+            trials=self.trials,
+            pause=self.pause,
+            rate_limiter=rate_limiter
+        )
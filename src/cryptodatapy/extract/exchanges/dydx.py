@@ -11,6 +11,9 @@ from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.exchanges.exchange import Exchange
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
+from cryptodatapy.util.http_session import session_pool
+from cryptodatapy.util.paginator import Paginator
+from cryptodatapy.util.rate_limiter import rate_limiters
 
 
 class Dydx(Exchange):
@@ -94,6 +97,14 @@ class Dydx(Exchange):
         self.data_req = None
         self.data = pd.DataFrame()
 
+        # shared token-bucket rate limiter, seeded from the documented rate limits
+        rate_limit_info = self.get_rate_limit_info()
+        self._rate_limiter = rate_limiters.get(
+            'dydx',
+            rate=rate_limit_info['requests_per_minute'] / 60,
+            burst=rate_limit_info['requests_per_second']
+        )
+
     def get_assets_info(self) -> pd.DataFrame:
         """
         Gets info for available assets from dYdX.
@@ -104,7 +115,7 @@ class Dydx(Exchange):
             DataFrame with asset information.
         """
         url = f"{self.base_url}/perpetualMarkets"
-        response = requests.get(url)
+        response = session_pool.get(url)
         response.raise_for_status()
         
         markets_data = response.json()['markets']
@@ -143,7 +154,7 @@ class Dydx(Exchange):
             DataFrame with market information or list of ticker symbols.
         """
         url = f"{self.base_url}/perpetualMarkets"
-        response = requests.get(url)
+        response = session_pool.get(url)
         response.raise_for_status()
         
         markets_data = response.json()['markets']
@@ -257,6 +268,40 @@ class Dydx(Exchange):
             'base_url': self.base_url
         }
 
+    def _fetch_page(self, url: str, params: Dict[str, Any], trials: int = 3) -> Optional[Dict[str, Any]]:
+        """
+        Fetches a page of data from dYdX, retrying on timeouts.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url.
+        params: dict
+            Query parameters.
+        trials: int, default 3
+            Number of attempts if the request times out.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Data response in JSON format, or None if the request failed.
+        """
+        for attempt in range(trials):
+            try:
+                self._rate_limiter.acquire()
+                response = session_pool.get(url, params=params, timeout=(10.0, 30.0))
+                response.raise_for_status()
+                return response.json()
+
+            except requests.exceptions.Timeout:
+                logging.warning(f"Timeout fetching {url}, retrying...")
+                time.sleep(2.0)
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Failed to fetch {url}: {str(e)}")
+                return None
+
+        return None
+
     def _fetch_ohlcv(self) -> pd.DataFrame:
         """
         Fetches OHLCV data from dYdX for multiple markets with pagination support.
@@ -291,95 +336,68 @@ class Dydx(Exchange):
             logging.error(f"Could not parse date range: {e}")
             return pd.DataFrame()
 
+        def _next_request(params: Dict[str, Any], data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            page_records = data.get('candles')
+            # Check if we got fewer records than requested (end of data)
+            if not page_records or len(page_records) < 1000:
+                return None
+            # Early termination check - if oldest record is before start date
+            oldest_timestamp = pd.Timestamp(min(record['startedAt'] for record in page_records))
+            if oldest_timestamp.tz is None:
+                oldest_timestamp = oldest_timestamp.tz_localize('UTC')
+            if oldest_timestamp < start_dt:
+                return None
+            # Set next pagination point (oldest timestamp from current page minus 1 second)
+            return {**params, 'toISO': (oldest_timestamp - pd.Timedelta(seconds=1)).isoformat()}
+
+        def _parse(data: Dict[str, Any]) -> Optional[pd.DataFrame]:
+            # Validate API response
+            if 'candles' not in data or not data['candles']:
+                return None
+
+            # Convert timestamps efficiently
+            page_df = pd.DataFrame(data['candles'])
+            page_df['startedAt'] = pd.to_datetime(page_df['startedAt'])
+
+            # Ensure timezone consistency
+            if page_df['startedAt'].dt.tz is None:
+                page_df['startedAt'] = page_df['startedAt'].dt.tz_localize('UTC')
+
+            # Filter only records within date range
+            mask = (page_df['startedAt'] >= start_dt) & (page_df['startedAt'] <= end_dt)
+            return page_df[mask]
+
         all_records = []
-        
+
         for ticker in self.data_req.source_tickers:
             market_symbol = f"{ticker}-USD"
-            
-            # Initialize pagination variables
-            current_end_date = buffered_end_dt
-            ticker_records = []
-            page_count = 0
-            max_pages = 100  # Safety limit for longer date ranges
-            
-            while page_count < max_pages:
-                page_count += 1
-                url = f"{self.base_url}/candles/perpetualMarkets/{market_symbol}"
-                
-                params = {
+            url = f"{self.base_url}/candles/perpetualMarkets/{market_symbol}"
+
+            # walk back from the end date, requesting the next page while parsing the current one
+            paginator = Paginator(
+                fetch=lambda params, url=url: self._fetch_page(url, params),
+                first_request={
                     'resolution': self.data_req.source_freq,
                     'fromISO': self.data_req.source_start_date,
-                    'toISO': current_end_date.isoformat(),
+                    'toISO': buffered_end_dt.isoformat(),
                     'limit': 1000  # Maximum allowed by dYdX API
-                }
-                
-                try:
-                    response = requests.get(url, params=params, timeout=30)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Validate API response
-                    if 'candles' not in data or not data['candles']:
-                        break
-                    
-                    page_records = data['candles']
-                    
-                    # Convert timestamps efficiently
-                    page_df = pd.DataFrame(page_records)
-                    page_df['startedAt'] = pd.to_datetime(page_df['startedAt'])
-                    
-                    # Ensure timezone consistency
-                    if page_df['startedAt'].dt.tz is None:
-                        page_df['startedAt'] = page_df['startedAt'].dt.tz_localize('UTC')
-                    
-                    # Early termination check - if oldest record is before start date
-                    oldest_timestamp = page_df['startedAt'].min()
-                    if oldest_timestamp < start_dt:
-                        # Filter only records within date range before adding
-                        mask = (page_df['startedAt'] >= start_dt) & (page_df['startedAt'] <= end_dt)
-                        filtered_records = page_df[mask]
-                        
-                        if not filtered_records.empty:
-                            ticker_records.extend(filtered_records.to_dict('records'))
-                        
-                        break
-                    else:
-                        # All records on this page are within or after the date range
-                        mask = page_df['startedAt'] <= end_dt
-                        filtered_records = page_df[mask]
-                        
-                        if not filtered_records.empty:
-                            ticker_records.extend(filtered_records.to_dict('records'))
-                    
-                    # Check if we got fewer records than requested (end of data)
-                    if len(page_records) < 1000:
-                        break
-                    
-                    # Set next pagination point (oldest timestamp from current page minus 1 second)
-                    current_end_date = oldest_timestamp - pd.Timedelta(seconds=1)
-                    
-                    # Rate limiting
-                    time.sleep(1.0)
-                    
-                except requests.exceptions.Timeout:
-                    logging.warning(f"Timeout fetching OHLCV data for {market_symbol} on page {page_count}, retrying...")
-                    time.sleep(2.0)
-                    continue
-                except requests.exceptions.RequestException as e:
-                    logging.error(f"Failed to fetch OHLCV data for {market_symbol} on page {page_count}: {str(e)}")
-                    break
-                except Exception as e:
-                    logging.error(f"Error processing OHLCV data for {market_symbol} on page {page_count}: {str(e)}")
-                    break
-            
-            if ticker_records:
-                all_records.extend(ticker_records)
+                },
+                next_request=_next_request,
+                parse=_parse,
+                max_pages=100  # Safety limit for longer date ranges
+            )
+
+            try:
+                # collect the whole history before keeping it, a failed page raises instead of truncating it
+                all_records.extend([df for df in paginator if df is not None and not df.empty])
+            except Exception as e:
+                logging.error(f"Error processing OHLCV data for {market_symbol}: {str(e)}")
 
         if not all_records:
             return pd.DataFrame()
 
         # Create final DataFrame
-        final_df = pd.DataFrame(all_records)
+        final_df = pd.concat(all_records, ignore_index=True)
         final_df = final_df.sort_values(['ticker', 'startedAt']).reset_index(drop=True)
         
         return final_df
@@ -417,93 +435,65 @@ class Dydx(Exchange):
             logging.error(f"Could not parse date range: {e}")
             return pd.DataFrame()
 
+        def _next_request(params: Dict[str, Any], data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            page_records = data.get('historicalFunding')
+            # Check if we got fewer records than requested (end of data)
+            if not page_records or len(page_records) < 1000:
+                return None
+            oldest_timestamp = pd.Timestamp(min(record['effectiveAt'] for record in page_records))
+            if oldest_timestamp.tz is None:
+                oldest_timestamp = oldest_timestamp.tz_localize('UTC')
+            if oldest_timestamp < start_dt:
+                return None
+            # Set next pagination point
+            return {**params, 'effectiveBeforeOrAt': (oldest_timestamp - pd.Timedelta(microseconds=1)).isoformat()}
+
+        def _parse(data: Dict[str, Any]) -> Optional[pd.DataFrame]:
+            if 'historicalFunding' not in data or not data['historicalFunding']:
+                return None
+
+            # Convert timestamps
+            page_df = pd.DataFrame(data['historicalFunding'])
+            page_df['effectiveAt'] = pd.to_datetime(page_df['effectiveAt'])
+
+            if page_df['effectiveAt'].dt.tz is None:
+                page_df['effectiveAt'] = page_df['effectiveAt'].dt.tz_localize('UTC')
+
+            # Filter records within date range
+            mask = (page_df['effectiveAt'] >= start_dt) & (page_df['effectiveAt'] <= buffered_end_dt)
+            filtered_records = page_df[mask].copy()
+            filtered_records['rate'] = pd.to_numeric(filtered_records['rate'], errors='coerce')
+            return filtered_records
+
         all_records = []
-        
+
         for ticker in self.data_req.source_tickers:
             market_symbol = f"{ticker}-USD"
-            
-            # Initialize pagination variables
-            current_end_date = buffered_end_dt
-            ticker_records = []
-            page_count = 0
-            max_pages = 100
-            
-            while page_count < max_pages:
-                page_count += 1
-                url = f"{self.base_url}/historicalFunding/{market_symbol}"
-                
-                params = {
-                    'effectiveBeforeOrAt': current_end_date.isoformat(),
+            url = f"{self.base_url}/historicalFunding/{market_symbol}"
+
+            # walk back from the end date, requesting the next page while parsing the current one
+            paginator = Paginator(
+                fetch=lambda params, url=url: self._fetch_page(url, params),
+                first_request={
+                    'effectiveBeforeOrAt': buffered_end_dt.isoformat(),
                     'limit': 1000
-                }
-                
-                try:
-                    response = requests.get(url, params=params, timeout=30)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    if 'historicalFunding' not in data or not data['historicalFunding']:
-                        break
-                    
-                    page_records = data['historicalFunding']
-                    
-                    # Convert timestamps
-                    page_df = pd.DataFrame(page_records)
-                    page_df['effectiveAt'] = pd.to_datetime(page_df['effectiveAt'])
-                    
-                    if page_df['effectiveAt'].dt.tz is None:
-                        page_df['effectiveAt'] = page_df['effectiveAt'].dt.tz_localize('UTC')
-                    
-                    # Filter records within date range
-                    oldest_timestamp = page_df['effectiveAt'].min()
-                    if oldest_timestamp < start_dt:
-                        mask = (page_df['effectiveAt'] >= start_dt) & (page_df['effectiveAt'] <= buffered_end_dt)
-                        filtered_records = page_df[mask]
-                        
-                        if not filtered_records.empty:
-                            filtered_records = filtered_records.copy()
-                            filtered_records['rate'] = pd.to_numeric(filtered_records['rate'], errors='coerce')
-                            ticker_records.extend(filtered_records.to_dict('records'))
-                        
-                        break
-                    else:
-                        mask = page_df['effectiveAt'] <= buffered_end_dt
-                        filtered_records = page_df[mask]
-                        
-                        if not filtered_records.empty:
-                            filtered_records = filtered_records.copy()
-                            filtered_records['rate'] = pd.to_numeric(filtered_records['rate'], errors='coerce')
-                            ticker_records.extend(filtered_records.to_dict('records'))
-                    
-                    # Check if we got fewer records than requested (end of data)
-                    if len(page_records) < 1000:
-                        break
-                    
-                    # Set next pagination point
-                    current_end_date = oldest_timestamp - pd.Timedelta(microseconds=1)
-                    
-                    # Rate limiting
-                    time.sleep(1.0)
-                    
-                except requests.exceptions.Timeout:
-                    logging.warning(f"Timeout fetching funding rate data for {market_symbol}, retrying...")
-                    time.sleep(2.0)
-                    continue
-                except requests.exceptions.RequestException as e:
-                    logging.error(f"Failed to fetch funding rate data for {market_symbol}: {str(e)}")
-                    break
-                except Exception as e:
-                    logging.error(f"Error processing funding rate data for {market_symbol}: {str(e)}")
-                    break
-            
-            if ticker_records:
-                all_records.extend(ticker_records)
+                },
+                next_request=_next_request,
+                parse=_parse,
+                max_pages=100
+            )
+
+            try:
+                # collect the whole history before keeping it, a failed page raises instead of truncating it
+                all_records.extend([df for df in paginator if df is not None and not df.empty])
+            except Exception as e:
+                logging.error(f"Error processing funding rate data for {market_symbol}: {str(e)}")
 
         if not all_records:
             return pd.DataFrame()
 
         # Create final DataFrame
-        final_df = pd.DataFrame(all_records)
+        final_df = pd.concat(all_records, ignore_index=True)
         final_df = final_df.sort_values(['ticker', 'effectiveAt']).reset_index(drop=True)
         
         return final_df
@@ -533,7 +523,7 @@ class Dydx(Exchange):
             url = f"{self.base_url}/perpetualMarkets/{market_symbol}"
             
             try:
-                response = requests.get(url)
+                response = session_pool.get(url)
                 response.raise_for_status()
                 data = response.json()
 
@@ -1,11 +1,18 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+from copy import copy
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 import pandas as pd
 import asyncio
 import random
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from numbers import Integral
 from time import sleep
 import ccxt
-import ccxt.async_support as ccxt_async
+import pyarrow as pa
+import pyarrow.dataset as ds
 from tqdm.asyncio import tqdm
 
 from cryptodatapy.extract.datarequest import DataRequest
@@ -13,16 +20,41 @@ from cryptodatapy.extract.libraries.library import Library
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.exchange_pool import exchange_pool
+from cryptodatapy.util.markets_cache import markets_cache
+from cryptodatapy.util.partitioned_writer import PartitionedWriter
+from cryptodatapy.util.rate_limiter import TokenBucket, rate_limiters
+from cryptodatapy.util.timestamp_store import TimestampStore, timestamp_store as default_timestamp_store
 
 # data credentials
 data_cred = DataCredentials()
 
+# trades columns written to disk
+TRADES_SCHEMA = pa.schema([
+    ('timestamp', pa.timestamp('ms')),
+    ('id', pa.string()),
+    ('side', pa.string()),
+    ('price', pa.float64()),
+    ('amount', pa.float64()),
+    ('cost', pa.float64())
+])
+
 
 class CCXT(Library):
     """
     Retrieves data from CCXT API.
+
+    Exchange instances are shared through the process-wide exchange pool. Async exchange instances are
+    bound to the event loop they were created on, so they are looked up for the running loop and their
+    sessions stay open until the loop shuts down.
     """
 
+    _data_type_names = {
+        'ohlcv': 'OHLCV data',
+        'funding_rates': 'funding rates',
+        'open_interest': 'open interest'
+    }
+
     def __init__(
             self,
             categories: Union[str, List[str]] = "crypto",
@@ -39,7 +71,10 @@ class CCXT(Library):
             rate_limit: Optional[Any] = None,
             ip_ban_wait_time_s: float = 320.0,  # 5.3 minutes for IP ban
             recovery_base_delay_s: float = 2.0,  # base delay for exponential backoff
-            max_recovery_delay_s: float = 60.0  # max delay for exponential backoff
+            max_recovery_delay_s: float = 60.0,  # max delay for exponential backoff
+            max_concurrency: int = 32,  # max concurrent requests per exchange, async only
+            timestamp_store: Optional[TimestampStore] = None,
+            shard_ohlcv: bool = False
     ):
         """
         Constructor
@@ -80,22 +115,78 @@ class CCXT(Library):
             Base delay in seconds for exponential backoff strategy.
         max_recovery_delay_s: float, default 60.0
             Maximum delay in seconds for exponential backoff strategy.
+        max_concurrency: int, default 32
+            Maximum number of markets fetched concurrently by the async methods. The effective cap is
+            lowered for exchanges with a slower rate limit.
+        timestamp_store: TimestampStore, optional, default None
+            Store of the last timestamp retrieved for each market, used by incremental updates.
+            Defaults to the shared timestamp store.
+        shard_ohlcv: bool, default False
+            Splits a single market's OHLCV history into time windows fetched concurrently. Off by default,
+            since windows multiply the requests in flight to the exchange.
         """
         super().__init__(
             categories, exchanges, indexes, assets, markets, market_types,
             fields, frequencies, base_url, api_key, max_obs_per_call, rate_limit
         )
         self.exchange = None
+        self._pooled_exchange_async = (None, None)
         self.exchange_async = None
+        self._semaphore = None
         self.data_req = None
 
         self.ip_ban_wait_time_s = ip_ban_wait_time_s
         self.recovery_base_delay_s = recovery_base_delay_s
         self.max_recovery_delay_s = max_recovery_delay_s
+        self.max_concurrency = max_concurrency
+        self.timestamp_store = timestamp_store if timestamp_store is not None else default_timestamp_store
+        self.shard_ohlcv = shard_ohlcv
 
         self.data_resp = []
         self.data = pd.DataFrame()
 
+    @property
+    def exchange_async(self) -> Any:
+        """
+        Async exchange instance for the running event loop.
+
+        An instance set explicitly is used on any loop. Otherwise the pooled instance is only returned on the
+        event loop it was looked up on, since its session is bound to that loop.
+        """
+        if self._exchange_async is not None:
+            return self._exchange_async
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        loop_ref, exchange = self._pooled_exchange_async
+
+        return exchange if loop_ref is not None and loop_ref() is loop else None
+
+    @exchange_async.setter
+    def exchange_async(self, exchange: Any) -> None:
+        self._exchange_async = exchange
+
+    def _load_exchange_async(self, exch: str) -> Any:
+        """
+        Looks up the pooled async exchange instance for the running event loop, unless an instance is set.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+
+        Returns
+        -------
+        exchange: ccxt.async_support.Exchange
+            Async exchange instance.
+        """
+        if self.exchange_async is None:
+            self._pooled_exchange_async = (weakref.ref(asyncio.get_running_loop()), exchange_pool.get_async(exch))
+
+        return self.exchange_async
+
     def get_exchanges_info(self) -> List[str]:
         """
         Get exchanges info.
@@ -141,10 +232,10 @@ class CCXT(Library):
                     f"Use get_exchanges_info() to get a list of supported exchanges.")
             else:
                 if self.exchange is None:
-                    self.exchange = getattr(ccxt, exch)()
+                    self.exchange = exchange_pool.get(exch)
 
             # get assets on exchange and create df
-            self.exchange.load_markets()
+            markets_cache.load_markets(exch, self.exchange)
             self.assets = pd.DataFrame(self.exchange.currencies).T
             self.assets.index.name = "ticker"
 
@@ -189,10 +280,10 @@ class CCXT(Library):
                     f"Use get_exchanges_info() to get a list of supported exchanges.")
             else:
                 if self.exchange is None:
-                    self.exchange = getattr(ccxt, exch)()
+                    self.exchange = exchange_pool.get(exch)
 
             # get assets on exchange
-            self.markets = pd.DataFrame(self.exchange.load_markets()).T
+            self.markets = pd.DataFrame(markets_cache.load_markets(exch, self.exchange)).T
             self.markets.index.name = "ticker"
 
             # quote ccy
@@ -251,7 +342,7 @@ class CCXT(Library):
                     f"Use get_exchanges_info() to get a list of supported exchanges.")
             else:
                 if self.exchange is None:
-                    self.exchange = getattr(ccxt, exch)()
+                    self.exchange = exchange_pool.get(exch)
 
             # freq dict
             self.frequencies = self.exchange.timeframes
@@ -282,7 +373,7 @@ class CCXT(Library):
                     f"Use get_exchanges_info() to get a list of supported exchanges.")
             else:
                 if self.exchange is None:
-                    self.exchange = getattr(ccxt, exch)()
+                    self.exchange = exchange_pool.get(exch)
 
             self.rate_limit = {
                 "exchange rate limit":
@@ -307,10 +398,10 @@ class CCXT(Library):
                 f"{exch} is not a supported exchange. Use get_exchanges_info() to get a list of supported exchanges.")
         else:
             if self.exchange is None:
-                self.exchange = getattr(ccxt, exch)()
+                self.exchange = exchange_pool.get(exch)
 
-        # load markets
-        self.exchange.load_markets()
+        # load markets, from the snapshot cache if fresh
+        markets_cache.load_markets(exch, self.exchange)
 
         if self.exchanges is None:
             self.exchanges = self.get_exchanges_info()
@@ -327,6 +418,72 @@ class CCXT(Library):
         if self.rate_limit is None:
             self.rate_limit = self.exchange.rateLimit
 
+    @staticmethod
+    def _get_rate_limiter(exch: str, exchange: Any) -> TokenBucket:
+        """
+        Gets the shared rate limiter for an exchange.
+
+        The limiter is seeded from the exchange's rateLimit (milliseconds between requests) and shared by
+        every sync and async fetch loop targeting the exchange.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        exchange: ccxt.Exchange
+            Exchange instance.
+
+        Returns
+        -------
+        limiter: TokenBucket
+            Shared rate limiter for the exchange.
+        """
+        rate_limit_ms = getattr(exchange, 'rateLimit', None)
+        rate = 1000 / rate_limit_ms if isinstance(rate_limit_ms, (int, float)) and rate_limit_ms > 0 else None
+
+        return rate_limiters.get(f"ccxt:{exch}", rate=rate)
+
+    def _get_max_concurrency(self, exchange: Any) -> int:
+        """
+        Gets the maximum number of markets fetched concurrently from an exchange.
+
+        ccxt's built-in throttler spaces requests by the exchange's rateLimit, so more requests in flight
+        than can be sent during one round trip (~1s) only queue in the throttler. The cap is the number of
+        requests per second allowed by the rateLimit, bounded by max_concurrency.
+
+        Parameters
+        ----------
+        exchange: ccxt.Exchange
+            Exchange instance.
+
+        Returns
+        -------
+        max_concurrency: int
+            Maximum number of concurrent markets.
+        """
+        rate_limit_ms = getattr(exchange, 'rateLimit', None)
+        if not isinstance(rate_limit_ms, (int, float)) or rate_limit_ms <= 0:
+            return self.max_concurrency
+
+        return max(1, min(self.max_concurrency, ceil(1000 / rate_limit_ms)))
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Gets the semaphore capping the markets fetched concurrently from the exchange.
+
+        The semaphore set by aiter_data is shared by all its chunks, so the cap holds across chunks.
+        Otherwise, each fetch gets its own semaphore.
+
+        Returns
+        -------
+        semaphore: asyncio.Semaphore
+            Semaphore capping the markets in flight.
+        """
+        if self._semaphore is not None:
+            return self._semaphore
+
+        return asyncio.Semaphore(self._get_max_concurrency(self.exchange_async))
+
     # @staticmethod
     # def exponential_backoff_with_jitter(base_delay: float, max_delay: int, attempts: int) -> None:
     #     delay = min(max_delay, base_delay * (2 ** attempts))
@@ -527,8 +684,7 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._load_exchange_async(exch)
 
         # fetch data
         if self.exchange_async.has['fetchOHLCV']:
@@ -537,6 +693,7 @@ class CCXT(Library):
             while start_date < end_date and attempts < trials:
 
                 try:
+                    await self._get_rate_limiter(exch, self.exchange_async).acquire_async()
                     data = await self.exchange_async.fetch_ohlcv(
                         ticker,
                         freq,
@@ -568,12 +725,11 @@ class CCXT(Library):
                         # If the helper returns False, the error is terminal (ExchangeError, etc.)
                         break
 
-                await self.exchange_async.close()
-                return data_resp
+            return data_resp
 
-            else:
-                logging.warning(f"OHLCV data is not available for {self.exchange_async.id}.")
-                return None
+        else:
+            logging.warning(f"OHLCV data is not available for {self.exchange_async.id}.")
+            return None
 
     def _fetch_ohlcv(self,
                      ticker: str,
@@ -582,6 +738,7 @@ class CCXT(Library):
                      end_date: str,
                      exch: str,
                      trials: int = 3,
+                     exchange: Optional[Any] = None
                      ) -> Union[List, None]:
         """
         Fetches OHLCV data for a specific ticker.
@@ -600,6 +757,8 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
+        exchange: ccxt.Exchange, optional, default None
+            Exchange instance, e.g. a worker thread's own instance. Defaults to the pooled instance.
 
         Returns
         -------
@@ -610,17 +769,20 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+        if exchange is None:
+            if self.exchange is None:
+                self.exchange = exchange_pool.get(exch)
+            exchange = self.exchange
 
         # fetch data
-        if self.exchange.has['fetchOHLCV']:
+        if exchange.has['fetchOHLCV']:
 
             # while loop to fetch all data
             while start_date < end_date and attempts < trials:
 
                 try:
-                    data = self.exchange.fetch_ohlcv(
+                    self._get_rate_limiter(exch, exchange).acquire()
+                    data = exchange.fetch_ohlcv(
                         ticker,
                         freq,
                         since=start_date,
@@ -643,7 +805,7 @@ class CCXT(Library):
 
                     if attempts >= trials:
                         logging.warning(
-                            f"Failed to get OHLCV data from {self.exchange.id} "
+                            f"Failed to get OHLCV data from {exchange.id} "
                             f"for {ticker} after {trials} attempts."
                         )
                         break
@@ -656,9 +818,166 @@ class CCXT(Library):
             return data_resp
 
         else:
-            logging.warning(f"OHLCV data is not available for {self.exchange.id}.")
+            logging.warning(f"OHLCV data is not available for {exchange.id}.")
+            return None
+
+    def _get_ohlcv_shards(self, freq: str, start_date: int, end_date: int) -> List[Tuple[int, int]]:
+        """
+        Splits a date range into time windows of max_obs_per_call candles, aligned to the timeframe.
+
+        Parameters
+        ----------
+        freq: str
+            Frequency of data, e.g. '1m', '5m', '1h', '1d'.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+
+        Returns
+        -------
+        shards: list
+            List of (start, end) tuples in milliseconds. Consecutive windows don't overlap.
+        """
+        timeframe_ms = ccxt.Exchange.parse_timeframe(freq) * 1000
+        shard_ms = timeframe_ms * self.max_obs_per_call
+
+        shards = []
+        shard_start = start_date - start_date % timeframe_ms
+        while shard_start < end_date:
+            shards.append((max(shard_start, start_date), min(shard_start + shard_ms - 1, end_date)))
+            shard_start += shard_ms
+
+        return shards
+
+    @staticmethod
+    def _stitch_ohlcv(shards: List[Union[List, None]], start_date: int, end_date: int) -> Union[List, None]:
+        """
+        Stitches OHLCV shards in time order, dropping duplicate candles at the shard boundaries.
+
+        Parameters
+        ----------
+        shards: list
+            List of lists of timestamps with OHLCV data, in shard order.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+
+        Returns
+        -------
+        data_resp: list
+            List of timestamps with OHLCV data, or None if OHLCV data is not available.
+        """
+        if all(shard is None for shard in shards):
             return None
 
+        data_resp, last_ts = [], None
+        for shard in shards:
+            for candle in shard or []:
+                ts = candle[0]
+                if start_date <= ts <= end_date and (last_ts is None or ts > last_ts):
+                    data_resp.append(candle)
+                    last_ts = ts
+
+        return data_resp
+
+    async def _fetch_ohlcv_sharded_async(self,
+                                         ticker: str,
+                                         freq: str,
+                                         start_date: int,
+                                         end_date: int,
+                                         exch: str,
+                                         trials: int = 3,
+                                         ) -> Union[List, None]:
+        """
+        Fetches OHLCV data for a specific ticker, splitting the date range into time windows fetched concurrently.
+
+        Parameters
+        ----------
+        ticker: str
+            Ticker symbol.
+        freq: str
+            Frequency of data, e.g. '1m', '5m', '1h', '1d'.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        exch: str
+            Name of exchange.
+        trials: int, default 3
+            Number of attempts to fetch each window.
+
+        Returns
+        -------
+        data_resp: list
+            List of timestamps with OHLCV data.
+        """
+        # inst exch
+        self._load_exchange_async(exch)
+
+        # cap windows in flight
+        semaphore = self._get_semaphore()
+
+        async def _fetch(shard: Tuple[int, int]) -> Union[List, None]:
+            async with semaphore:
+                return await self._fetch_ohlcv_async(ticker, freq, shard[0], shard[1], trials=trials, exch=exch)
+
+        shards = await asyncio.gather(*(_fetch(shard) for shard in self._get_ohlcv_shards(freq, start_date,
+                                                                                           end_date)))
+
+        return self._stitch_ohlcv(shards, start_date, end_date)
+
+    def _fetch_ohlcv_sharded(self,
+                             ticker: str,
+                             freq: str,
+                             start_date: int,
+                             end_date: int,
+                             exch: str,
+                             trials: int = 3,
+                             ) -> Union[List, None]:
+        """
+        Fetches OHLCV data for a specific ticker, splitting the date range into time windows fetched concurrently.
+
+        Parameters
+        ----------
+        ticker: str
+            Ticker symbol.
+        freq: str
+            Frequency of data, e.g. '1m', '5m', '1h', '1d'.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        exch: str
+            Name of exchange.
+        trials: int, default 3
+            Number of attempts to fetch each window.
+
+        Returns
+        -------
+        data_resp: list
+            List of timestamps with OHLCV data.
+        """
+        # inst exch
+        if self.exchange is None:
+            self.exchange = exchange_pool.get(exch)
+
+        # sync instances aren't thread-safe, each worker fetches with its own instance
+        local = threading.local()
+
+        def _fetch(shard: Tuple[int, int]) -> Union[List, None]:
+            if getattr(local, 'exchange', None) is None:
+                local.exchange = exchange_pool.create(exch)
+            return self._fetch_ohlcv(ticker, freq, shard[0], shard[1], trials=trials, exch=exch,
+                                     exchange=local.exchange)
+
+        shards = self._get_ohlcv_shards(freq, start_date, end_date)
+        with ThreadPoolExecutor(max_workers=self._get_max_concurrency(self.exchange)) as executor:
+            shards = list(executor.map(_fetch, shards))
+
+        return self._stitch_ohlcv(shards, start_date, end_date)
+
     async def _fetch_all_ohlcv_async(self,
                                      tickers,
                                      freq: str,
@@ -666,11 +985,16 @@ class CCXT(Library):
                                      end_date: int,
                                      exch: str,
                                      trials: int = 3,
-                                     pause: int = 1
+                                     pause: int = 1,
+                                     start_dates: Optional[Dict[str, int]] = None
                                      ) -> Union[List, None]:
         """
         Fetches OHLCV data for a list of tickers.
 
+        Tickers are fetched concurrently, up to a cap derived from the exchange's rate limit,
+        and requests are paced by the shared exchange rate limiter and ccxt's throttler.
+        If shard_ohlcv is set, a single ticker's history is split into time windows fetched concurrently instead.
+
         Parameters
         ----------
         tickers: list
@@ -685,31 +1009,51 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: int, default 1
+            Not used, requests are paced by the shared exchange rate limiter. Kept for backward compatibility.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            start_date for incremental updates.
 
         Returns
         -------
         data_resp: list
-            List of lists of timestamps and OHLCV data for each ticker.
+            List of lists of timestamps and OHLCV data for each ticker, in ticker order.
         """
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._load_exchange_async(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching OHLCV data", unit="ticker")
 
-        # loop through tickers
-        for ticker in tickers:
-            data = await self._fetch_ohlcv_async(ticker, freq, start_date, end_date, trials=trials, exch=exch)
-            await asyncio.sleep(pause)
-            self.data_resp.append(data)
+        # single market, shard its history instead
+        if len(tickers) == 1 and self.shard_ohlcv:
+            try:
+                ticker_start = start_dates.get(tickers[0], start_date) if start_dates else start_date
+                data = await self._fetch_ohlcv_sharded_async(tickers[0], freq, ticker_start, end_date,
+                                                             trials=trials, exch=exch)
+                pbar.update(1)
+            finally:
+                pbar.close()
+            return [data]
+
+        # cap markets in flight
+        semaphore = self._get_semaphore()
+
+        async def _fetch(ticker: str) -> Union[List, None]:
+            ticker_start = start_dates.get(ticker, start_date) if start_dates else start_date
+            async with semaphore:
+                data = await self._fetch_ohlcv_async(ticker, freq, ticker_start, end_date, trials=trials, exch=exch)
             pbar.update(1)
+            return data
 
-        await self.exchange_async.close()
+        # fan out across tickers, results are returned in ticker order
+        try:
+            data_resp = await asyncio.gather(*(_fetch(ticker) for ticker in tickers))
+        finally:
+            pbar.close()
 
-        return self.data_resp
+        return list(data_resp)
 
     def _fetch_all_ohlcv(self,
                          tickers,
@@ -718,11 +1062,14 @@ class CCXT(Library):
                          end_date: int,
                          exch: str,
                          trials: int = 3,
-                         pause: int = 1
+                         pause: int = 1,
+                         start_dates: Optional[Dict[str, int]] = None
                          ) -> Union[List, None]:
         """
         Fetches OHLCV data for a list of tickers.
 
+        If shard_ohlcv is set, a single ticker's history is split into time windows fetched concurrently.
+
         Parameters
         ----------
         tickers: list
@@ -737,8 +1084,11 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: int, default 1
+            Not used, requests are paced by the shared exchange rate limiter. Kept for backward compatibility.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            start_date for incremental updates.
 
         Returns
         -------
@@ -747,17 +1097,29 @@ class CCXT(Library):
         """
         # inst exch
         if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+            self.exchange = exchange_pool.get(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching OHLCV data", unit="ticker")
 
-        # loop through tickers
-        for ticker in tickers:
-            data = self._fetch_ohlcv(ticker, freq, start_date, end_date, trials=trials, exch=exch)
-            sleep(pause)
-            self.data_resp.append(data)
-            pbar.update(1)
+        try:
+            # single market, shard its history instead
+            if len(tickers) == 1 and self.shard_ohlcv:
+                ticker_start = start_dates.get(tickers[0], start_date) if start_dates else start_date
+                data = self._fetch_ohlcv_sharded(tickers[0], freq, ticker_start, end_date, trials=trials,
+                                                 exch=exch)
+                self.data_resp.append(data)
+                pbar.update(1)
+                return self.data_resp
+
+            # loop through tickers
+            for ticker in tickers:
+                ticker_start = start_dates.get(ticker, start_date) if start_dates else start_date
+                data = self._fetch_ohlcv(ticker, freq, ticker_start, end_date, trials=trials, exch=exch)
+                self.data_resp.append(data)
+                pbar.update(1)
+        finally:
+            pbar.close()
 
         return self.data_resp
 
@@ -791,8 +1153,7 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._load_exchange_async(exch)
 
         # fetch data
         if self.exchange_async.has['fetchFundingRateHistory']:
@@ -801,6 +1162,7 @@ class CCXT(Library):
             while start_date < end_date and attempts < trials:
 
                 try:
+                    await self._get_rate_limiter(exch, self.exchange_async).acquire_async()
                     data = await self.exchange_async.fetch_funding_rate_history(
                         ticker,
                         since=start_date,
@@ -829,7 +1191,6 @@ class CCXT(Library):
                     if not await self._handle_exception_and_backoff_async(e, attempts):
                         break
 
-            await self.exchange_async.close()
             return data_resp
 
         else:
@@ -867,7 +1228,7 @@ class CCXT(Library):
 
         # inst exch
         if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+            self.exchange = exchange_pool.get(exch)
 
         # fetch data
         if self.exchange.has['fetchFundingRateHistory']:
@@ -876,6 +1237,7 @@ class CCXT(Library):
             while start_date < end_date and attempts < trials:
 
                 try:
+                    self._get_rate_limiter(exch, self.exchange).acquire()
                     data = self.exchange.fetch_funding_rate_history(
                         ticker,
                         since=start_date,
@@ -916,7 +1278,8 @@ class CCXT(Library):
                                              end_date: int,
                                              exch: str,
                                              trials: int = 3,
-                                             pause: int = 1
+                                             pause: int = 1,
+                                             start_dates: Optional[Dict[str, int]] = None
                                              ) -> Union[List, None]:
         """
         Fetches funding rates data for a list of tickers.
@@ -933,8 +1296,11 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: int, default 1
+            Not used, requests are paced by the shared exchange rate limiter. Kept for backward compatibility.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            start_date for incremental updates.
 
         Returns
         -------
@@ -942,22 +1308,25 @@ class CCXT(Library):
             List of lists of dictionaries with timestamps and funding rates data for each ticker.
         """
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._load_exchange_async(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching funding rates", unit="ticker")
 
+        # cap markets in flight
+        semaphore = self._get_semaphore()
+
         # loop through tickers
+        data_resp = []
         for ticker in tickers:
-            data = await self._fetch_funding_rates_async(ticker, start_date, end_date, trials=trials, exch=exch)
-            self.data_resp.append(data)
+            ticker_start = start_dates.get(ticker, start_date) if start_dates else start_date
+            async with semaphore:
+                data = await self._fetch_funding_rates_async(ticker, ticker_start, end_date, trials=trials,
+                                                             exch=exch)
+            data_resp.append(data)
             pbar.update(1)
-            await asyncio.sleep(pause)
-
-        await self.exchange_async.close()
 
-        return self.data_resp
+        return data_resp
 
     def _fetch_all_funding_rates(self,
                                  tickers,
@@ -965,7 +1334,8 @@ class CCXT(Library):
                                  end_date: int,
                                  exch: str,
                                  trials: int = 3,
-                                 pause: int = 1
+                                 pause: int = 1,
+                                 start_dates: Optional[Dict[str, int]] = None
                                  ) -> Union[List, None]:
         """
         Fetches funding rates data for a list of tickers.
@@ -982,8 +1352,11 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: int, default 1
+            Not used, requests are paced by the shared exchange rate limiter. Kept for backward compatibility.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            start_date for incremental updates.
 
         Returns
         -------
@@ -993,17 +1366,17 @@ class CCXT(Library):
 
         # inst exch
         if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+            self.exchange = exchange_pool.get(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching funding rates", unit="ticker")
 
         # loop through tickers
         for ticker in tickers:
-            data = self._fetch_funding_rates(ticker, start_date, end_date, trials=trials, exch=exch)
+            ticker_start = start_dates.get(ticker, start_date) if start_dates else start_date
+            data = self._fetch_funding_rates(ticker, ticker_start, end_date, trials=trials, exch=exch)
             self.data_resp.append(data)
             pbar.update(1)
-            sleep(pause)
 
         return self.data_resp
 
@@ -1047,8 +1420,7 @@ class CCXT(Library):
         SAFE_OI_RANGE_MS = 25 * 24 * 60 * 60 * 1000
 
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._load_exchange_async(exch)
 
         # --- Binance 30-day Limit Enforcement ---
         if exch.lower() == 'binanceusdm':  # Binance USDM Futures
@@ -1063,8 +1435,7 @@ class CCXT(Library):
                 start_date = new_start_date
 
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._load_exchange_async(exch)
 
         # fetch data
         if self.exchange_async.has['fetchOpenInterestHistory']:
@@ -1073,6 +1444,7 @@ class CCXT(Library):
             while start_date < end_date and attempts < trials:
 
                 try:
+                    await self._get_rate_limiter(exch, self.exchange_async).acquire_async()
                     data = await self.exchange_async.fetch_open_interest_history(
                         ticker,
                         freq,
@@ -1102,7 +1474,6 @@ class CCXT(Library):
                     if not await self._handle_exception_and_backoff_async(e, attempts):
                         break
 
-            await self.exchange_async.close()
             return data_resp
 
         else:
@@ -1149,8 +1520,8 @@ class CCXT(Library):
         SAFE_OI_RANGE_MS = 25 * 24 * 60 * 60 * 1000
 
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        if self.exchange is None:
+            self.exchange = exchange_pool.get(exch)
 
         # --- Binance 30-day Limit Enforcement ---
         if exch.lower() == 'binanceusdm':  # Binance USDM Futures
@@ -1171,6 +1542,7 @@ class CCXT(Library):
             while start_date < end_date and attempts < trials:
 
                 try:
+                    self._get_rate_limiter(exch, self.exchange).acquire()
                     data = self.exchange.fetch_open_interest_history(
                         ticker,
                         freq,
@@ -1213,7 +1585,8 @@ class CCXT(Library):
                                              end_date: int,
                                              exch: str,
                                              trials: int = 3,
-                                             pause: int = 1
+                                             pause: int = 1,
+                                             start_dates: Optional[Dict[str, int]] = None
                                              ) -> Union[List, None]:
         """
         Fetches open interest data for a list of tickers.
@@ -1232,8 +1605,11 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: int, default 1
+            Not used, requests are paced by the shared exchange rate limiter. Kept for backward compatibility.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            start_date for incremental updates.
 
         Returns
         -------
@@ -1241,22 +1617,25 @@ class CCXT(Library):
             List of lists of dictionaries with timestamps and open interest data for each ticker.
         """
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._load_exchange_async(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching open interest", unit="ticker")
 
+        # cap markets in flight
+        semaphore = self._get_semaphore()
+
         # loop through tickers
+        data_resp = []
         for ticker in tickers:
-            data = await self._fetch_open_interest_async(ticker, freq, start_date, end_date, trials=trials, exch=exch)
-            self.data_resp.extend(data)
+            ticker_start = start_dates.get(ticker, start_date) if start_dates else start_date
+            async with semaphore:
+                data = await self._fetch_open_interest_async(ticker, freq, ticker_start, end_date, trials=trials,
+                                                             exch=exch)
+            data_resp.extend(data or [])
             pbar.update(1)
-            await asyncio.sleep(pause)
-
-        await self.exchange_async.close()
 
-        return self.data_resp
+        return data_resp
 
     def _fetch_all_open_interest(self,
                                  tickers,
@@ -1265,7 +1644,8 @@ class CCXT(Library):
                                  end_date: int,
                                  exch: str,
                                  trials: int = 3,
-                                 pause: int = 1
+                                 pause: int = 1,
+                                 start_dates: Optional[Dict[str, int]] = None
                                  ) -> Union[List, None]:
         """
         Fetches open interest data for a list of tickers.
@@ -1284,8 +1664,11 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+        pause: int, default 1
+            Not used, requests are paced by the shared exchange rate limiter. Kept for backward compatibility.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            start_date for incremental updates.
 
         Returns
         -------
@@ -1294,73 +1677,421 @@ class CCXT(Library):
         """
         # inst exch
         if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+            self.exchange = exchange_pool.get(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching open interest", unit="ticker")
 
         # loop through tickers
         for ticker in tickers:
-            data = self._fetch_open_interest(ticker, freq, start_date, end_date, trials=trials, exch=exch)
+            ticker_start = start_dates.get(ticker, start_date) if start_dates else start_date
+            data = self._fetch_open_interest(ticker, freq, ticker_start, end_date, trials=trials, exch=exch)
             self.data_resp.extend(data)
             pbar.update(1)
-            sleep(pause)
 
         return self.data_resp
 
-    def convert_params(self, data_req: DataRequest) -> DataRequest:
+    @staticmethod
+    def _trades_to_columns(trades: List[Dict[str, Any]]) -> Dict[str, List]:
         """
-        Converts data request parameters to CCXT format.
+        Converts a page of ccxt trades to columns of the trades schema.
 
         Parameters
         ----------
-        data_req: DataRequest
-            Parameters of data request in CryptoDataPy format.
+        trades: list
+            List of dictionaries with trades data.
 
         Returns
         -------
-        data_req: DataRequest
-            Parameters of data request in CCXT format.
-        """
-        self.data_req = ConvertParams(data_req).to_ccxt()
+        columns: dict
+            Dictionary of column values, by column name.
+        """
+        return {
+            'timestamp': [trade['timestamp'] for trade in trades],
+            'id': [None if trade.get('id') is None else str(trade['id']) for trade in trades],
+            'side': [trade.get('side') for trade in trades],
+            'price': [trade.get('price') for trade in trades],
+            'amount': [trade.get('amount') for trade in trades],
+            'cost': [trade.get('cost') for trade in trades]
+        }
+
+    @staticmethod
+    def _next_trades_page(
+            trades: List[Dict[str, Any]],
+            since: int,
+            end_date: int,
+            seen_ids: set,
+            ticker: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int, set, bool]:
+        """
+        Filters a page of trades and gets the start of the next page.
+
+        Several trades can share a millisecond, so the next page starts at the last timestamp and trades
+        already written at that timestamp are dropped by id. If a full page holds only trades already written
+        at that timestamp, the rest of the millisecond can't be reached with since and is skipped, with a warning.
 
-        # get metadata
-        self.get_metadata(self.data_req.exch)
+        Parameters
+        ----------
+        trades: list
+            List of dictionaries with trades data, in time order.
+        since: int
+            Start date of the page in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        seen_ids: set
+            Ids of the trades already written at the since timestamp.
+        ticker: str, optional, default None
+            Ticker symbol, used in the warning for skipped trades.
 
-        # check markets
-        if not any([market in self.markets for market in self.data_req.source_markets]):
-            raise ValueError(
-                f"Selected markets are not available. Use the '.markets' attribute to check supported markets."
-            )
+        Returns
+        -------
+        page: list
+            New trades within the date range.
+        since: int
+            Start date of the next page.
+        seen_ids: set
+            Ids of the trades written at the next start date.
+        done: bool
+            True if the end date has been reached.
+        """
+        page = [trade for trade in trades if trade['timestamp'] <= end_date and
+                not (trade['timestamp'] == since and trade.get('id') in seen_ids)]
+        done = trades[-1]['timestamp'] >= end_date
+
+        if not page:
+            # page full of trades already written, move past the millisecond
+            if not done:
+                logging.warning(f"Page of trades for {ticker} is full of trades already written at {since}. "
+                                f"Remaining trades in that millisecond are skipped.")
+            return page, since + 1, set(), done
+
+        last_ts = page[-1]['timestamp']
+        last_ids = {trade.get('id') for trade in page if trade['timestamp'] == last_ts}
+        if last_ts == since:
+            last_ids |= seen_ids
+
+        return page, last_ts, last_ids, done
+
+    async def _fetch_trades_async(self,
+                                  ticker: str,
+                                  start_date: int,
+                                  end_date: int,
+                                  exch: str,
+                                  writer: PartitionedWriter,
+                                  trials: int = 3,
+                                  ) -> int:
+        """
+        Fetches trades for a specific ticker, writing each page to disk as it arrives.
 
-        # check freq
-        if self.data_req.source_freq not in self.frequencies:
-            raise ValueError(
-                f"{self.data_req.source_freq} frequency is not available. "
-                f"Use the '.frequencies' attribute to check available frequencies."
-            )
+        Parameters
+        ----------
+        ticker: str
+            Ticker symbol.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        exch: str
+            Name of exchange.
+        writer: PartitionedWriter
+            Writer the pages of trades are spilled to.
+        trials: int, default 3
+            Number of attempts to fetch data.
 
-        # check mkt type
-        if self.data_req.mkt_type not in self.market_types:
-            raise ValueError(
-                f"{self.data_req.mkt_type} is not available for {self.data_req.exch}."
-            )
+        Returns
+        -------
+        n_trades: int
+            Number of trades written.
+        """
+        attempts, n_trades, seen_ids = 0, 0, set()
 
-        # check start date
-        if not isinstance(self.data_req.source_start_date, int):
-            raise ValueError(
-                f"Start date must be in integers in milliseconds since Unix epoch."
-            )
+        # inst exch
+        self._load_exchange_async(exch)
 
-        # check end date
-        if not isinstance(self.data_req.source_end_date, int):
-            raise ValueError(
-                f"End date must be in integers in milliseconds since Unix epoch."
-            )
+        # fetch data
+        if self.exchange_async.has['fetchTrades']:
 
-        # check fields
-        if not any([field in self.fields for field in self.data_req.fields]):
-            raise ValueError(
+            # while loop to fetch all data
+            while start_date < end_date and attempts < trials:
+
+                try:
+                    await self._get_rate_limiter(exch, self.exchange_async).acquire_async()
+                    # no until, some exchanges cap the since/until window (e.g. Binance aggTrades to 1h),
+                    # trades past the end date are dropped by _next_trades_page
+                    data = await self.exchange_async.fetch_trades(
+                        ticker,
+                        since=start_date,
+                        limit=self.max_obs_per_call
+                    )
+                    if not data:
+                        break
+
+                    # write page to disk
+                    page, start_date, seen_ids, done = self._next_trades_page(data, start_date, end_date, seen_ids,
+                                                                              ticker=ticker)
+                    if page:
+                        writer.write(ticker, self._trades_to_columns(page))
+                        n_trades += len(page)
+                    if done:
+                        break
+
+                except Exception as e:
+                    attempts += 1
+
+                    if attempts >= trials:
+                        logging.warning(
+                            f"Failed to get trades from {self.exchange_async.id} "
+                            f"for {ticker} after {trials} attempts."
+                        )
+                        break
+
+                    # exception handling
+                    if not await self._handle_exception_and_backoff_async(e, attempts):
+                        break
+
+            return n_trades
+
+        else:
+            logging.warning(f"Trades are not available for {self.exchange_async.id}.")
+            return 0
+
+    def _fetch_trades(self,
+                      ticker: str,
+                      start_date: int,
+                      end_date: int,
+                      exch: str,
+                      writer: PartitionedWriter,
+                      trials: int = 3,
+                      ) -> int:
+        """
+        Fetches trades for a specific ticker, writing each page to disk as it arrives.
+
+        Parameters
+        ----------
+        ticker: str
+            Ticker symbol.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        exch: str
+            Name of exchange.
+        writer: PartitionedWriter
+            Writer the pages of trades are spilled to.
+        trials: int, default 3
+            Number of attempts to fetch data.
+
+        Returns
+        -------
+        n_trades: int
+            Number of trades written.
+        """
+        attempts, n_trades, seen_ids = 0, 0, set()
+
+        # inst exch
+        if self.exchange is None:
+            self.exchange = exchange_pool.get(exch)
+
+        # fetch data
+        if self.exchange.has['fetchTrades']:
+
+            # while loop to fetch all data
+            while start_date < end_date and attempts < trials:
+
+                try:
+                    self._get_rate_limiter(exch, self.exchange).acquire()
+                    # no until, some exchanges cap the since/until window (e.g. Binance aggTrades to 1h),
+                    # trades past the end date are dropped by _next_trades_page
+                    data = self.exchange.fetch_trades(
+                        ticker,
+                        since=start_date,
+                        limit=self.max_obs_per_call
+                    )
+                    if not data:
+                        break
+
+                    # write page to disk
+                    page, start_date, seen_ids, done = self._next_trades_page(data, start_date, end_date, seen_ids,
+                                                                              ticker=ticker)
+                    if page:
+                        writer.write(ticker, self._trades_to_columns(page))
+                        n_trades += len(page)
+                    if done:
+                        break
+
+                except Exception as e:
+                    attempts += 1
+
+                    if attempts >= trials:
+                        logging.warning(
+                            f"Failed to get trades from {self.exchange.id} "
+                            f"for {ticker} after {trials} attempts."
+                        )
+                        break
+
+                    # exception handling
+                    if not self._handle_exception_and_backoff(e, attempts):
+                        break
+
+            return n_trades
+
+        else:
+            logging.warning(f"Trades are not available for {self.exchange.id}.")
+            return 0
+
+    async def _fetch_all_trades_async(self,
+                                      tickers,
+                                      start_date: int,
+                                      end_date: int,
+                                      exch: str,
+                                      writer: PartitionedWriter,
+                                      trials: int = 3
+                                      ) -> List[int]:
+        """
+        Fetches trades for a list of tickers concurrently, writing each page to disk as it arrives.
+
+        Parameters
+        ----------
+        tickers: list
+            List of ticker symbols.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        exch: str
+            Name of exchange.
+        writer: PartitionedWriter
+            Writer the pages of trades are spilled to.
+        trials: int, default 3
+            Number of attempts to fetch data.
+
+        Returns
+        -------
+        n_trades: list
+            Number of trades written for each ticker, in ticker order.
+        """
+        # inst exch
+        self._load_exchange_async(exch)
+
+        # create progress bar
+        pbar = tqdm(total=len(tickers), desc="Fetching trades", unit="ticker")
+
+        # cap markets in flight
+        semaphore = self._get_semaphore()
+
+        async def _fetch(ticker: str) -> int:
+            async with semaphore:
+                n_trades = await self._fetch_trades_async(ticker, start_date, end_date, exch, writer, trials=trials)
+            pbar.update(1)
+            return n_trades
+
+        try:
+            return list(await asyncio.gather(*(_fetch(ticker) for ticker in tickers)))
+        finally:
+            pbar.close()
+
+    def _fetch_all_trades(self,
+                          tickers,
+                          start_date: int,
+                          end_date: int,
+                          exch: str,
+                          writer: PartitionedWriter,
+                          trials: int = 3
+                          ) -> List[int]:
+        """
+        Fetches trades for a list of tickers, writing each page to disk as it arrives.
+
+        Parameters
+        ----------
+        tickers: list
+            List of ticker symbols.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        exch: str
+            Name of exchange.
+        writer: PartitionedWriter
+            Writer the pages of trades are spilled to.
+        trials: int, default 3
+            Number of attempts to fetch data.
+
+        Returns
+        -------
+        n_trades: list
+            Number of trades written for each ticker.
+        """
+        # inst exch
+        if self.exchange is None:
+            self.exchange = exchange_pool.get(exch)
+
+        # create progress bar
+        pbar = tqdm(total=len(tickers), desc="Fetching trades", unit="ticker")
+
+        # loop through tickers
+        n_trades = []
+        try:
+            for ticker in tickers:
+                n_trades.append(self._fetch_trades(ticker, start_date, end_date, exch, writer, trials=trials))
+                pbar.update(1)
+        finally:
+            pbar.close()
+
+        return n_trades
+
+    def convert_params(self, data_req: DataRequest) -> DataRequest:
+        """
+        Converts data request parameters to CCXT format.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+
+        Returns
+        -------
+        data_req: DataRequest
+            Parameters of data request in CCXT format.
+        """
+        self.data_req = ConvertParams(data_req).to_ccxt()
+
+        # get metadata
+        self.get_metadata(self.data_req.exch)
+
+        # check markets
+        if not any([market in self.markets for market in self.data_req.source_markets]):
+            raise ValueError(
+                f"Selected markets are not available. Use the '.markets' attribute to check supported markets."
+            )
+
+        # check freq
+        if self.data_req.source_freq != 'tick' and self.data_req.source_freq not in self.frequencies:
+            raise ValueError(
+                f"{self.data_req.source_freq} frequency is not available. "
+                f"Use the '.frequencies' attribute to check available frequencies."
+            )
+
+        # check mkt type
+        if self.data_req.mkt_type not in self.market_types:
+            raise ValueError(
+                f"{self.data_req.mkt_type} is not available for {self.data_req.exch}."
+            )
+
+        # check start date
+        if not isinstance(self.data_req.source_start_date, int):
+            raise ValueError(
+                f"Start date must be in integers in milliseconds since Unix epoch."
+            )
+
+        # check end date
+        if not isinstance(self.data_req.source_end_date, int):
+            raise ValueError(
+                f"End date must be in integers in milliseconds since Unix epoch."
+            )
+
+        # check fields
+        if not any([field in self.fields for field in self.data_req.fields]):
+            raise ValueError(
                 f"Selected fields are not available for {self.data_req.exch}. "
                 f"Use fields attribute to check available fields."
             )
@@ -1389,6 +2120,13 @@ class CCXT(Library):
                 f" Try another exchange or data request."
             )
 
+        # check trades
+        if self.data_req.source_freq == 'tick' and not self.exchange.has["fetchTrades"]:
+            raise ValueError(
+                f"Trades are not available for {self.data_req.exch}."
+                f" Try another exchange or data request."
+            )
+
         # check perp future
         if any([(field == 'funding_rate' or field == 'open_interest') for field in self.data_req.fields]) and \
                 self.data_req.mkt_type not in ['perpetual_future', 'future']:
@@ -1399,7 +2137,127 @@ class CCXT(Library):
 
         return self.data_req
 
-    def wrangle_data_resp(self, data_type: str) -> pd.DataFrame:
+    @staticmethod
+    def _to_timestamp_ms(ts: Union[int, str, pd.Timestamp]) -> int:
+        """
+        Converts a timestamp to integers in milliseconds since Unix epoch.
+
+        Parameters
+        ----------
+        ts: int, str or pd.Timestamp
+            Timestamp in milliseconds since Unix epoch, or date string or timestamp. Naive timestamps are UTC.
+
+        Returns
+        -------
+        ts: int
+            Timestamp in integers in milliseconds since Unix epoch.
+        """
+        if isinstance(ts, Integral):
+            return int(ts)
+
+        ts = pd.Timestamp(ts)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert('UTC').tz_localize(None)
+
+        return int(ts.value // 10 ** 6)
+
+    def _get_start_dates(self,
+                         data_type: str,
+                         last_timestamps: Optional[Union[Dict[str, Any], pd.Series]] = None
+                         ) -> Dict[str, int]:
+        """
+        Gets the start date of each market for an incremental update, right after its last known timestamp.
+
+        Parameters
+        ----------
+        data_type: str
+            Type of data, e.g. 'ohlcv', 'funding_rates', 'open_interest'.
+        last_timestamps: dict or pd.Series, optional, default None
+            Last stored timestamp, by market symbol. Markets not included are looked up in the timestamp store.
+
+        Returns
+        -------
+        start_dates: dict
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by market symbol.
+            Markets without a known timestamp are omitted and start at the request start date.
+        """
+        freq = None if data_type == 'funding_rates' else self.data_req.source_freq
+
+        start_dates = {}
+        for ticker in self.data_req.source_markets:
+            if last_timestamps is not None and ticker in last_timestamps:
+                last_ts = self._to_timestamp_ms(last_timestamps[ticker])
+            else:
+                last_ts = self.timestamp_store.get(self.data_req.exch, data_type, ticker, freq)
+            if last_ts is not None:
+                start_dates[ticker] = max(self.data_req.source_start_date, last_ts + 1)
+
+        return start_dates
+
+    def _update_timestamps(self, data_type: str, data_resp: Optional[List] = None) -> None:
+        """
+        Updates the timestamp store with the last timestamp of each market in the data response.
+
+        Only closed OHLCV candles are recorded, so the open candle is fetched again on the next update.
+
+        Parameters
+        ----------
+        data_type: str
+            Type of data, e.g. 'ohlcv', 'funding_rates', 'open_interest'.
+        data_resp: list, optional, default None
+            Data response to record. Defaults to the last data response.
+        """
+        if data_resp is None:
+            data_resp = self.data_resp
+        last_timestamps = {}
+
+        if data_type == 'ohlcv':
+            timeframe_ms = ccxt.Exchange.parse_timeframe(self.data_req.source_freq) * 1000
+            now_ms = self._to_timestamp_ms(pd.Timestamp.utcnow())
+            for ticker, data in zip(self.data_req.source_markets, data_resp):
+                closed = [candle[0] for candle in data or [] if candle[0] + timeframe_ms <= now_ms]
+                if closed:
+                    last_timestamps[ticker] = max(closed)
+
+        elif data_type == 'funding_rates':
+            for ticker, data in zip(self.data_req.source_markets, data_resp):
+                if data:
+                    last_timestamps[ticker] = max(rate['timestamp'] for rate in data)
+
+        else:
+            for oi in data_resp:
+                last_timestamps[oi['symbol']] = max(oi['timestamp'], last_timestamps.get(oi['symbol'], 0))
+
+        freq = None if data_type == 'funding_rates' else self.data_req.source_freq
+        self.timestamp_store.update(self.data_req.exch, data_type, last_timestamps, freq)
+
+    def _drop_open_candles(self, df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Drops OHLCV candles which haven't closed yet, so incremental updates are append-only.
+
+        Parameters
+        ----------
+        df: pd.DataFrame, optional
+            Dataframe with OHLCV data in tidy data format.
+
+        Returns
+        -------
+        df: pd.DataFrame, optional
+            Dataframe with closed OHLCV candles.
+        """
+        if df is None or df.empty:
+            return df
+
+        timeframe = pd.Timedelta(ccxt.Exchange.parse_timeframe(self.data_req.source_freq), unit='s')
+        now = pd.Timestamp.utcnow().tz_localize(None)
+
+        return df[df.index.get_level_values('date') + timeframe <= now]
+
+    def wrangle_data_resp(self,
+                          data_type: str,
+                          data_resp: Optional[List] = None,
+                          data_req: Optional[DataRequest] = None
+                          ) -> pd.DataFrame:
         """
         Wrangle data response.
 
@@ -1407,128 +2265,238 @@ class CCXT(Library):
         ----------
         data_type: str
             Type of data, e.g. 'ohlcv', 'funding_rate', 'open_interest'.
+        data_resp: list, optional, default None
+            Data response to wrangle. Defaults to the last data response.
+        data_req: DataRequest, optional, default None
+            Parameters of data request in CCXT format matching the data response. Defaults to the data request.
 
         Returns
         -------
         df: pd.DataFrame
             Wrangled dataframe with DatetimeIndex and values in tidy format.
         """
-        return WrangleData(self.data_req, self.data_resp).ccxt(data_type=data_type)
+        if data_resp is None:
+            data_resp = self.data_resp
+        if data_req is None:
+            data_req = self.data_req
 
-    async def fetch_tidy_ohlcv_async(self, data_req: DataRequest) -> pd.DataFrame:
+        return WrangleData(data_req, data_resp).ccxt(data_type=data_type)
+
+    async def _fetch_tidy_async(self,
+                                data_type: str,
+                                data_req: DataRequest,
+                                start_dates: Optional[Dict[str, int]] = None,
+                                markets: Optional[List[str]] = None
+                                ) -> Tuple[Optional[pd.DataFrame], List]:
         """
-        Gets entire OHLCV history and wrangles the data response into tidy data format.
+        Gets entire data history for a data type and wrangles the data response into tidy data format.
+
+        The data response is kept local to the call, so data types can be fetched concurrently.
 
         Parameters
         ----------
+        data_type: str, {'ohlcv', 'funding_rates', 'open_interest'}
+            Type of data.
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            the request start date for incremental updates.
+        markets: list, optional, default None
+            Subset of the request's markets to fetch. Defaults to all markets.
 
         Returns
         -------
-        df: pd.DataFrame
-            Dataframe with entire OHLCV data history retrieved and wrangled into tidy data format.
+        df: pd.DataFrame, optional
+            Dataframe with entire data history retrieved and wrangled into tidy data format, or None if no
+            data was returned.
+        data_resp: list
+            Data response.
         """
         # convert data request parameters to CCXT format
         if self.data_req is None:
             self.convert_params(data_req)
 
-        # data resp
-        if self.data_resp:
-            self.data_resp = []
+        # markets
+        if markets is None:
+            markets = self.data_req.source_markets
+            chunk_req = self.data_req
+        else:
+            chunk_req = copy(self.data_req)
+            chunk_req.source_markets = markets
 
         # get entire data history
-        await self._fetch_all_ohlcv_async(self.data_req.source_markets,
-                                          self.data_req.source_freq,
-                                          self.data_req.source_start_date,
-                                          self.data_req.source_end_date,
-                                          self.data_req.exch,
-                                          trials=self.data_req.trials,
-                                          pause=self.data_req.pause)
+        if data_type == 'ohlcv':
+            data_resp = await self._fetch_all_ohlcv_async(markets,
+                                                          self.data_req.source_freq,
+                                                          self.data_req.source_start_date,
+                                                          self.data_req.source_end_date,
+                                                          self.data_req.exch,
+                                                          trials=self.data_req.trials,
+                                                          pause=self.data_req.pause,
+                                                          start_dates=start_dates)
+        elif data_type == 'funding_rates':
+            data_resp = await self._fetch_all_funding_rates_async(markets,
+                                                                  self.data_req.source_start_date,
+                                                                  self.data_req.source_end_date,
+                                                                  self.data_req.exch,
+                                                                  trials=self.data_req.trials,
+                                                                  pause=self.data_req.pause,
+                                                                  start_dates=start_dates)
+        elif data_type == 'open_interest':
+            data_resp = await self._fetch_all_open_interest_async(markets,
+                                                                  self.data_req.source_freq,
+                                                                  self.data_req.source_start_date,
+                                                                  self.data_req.source_end_date,
+                                                                  self.data_req.exch,
+                                                                  trials=self.data_req.trials,
+                                                                  pause=self.data_req.pause,
+                                                                  start_dates=start_dates)
+        else:
+            raise ValueError(f"Data type {data_type} not supported.")
+        self.data_resp = data_resp
 
         # wrangle df
-        if self.data_resp:
-            df = self.wrangle_data_resp(data_type='ohlcv')
-            return df
+        if any(data_resp):
+            return self.wrangle_data_resp(data_type=data_type, data_resp=data_resp, data_req=chunk_req), data_resp
         else:
-            logging.warning("Failed to get requested OHLCV data.")
+            logging.warning(f"Failed to get requested {self._data_type_names[data_type]}.")
+            return None, data_resp
 
-    def fetch_tidy_ohlcv(self, data_req: DataRequest) -> pd.DataFrame:
+    def _fetch_tidy(self,
+                    data_type: str,
+                    data_req: DataRequest,
+                    start_dates: Optional[Dict[str, int]] = None,
+                    markets: Optional[List[str]] = None
+                    ) -> Tuple[Optional[pd.DataFrame], List]:
         """
-        Gets entire OHLCV history and wrangles the data response into tidy data format.
+        Gets entire data history for a data type and wrangles the data response into tidy data format.
 
         Parameters
         ----------
+        data_type: str, {'ohlcv', 'funding_rates', 'open_interest'}
+            Type of data.
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            the request start date for incremental updates.
+        markets: list, optional, default None
+            Subset of the request's markets to fetch. Defaults to all markets.
 
         Returns
         -------
-        df: pd.DataFrame
-            Dataframe with entire OHLCV data history retrieved and wrangled into tidy data format.
+        df: pd.DataFrame, optional
+            Dataframe with entire data history retrieved and wrangled into tidy data format, or None if no
+            data was returned.
+        data_resp: list
+            Data response.
         """
         # convert data request parameters to CCXT format
         if self.data_req is None:
             self.convert_params(data_req)
 
+        # markets
+        if markets is None:
+            markets = self.data_req.source_markets
+            chunk_req = self.data_req
+        else:
+            chunk_req = copy(self.data_req)
+            chunk_req.source_markets = markets
+
         # data resp
-        if self.data_resp:
-            self.data_resp = []
+        self.data_resp = []
 
         # get entire data history
-        self._fetch_all_ohlcv(self.data_req.source_markets,
-                              self.data_req.source_freq,
-                              self.data_req.source_start_date,
-                              self.data_req.source_end_date,
-                              self.data_req.exch,
-                              trials=self.data_req.trials,
-                              pause=self.data_req.pause)
+        if data_type == 'ohlcv':
+            data_resp = self._fetch_all_ohlcv(markets,
+                                              self.data_req.source_freq,
+                                              self.data_req.source_start_date,
+                                              self.data_req.source_end_date,
+                                              self.data_req.exch,
+                                              trials=self.data_req.trials,
+                                              pause=self.data_req.pause,
+                                              start_dates=start_dates)
+        elif data_type == 'funding_rates':
+            data_resp = self._fetch_all_funding_rates(markets,
+                                                      self.data_req.source_start_date,
+                                                      self.data_req.source_end_date,
+                                                      self.data_req.exch,
+                                                      trials=self.data_req.trials,
+                                                      pause=self.data_req.pause,
+                                                      start_dates=start_dates)
+        elif data_type == 'open_interest':
+            data_resp = self._fetch_all_open_interest(markets,
+                                                      self.data_req.source_freq,
+                                                      self.data_req.source_start_date,
+                                                      self.data_req.source_end_date,
+                                                      self.data_req.exch,
+                                                      trials=self.data_req.trials,
+                                                      pause=self.data_req.pause,
+                                                      start_dates=start_dates)
+        else:
+            raise ValueError(f"Data type {data_type} not supported.")
+        self.data_resp = data_resp
 
         # wrangle df
-        if self.data_resp:
-            df = self.wrangle_data_resp(data_type='ohlcv')
-            return df
+        if any(data_resp):
+            return self.wrangle_data_resp(data_type=data_type, data_resp=data_resp, data_req=chunk_req), data_resp
         else:
-            logging.warning("Failed to get requested OHLCV data.")
+            logging.warning(f"Failed to get requested {self._data_type_names[data_type]}.")
+            return None, data_resp
 
-    async def fetch_tidy_funding_rates_async(self, data_req: DataRequest) -> pd.DataFrame:
+    async def fetch_tidy_ohlcv_async(self,
+                                     data_req: DataRequest,
+                                     start_dates: Optional[Dict[str, int]] = None
+                                     ) -> pd.DataFrame:
         """
-        Gets entire funding rates history and wrangles the data response into tidy data format.
+        Gets entire OHLCV history and wrangles the data response into tidy data format.
 
         Parameters
         ----------
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            the request start date for incremental updates.
 
         Returns
         -------
         df: pd.DataFrame
-            Dataframe with entire data history retrieved and wrangled into tidy data format.
+            Dataframe with entire OHLCV data history retrieved and wrangled into tidy data format.
         """
-        # convert data request parameters to CCXT format
-        if self.data_req is None:
-            self.convert_params(data_req)
+        df, _ = await self._fetch_tidy_async('ohlcv', data_req, start_dates=start_dates)
 
-        # data resp
-        if self.data_resp:
-            self.data_resp = []
+        return df
 
-        # get entire data history
-        await self._fetch_all_funding_rates_async(self.data_req.source_markets,
-                                                  self.data_req.source_start_date,
-                                                  self.data_req.source_end_date,
-                                                  self.data_req.exch,
-                                                  trials=self.data_req.trials,
-                                                  pause=self.data_req.pause)
+    def fetch_tidy_ohlcv(self,
+                         data_req: DataRequest,
+                         start_dates: Optional[Dict[str, int]] = None
+                         ) -> pd.DataFrame:
+        """
+        Gets entire OHLCV history and wrangles the data response into tidy data format.
 
-        # wrangle df
-        if self.data_resp:
-            df = self.wrangle_data_resp(data_type='funding_rates')
-            return df
-        else:
-            logging.warning("Failed to get requested funding rates.")
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            the request start date for incremental updates.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with entire OHLCV data history retrieved and wrangled into tidy data format.
+        """
+        df, _ = self._fetch_tidy('ohlcv', data_req, start_dates=start_dates)
 
-    def fetch_tidy_funding_rates(self, data_req: DataRequest) -> pd.DataFrame:
+        return df
+
+    async def fetch_tidy_funding_rates_async(self,
+                                             data_req: DataRequest,
+                                             start_dates: Optional[Dict[str, int]] = None
+                                             ) -> pd.DataFrame:
         """
         Gets entire funding rates history and wrangles the data response into tidy data format.
 
@@ -1536,36 +2504,47 @@ class CCXT(Library):
         ----------
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            the request start date for incremental updates.
 
         Returns
         -------
         df: pd.DataFrame
             Dataframe with entire data history retrieved and wrangled into tidy data format.
         """
-        # convert data request parameters to CCXT format
-        if self.data_req is None:
-            self.convert_params(data_req)
+        df, _ = await self._fetch_tidy_async('funding_rates', data_req, start_dates=start_dates)
 
-        # data resp
-        if self.data_resp:
-            self.data_resp = []
+        return df
 
-        # get entire data history
-        self._fetch_all_funding_rates(self.data_req.source_markets,
-                                      self.data_req.source_start_date,
-                                      self.data_req.source_end_date,
-                                      self.data_req.exch,
-                                      trials=self.data_req.trials,
-                                      pause=self.data_req.pause)
+    def fetch_tidy_funding_rates(self,
+                                 data_req: DataRequest,
+                                 start_dates: Optional[Dict[str, int]] = None
+                                 ) -> pd.DataFrame:
+        """
+        Gets entire funding rates history and wrangles the data response into tidy data format.
 
-        # wrangle df
-        if self.data_resp:
-            df = self.wrangle_data_resp(data_type='funding_rates')
-            return df
-        else:
-            logging.warning("Failed to get requested funding rates.")
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            the request start date for incremental updates.
 
-    async def fetch_tidy_open_interest_async(self, data_req: DataRequest) -> pd.DataFrame:
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with entire data history retrieved and wrangled into tidy data format.
+        """
+        df, _ = self._fetch_tidy('funding_rates', data_req, start_dates=start_dates)
+
+        return df
+
+    async def fetch_tidy_open_interest_async(self,
+                                             data_req: DataRequest,
+                                             start_dates: Optional[Dict[str, int]] = None
+                                             ) -> pd.DataFrame:
         """
         Gets entire open interest history and wrangles the data response into tidy data format.
 
@@ -1573,37 +2552,23 @@ class CCXT(Library):
         ----------
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            the request start date for incremental updates.
 
         Returns
         -------
         df: pd.DataFrame
             Dataframe with entire data history retrieved and wrangled into tidy data format.
         """
-        # convert data request parameters to CCXT format
-        if self.data_req is None:
-            self.convert_params(data_req)
-
-        # data resp
-        if self.data_resp:
-            self.data_resp = []
-
-        # get entire data history
-        await self._fetch_all_open_interest_async(self.data_req.source_markets,
-                                                  self.data_req.source_freq,
-                                                  self.data_req.source_start_date,
-                                                  self.data_req.source_end_date,
-                                                  self.data_req.exch,
-                                                  trials=self.data_req.trials,
-                                                  pause=self.data_req.pause)
+        df, _ = await self._fetch_tidy_async('open_interest', data_req, start_dates=start_dates)
 
-        # wrangle df
-        if self.data_resp:
-            df = self.wrangle_data_resp(data_type='open_interest')
-            return df
-        else:
-            logging.warning("Failed to get requested open interest.")
+        return df
 
-    def fetch_tidy_open_interest(self, data_req: DataRequest) -> pd.DataFrame:
+    def fetch_tidy_open_interest(self,
+                                 data_req: DataRequest,
+                                 start_dates: Optional[Dict[str, int]] = None
+                                 ) -> pd.DataFrame:
         """
         Gets entire open interest history and wrangles the data response into tidy data format.
 
@@ -1611,43 +2576,93 @@ class CCXT(Library):
         ----------
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        start_dates: dict, optional, default None
+            Dictionary of start dates in integers in milliseconds since Unix epoch, by ticker, overriding
+            the request start date for incremental updates.
 
         Returns
         -------
         df: pd.DataFrame
             Dataframe with entire data history retrieved and wrangled into tidy data format.
         """
-        # convert data request parameters to CCXT format
-        if self.data_req is None:
-            self.convert_params(data_req)
+        df, _ = self._fetch_tidy('open_interest', data_req, start_dates=start_dates)
 
-        # data resp
-        if self.data_resp:
-            self.data_resp = []
+        return df
 
-        # get entire data history
-        self._fetch_all_open_interest(self.data_req.source_markets,
-                                      self.data_req.source_freq,
-                                      self.data_req.source_start_date,
-                                      self.data_req.source_end_date,
-                                      self.data_req.exch,
-                                      trials=self.data_req.trials,
-                                      pause=self.data_req.pause)
+    @staticmethod
+    def _get_data_types(fields: List[str]) -> List[str]:
+        """
+        Gets the data types needed for the requested fields.
 
-        # wrangle df
-        if self.data_resp:
-            df = self.wrangle_data_resp(data_type='open_interest')
-            return df
-        else:
-            logging.warning("Failed to get requested open interest.")
+        Parameters
+        ----------
+        fields: list
+            List of fields, e.g. ['close', 'funding_rate'].
+
+        Returns
+        -------
+        data_types: list
+            List of data types, e.g. ['ohlcv', 'funding_rates'].
+        """
+        data_types = []
+        if any([field in ["open", "high", "low", "close", "volume"] for field in fields]):
+            data_types.append('ohlcv')
+        if any([field == "funding_rate" for field in fields]):
+            data_types.append('funding_rates')
+        if any([field == "oi" for field in fields]):
+            data_types.append('open_interest')
+
+        return data_types
 
-    async def get_data_async(self, data_req: DataRequest) -> pd.DataFrame:
+    @staticmethod
+    def _join_data_types(dfs: List[Optional[pd.DataFrame]], fields: List[str]) -> Optional[pd.DataFrame]:
+        """
+        Joins tidy dataframes of different data types for the same markets.
+
+        Parameters
+        ----------
+        dfs: list
+            List of dataframes in tidy data format, or None for data types with no data.
+        fields: list
+            List of requested fields.
+
+        Returns
+        -------
+        df: pd.DataFrame, optional
+            Dataframe with requested fields, or None if there is no data.
+        """
+        dfs = [df for df in dfs if df is not None and not df.empty]
+        if not dfs:
+            return None
+
+        df = pd.concat(dfs, axis=1)
+
+        return df.loc[:, [field for field in fields if field in df.columns]].sort_index()
+
+    async def get_data_async(self,
+                             data_req: DataRequest,
+                             incremental: bool = False,
+                             last_timestamps: Optional[Union[Dict[str, Any], pd.Series]] = None
+                             ) -> pd.DataFrame:
         """
         Get data specified by data request.
 
+        OHLCV, funding rates and open interest are fetched concurrently and joined once.
+
+        In incremental mode, only data after the last known timestamp of each market is fetched, and just
+        the new rows are returned for appending to stored data. Last timestamps are taken from
+        last_timestamps if provided, else from the timestamp store, and markets without one start at the
+        request start date. The timestamp store is updated with the data returned, and OHLCV candles which
+        haven't closed yet are left out.
+
         Parameters
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        incremental: bool, default False
+            Fetches only data after the last known timestamp of each market.
+        last_timestamps: dict or pd.Series, optional, default None
+            Last stored timestamp, by market symbol (e.g. 'BTC/USDT:USDT'), in milliseconds since Unix epoch or
+            as a timestamp. Only used in incremental mode.
 
         Returns
         -------
@@ -1656,26 +2671,30 @@ class CCXT(Library):
         """
         logging.info("Retrieving data request from CCXT...")
 
-        # get OHLCV
-        if any([field in ["open", "high", "low", "close", "volume"] for field in data_req.fields]):
-            df = await self.fetch_tidy_ohlcv_async(data_req)
-            if any(df):
-                self.data = pd.concat([self.data, df])
+        # convert data request parameters to CCXT format
+        if self.data_req is None:
+            self.convert_params(data_req)
 
-        # get funding rates
-        if any([field == "funding_rate" for field in data_req.fields]):
-            df = await self.fetch_tidy_funding_rates_async(data_req)
-            if any(df):
-                self.data = pd.concat([self.data, df], axis=1)
+        async def _fetch(data_type: str) -> Optional[pd.DataFrame]:
+            start_dates = self._get_start_dates(data_type, last_timestamps) if incremental else None
+            df, data_resp = await self._fetch_tidy_async(data_type, data_req, start_dates=start_dates)
+            if incremental:
+                if data_type == 'ohlcv':
+                    df = self._drop_open_candles(df)
+                self._update_timestamps(data_type, data_resp)
+            return df
 
-        # get open interest
-        if any([field == "oi" for field in data_req.fields]):
-            df = await self.fetch_tidy_open_interest_async(data_req)
-            if any(df):
-                self.data = pd.concat([self.data, df], axis=1)
+        # fetch data types concurrently, then join once
+        dfs = await asyncio.gather(*(_fetch(data_type) for data_type in self._get_data_types(data_req.fields)))
+        dfs = [df for df in dfs if df is not None and any(df)]
+        if dfs:
+            self.data = pd.concat([self.data, pd.concat(dfs, axis=1)])
 
         # check df
         if self.data.empty:
+            # no new data since the last update
+            if incremental:
+                return self.data
             raise Exception(
                 "No data returned. Check data request parameters and try again."
             )
@@ -1686,13 +2705,28 @@ class CCXT(Library):
 
         return self.data.sort_index()
 
-    def get_data(self, data_req: DataRequest) -> pd.DataFrame:
+    def get_data(self,
+                 data_req: DataRequest,
+                 incremental: bool = False,
+                 last_timestamps: Optional[Union[Dict[str, Any], pd.Series]] = None
+                 ) -> pd.DataFrame:
         """
         Get data specified by data request.
 
+        In incremental mode, only data after the last known timestamp of each market is fetched, and just
+        the new rows are returned for appending to stored data. Last timestamps are taken from
+        last_timestamps if provided, else from the timestamp store, and markets without one start at the
+        request start date. The timestamp store is updated with the data returned, and OHLCV candles which
+        haven't closed yet are left out.
+
         Parameters
         data_req: DataRequest
             Parameters of data request in CryptoDataPy format.
+        incremental: bool, default False
+            Fetches only data after the last known timestamp of each market.
+        last_timestamps: dict or pd.Series, optional, default None
+            Last stored timestamp, by market symbol (e.g. 'BTC/USDT:USDT'), in milliseconds since Unix epoch or
+            as a timestamp. Only used in incremental mode.
 
         Returns
         -------
@@ -1701,26 +2735,43 @@ class CCXT(Library):
         """
         logging.info("Retrieving data request from CCXT...")
 
+        # convert data request parameters to CCXT format
+        if incremental and self.data_req is None:
+            self.convert_params(data_req)
+
         # get OHLCV
         if any([field in ["open", "high", "low", "close", "volume"] for field in data_req.fields]):
-            df = self.fetch_tidy_ohlcv(data_req)
-            if any(df):
+            start_dates = self._get_start_dates('ohlcv', last_timestamps) if incremental else None
+            df = self.fetch_tidy_ohlcv(data_req, start_dates=start_dates)
+            if incremental:
+                df = self._drop_open_candles(df)
+                self._update_timestamps('ohlcv')
+            if df is not None and any(df):
                 self.data = pd.concat([self.data, df])
 
         # get funding rates
         if any([field == "funding_rate" for field in data_req.fields]):
-            df = self.fetch_tidy_funding_rates(data_req)
-            if any(df):
+            start_dates = self._get_start_dates('funding_rates', last_timestamps) if incremental else None
+            df = self.fetch_tidy_funding_rates(data_req, start_dates=start_dates)
+            if incremental:
+                self._update_timestamps('funding_rates')
+            if df is not None and any(df):
                 self.data = pd.concat([self.data, df], axis=1)
 
         # get open interest
         if any([field == "oi" for field in data_req.fields]):
-            df = self.fetch_tidy_open_interest(data_req)
-            if any(df):
+            start_dates = self._get_start_dates('open_interest', last_timestamps) if incremental else None
+            df = self.fetch_tidy_open_interest(data_req, start_dates=start_dates)
+            if incremental:
+                self._update_timestamps('open_interest')
+            if df is not None and any(df):
                 self.data = pd.concat([self.data, df], axis=1)
 
         # check df
         if self.data.empty:
+            # no new data since the last update
+            if incremental:
+                return self.data
             raise Exception(
                 "No data returned. Check data request parameters and try again."
             )
@@ -1730,3 +2781,193 @@ class CCXT(Library):
         self.data = self.data.loc[:, fields]
 
         return self.data.sort_index()
+
+    async def get_trades_async(self,
+                               data_req: DataRequest,
+                               path: str,
+                               file_format: str = 'parquet',
+                               chunk_rows: int = 1_000_000
+                               ) -> ds.Dataset:
+        """
+        Gets trades specified by data request, spilling them to partitioned columnar files on disk.
+
+        Pages of trades are written as they arrive, partitioned by market and day, so histories much larger
+        than memory can be downloaded. Markets are fetched concurrently.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format, e.g. with freq='tick'.
+        path: str
+            Root directory of the dataset. Market and day partitions already in the path are replaced when they
+            are written again, so re-running a download doesn't duplicate trades. Other partitions are kept.
+        file_format: str, {'parquet', 'ipc'}, default 'parquet'
+            Format of the files.
+        chunk_rows: int, default 1,000,000
+            Maximum number of trades buffered per market and day before they are written to a file.
+
+        Returns
+        -------
+        dataset: pyarrow.dataset.Dataset
+            Lazy handle to the trades, with timestamp, id, side, price, amount and cost columns and ticker
+            and date partition columns.
+        """
+        logging.info("Retrieving trades from CCXT...")
+
+        # convert data request parameters to CCXT format
+        if self.data_req is None:
+            self.convert_params(data_req)
+
+        with PartitionedWriter(path, TRADES_SCHEMA, file_format=file_format, chunk_rows=chunk_rows) as writer:
+            await self._fetch_all_trades_async(self.data_req.source_markets,
+                                               self.data_req.source_start_date,
+                                               self.data_req.source_end_date,
+                                               self.data_req.exch,
+                                               writer,
+                                               trials=self.data_req.trials)
+
+        return writer.dataset()
+
+    def get_trades(self,
+                   data_req: DataRequest,
+                   path: str,
+                   file_format: str = 'parquet',
+                   chunk_rows: int = 1_000_000
+                   ) -> ds.Dataset:
+        """
+        Gets trades specified by data request, spilling them to partitioned columnar files on disk.
+
+        Pages of trades are written as they arrive, partitioned by market and day, so histories much larger
+        than memory can be downloaded.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format, e.g. with freq='tick'.
+        path: str
+            Root directory of the dataset. Market and day partitions already in the path are replaced when they
+            are written again, so re-running a download doesn't duplicate trades. Other partitions are kept.
+        file_format: str, {'parquet', 'ipc'}, default 'parquet'
+            Format of the files.
+        chunk_rows: int, default 1,000,000
+            Maximum number of trades buffered per market and day before they are written to a file.
+
+        Returns
+        -------
+        dataset: pyarrow.dataset.Dataset
+            Lazy handle to the trades, with timestamp, id, side, price, amount and cost columns and ticker
+            and date partition columns.
+        """
+        logging.info("Retrieving trades from CCXT...")
+
+        # convert data request parameters to CCXT format
+        if self.data_req is None:
+            self.convert_params(data_req)
+
+        with PartitionedWriter(path, TRADES_SCHEMA, file_format=file_format, chunk_rows=chunk_rows) as writer:
+            self._fetch_all_trades(self.data_req.source_markets,
+                                   self.data_req.source_start_date,
+                                   self.data_req.source_end_date,
+                                   self.data_req.exch,
+                                   writer,
+                                   trials=self.data_req.trials)
+
+        return writer.dataset()
+
+    def iter_data(self, data_req: DataRequest, chunk_size: int = 1) -> Iterator[pd.DataFrame]:
+        """
+        Iterates over data specified by data request, by market chunk.
+
+        Each chunk of markets is fetched and wrangled in turn, so only one chunk is held in memory.
+        Downstream writers can persist each chunk as it arrives.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        chunk_size: int, default 1
+            Number of markets per chunk.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and values for selected fields (cols),
+            for a chunk of markets. Chunks with no data are skipped.
+        """
+        # convert data request parameters to CCXT format
+        if self.data_req is None:
+            self.convert_params(data_req)
+
+        markets = self.data_req.source_markets
+        for i in range(0, len(markets), chunk_size):
+            chunk = markets[i: i + chunk_size]
+            df = self._join_data_types(
+                [self._fetch_tidy(data_type, data_req, markets=chunk)[0]
+                 for data_type in self._get_data_types(data_req.fields)],
+                data_req.fields
+            )
+            if df is not None:
+                yield df
+
+    async def aiter_data(self, data_req: DataRequest, chunk_size: int = 1) -> AsyncIterator[pd.DataFrame]:
+        """
+        Iterates over data specified by data request, by market chunk, as each chunk finishes.
+
+        Chunks are fetched concurrently and yielded in completion order. All chunks share one semaphore, so
+        the markets in flight are capped by the exchange's concurrency cap across chunks. The number of chunks
+        in flight, or finished and not yet consumed, is capped too, which bounds memory.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        chunk_size: int, default 1
+            Number of markets per chunk.
+
+        Yields
+        ------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and values for selected fields (cols),
+            for a chunk of markets. Chunks with no data are skipped.
+        """
+        # convert data request parameters to CCXT format
+        if self.data_req is None:
+            self.convert_params(data_req)
+
+        # inst exch
+        self._load_exchange_async(self.data_req.exch)
+
+        data_types = self._get_data_types(data_req.fields)
+        markets = self.data_req.source_markets
+        chunks = iter([markets[i: i + chunk_size] for i in range(0, len(markets), chunk_size)])
+        max_concurrency = self._get_max_concurrency(self.exchange_async)
+        max_chunks = max(1, max_concurrency // chunk_size)
+
+        async def _fetch(chunk: List[str]) -> Optional[pd.DataFrame]:
+            dfs = await asyncio.gather(*(self._fetch_tidy_async(data_type, data_req, markets=chunk)
+                                         for data_type in data_types))
+            return self._join_data_types([df for df, _ in dfs], data_req.fields)
+
+        def _schedule(pending: set) -> None:
+            while len(pending) < max_chunks:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                pending.add(asyncio.ensure_future(_fetch(chunk)))
+
+        # share the cap across chunks
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        pending = set()
+        _schedule(pending)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                _schedule(pending)  # keep downloading while the consumer works on finished chunks
+                for task in done:
+                    df = task.result()
+                    if df is not None:
+                        yield df
+        finally:
+            for task in pending:
+                task.cancel()
+            self._semaphore = None
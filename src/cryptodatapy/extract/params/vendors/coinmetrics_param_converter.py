@@ -2,7 +2,7 @@ import logging
 from typing import Dict, Any, List, Optional, Tuple
 from cryptodatapy.core.data_request import DataRequest
 from cryptodatapy.extract.params.base_param_converter import BaseParamConverter
-from cryptodatapy.extract.config.coinmetrics_config import COINMETRICS_ENDPOINTS
+from cryptodatapy.extract.config.coinmetrics_config import COINMETRICS_ENDPOINTS, COINMETRICS_FIELDS
 
 # logging setup
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
@@ -18,12 +18,27 @@ class CoinMetricsParamConverter(BaseParamConverter):
     # Mapping of data type to CoinMetrics API endpoint
     ENDPOINT_MAP = COINMETRICS_ENDPOINTS
 
-    def __init__(self, data_req: DataRequest):
+    # Response formats supported by the CoinMetrics API
+    RESPONSE_FORMATS = ['json', 'csv', 'json_stream']
+
+    def __init__(self, data_req: DataRequest, response_format: str = 'json'):
         """
         Initializes the converter with the data request object.
+
+        Parameters
+        ----------
+        data_req : DataRequest
+            The standardized data request object.
+        response_format : str, {'json', 'csv', 'json_stream'}, default 'json'
+            Format of the API responses. 'csv' and 'json_stream' stream the whole result in one response,
+            without pagination, and are parsed with vectorized readers.
         """
         super().__init__(data_req)
 
+        if response_format not in self.RESPONSE_FORMATS:
+            raise ValueError(f"Invalid response format. Valid formats are: {self.RESPONSE_FORMATS}")
+        self.response_format = response_format
+
         self.base_params = self._get_base_params()
 
     # --------------------------------------------------------------------------
@@ -152,6 +167,46 @@ class CoinMetricsParamConverter(BaseParamConverter):
 
         return start_date, end_date
 
+    def get_catalogs(self) -> List[str]:
+        """
+        Resolves the catalogs needed to convert the request, from its fields, frequency and market type.
+
+        A data type's catalog is only needed if the request could be converted for it, e.g. an asset metrics
+        request needs the assets and asset metrics catalogs, but not the indexes or markets catalogs.
+
+        Returns
+        -------
+        List[str]
+            List of catalogs, from 'indexes', 'markets', 'assets' and 'asset_fields'.
+        """
+        cm_fields = self.convert_fields(data_source='coinmetrics')
+        cm_freq = self._convert_freq()
+        mkt_type = self.data_req.mkt_type
+
+        def _has_fields(data_type: str) -> bool:
+            return any(field in COINMETRICS_FIELDS[data_type] for field in cm_fields)
+
+        catalogs = []
+
+        # indexes
+        if _has_fields('index') and cm_freq in ["1s", "15s", "1h", "1d"]:
+            catalogs.append('indexes')
+
+        # markets
+        if (_has_fields('ohlcv') and cm_freq in ["1m", "1h", "1d"]) or \
+                ((_has_fields('open_interest') or _has_fields('funding_rates')) and
+                 mkt_type in ["perpetual_future", "future", "option"]) or \
+                (_has_fields('trades') and cm_freq == "raw") or \
+                (_has_fields('quotes') and cm_freq in ["raw", "1s", "1m", "1h", "1d"]):
+            catalogs.append('markets')
+
+        # assets, asset metrics are any fields not listed for the other data types
+        listed_fields = {field for fields in COINMETRICS_FIELDS.values() for field in fields}
+        if any(field not in listed_fields for field in cm_fields) and cm_freq in ["1b", "1d"]:
+            catalogs.extend(['assets', 'asset_fields'])
+
+        return catalogs
+
     # --------------------------------------------------------------------------
     # --- Specific Conversion Methods (Helper methods for the public convert()) ---
     # --------------------------------------------------------------------------
@@ -166,6 +221,15 @@ class CoinMetricsParamConverter(BaseParamConverter):
             A dictionary containing common vendor-specific parameters.
         """
         start_date, end_date = self._convert_dates()
+
+        # streaming formats aren't paginated
+        if self.response_format != 'json':
+            return {
+                'start_time': start_date,
+                'end_time': end_date,
+                'format': self.response_format,
+            }
+
         return {
             'start_time': start_date,
             'end_time': end_date,
@@ -0,0 +1,199 @@
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+class Bars:
+    """
+    Aggregates trades into OHLCV bars.
+
+    Trades are fetched once, e.g. with CCXT.get_trades or CoinMetrics market-trades, and bars of any frequency
+    are derived locally instead of requesting candles from each vendor. Time, tick, volume and dollar bars are
+    supported, each with OHLC, volume, quote currency volume, VWAP, trade count and buy/sell volume.
+    """
+    def __init__(
+            self,
+            trades: pd.DataFrame,
+            time_col: str = 'timestamp',
+            ticker_col: str = 'ticker',
+            price_col: str = 'price',
+            amount_col: str = 'amount',
+            side_col: Optional[str] = 'side'
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        trades: pd.DataFrame
+            DataFrame with a row per trade and time, ticker, price and amount columns, e.g. CCXT trades from
+            get_trades().to_table().to_pandas(). A MultiIndex is reset to columns.
+        time_col: str, default 'timestamp'
+            Name of the column with trade timestamps, as datetimes or in milliseconds since Unix epoch.
+            For CoinMetrics market-trades, use 'time'.
+        ticker_col: str, default 'ticker'
+            Name of the column with tickers. For CoinMetrics market-trades, use 'market'.
+        price_col: str, default 'price'
+            Name of the column with trade prices.
+        amount_col: str, default 'amount'
+            Name of the column with trade sizes, in base asset units.
+        side_col: str, optional, default 'side'
+            Name of the column with taker sides, 'buy' or 'sell'. If None or missing, buy and sell volume
+            are not computed.
+        """
+        if isinstance(trades.index, pd.MultiIndex):
+            trades = trades.reset_index()
+
+        # sort trades by ticker and time, keeping the order of trades within a timestamp
+        if pd.api.types.is_numeric_dtype(trades[time_col]):  # milliseconds since Unix epoch
+            times = pd.to_datetime(trades[time_col], unit='ms', utc=True).dt.tz_localize(None)
+        else:
+            times = pd.to_datetime(trades[time_col], utc=True).dt.tz_localize(None)
+        self.trades = pd.DataFrame({
+            'date': times.to_numpy(),
+            'ticker': trades[ticker_col].to_numpy(),
+            'price': pd.to_numeric(trades[price_col], errors='coerce').to_numpy(dtype=np.float64),
+            'amount': pd.to_numeric(trades[amount_col], errors='coerce').to_numpy(dtype=np.float64),
+        })
+        self.trades['notional'] = self.trades.price * self.trades.amount
+        if side_col is not None and side_col in trades.columns:
+            side = trades[side_col].astype(str).str.lower().to_numpy()
+            self.trades['buy_volume'] = np.where(side == 'buy', self.trades.amount, 0.0)
+            self.trades['sell_volume'] = np.where(side == 'sell', self.trades.amount, 0.0)
+        self.trades = self.trades.sort_values(['ticker', 'date'], kind='stable', ignore_index=True)
+
+        self.bars = None
+
+    def _aggregate(self, bar_ids: Union[pd.Series, np.ndarray], label: str) -> pd.DataFrame:
+        """
+        Aggregates trades with the same ticker and bar id into bars.
+
+        Parameters
+        ----------
+        bar_ids: pd.Series or np.ndarray
+            Bar id of each trade.
+        label: str, {'first', 'last'}
+            Labels each bar with the timestamp of its bar id ('first', for time bars) or of its last trade ('last').
+
+        Returns
+        -------
+        bars: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1) and bar fields (cols).
+        """
+        aggs = {
+            'date': ('date', 'last'),
+            'open': ('price', 'first'),
+            'high': ('price', 'max'),
+            'low': ('price', 'min'),
+            'close': ('price', 'last'),
+            'volume': ('amount', 'sum'),
+            'volume_quote_ccy': ('notional', 'sum'),
+            'trades': ('price', 'size'),
+        }
+        if 'buy_volume' in self.trades.columns:
+            aggs['buy_volume'] = ('buy_volume', 'sum')
+            aggs['sell_volume'] = ('sell_volume', 'sum')
+
+        bars = self.trades.groupby([self.trades.ticker.to_numpy(), np.asarray(bar_ids)], sort=True).agg(**aggs)
+        bars.index.names = ['ticker', 'bar']
+        if label == 'first':
+            bars['date'] = bars.index.get_level_values('bar')
+
+        # vwap
+        bars['vwap'] = bars.volume_quote_ccy / bars.volume.where(bars.volume != 0)
+
+        # tidy format
+        bars = bars.reset_index('ticker').set_index(['date', 'ticker'], drop=True).sort_index()
+        cols = ['open', 'high', 'low', 'close', 'volume', 'volume_quote_ccy', 'vwap', 'trades']
+        self.bars = bars[cols + [col for col in ['buy_volume', 'sell_volume'] if col in bars.columns]]
+
+        return self.bars
+
+    def time_bars(self, freq: str = 'd') -> pd.DataFrame:
+        """
+        Aggregates trades into time bars.
+
+        Parameters
+        ----------
+        freq: str, default 'd'
+            Frequency of bars, e.g. '1min', '5min', '1h', 'd', 'w', 'm', 'q', 'y'. Bars are labeled with their
+            start time. Periods without trades are omitted.
+
+        Returns
+        -------
+        bars: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1) and bar fields (cols).
+        """
+        if freq in ['w', 'm', 'q', 'y']:
+            bar_ids = self.trades.date.dt.to_period(freq.upper()).dt.start_time
+        else:
+            bar_ids = self.trades.date.dt.floor(freq)
+
+        return self._aggregate(bar_ids, label='first')
+
+    def _threshold_bars(self, values: pd.Series, threshold: float) -> pd.DataFrame:
+        """
+        Aggregates trades into bars which close on multiples of a threshold in the cumulative values of a ticker.
+
+        Bar ids are computed from the cumulative sum, without a per-bar loop. Trades aren't split, so each
+        trade is in the bar its cumulative value ends in, and a bar may hold less than the threshold when the
+        next trade crosses into the following bar. The last bar of each ticker may be partial.
+        """
+        if threshold <= 0:
+            raise ValueError("Threshold must be greater than 0.")
+
+        cum_values = values.groupby(self.trades.ticker.to_numpy()).cumsum().to_numpy()
+        bar_ids = np.maximum(np.ceil(cum_values / threshold) - 1, 0).astype(np.int64)
+
+        return self._aggregate(bar_ids, label='last')
+
+    def tick_bars(self, n_trades: int) -> pd.DataFrame:
+        """
+        Aggregates trades into bars of a fixed number of trades, labeled with the time of their last trade.
+
+        Parameters
+        ----------
+        n_trades: int
+            Number of trades per bar.
+
+        Returns
+        -------
+        bars: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1) and bar fields (cols).
+        """
+        return self._threshold_bars(pd.Series(np.ones(len(self.trades))), n_trades)
+
+    def volume_bars(self, volume: float) -> pd.DataFrame:
+        """
+        Aggregates trades into bars of a fixed volume in base asset units, labeled with the time of their last
+        trade.
+
+        Parameters
+        ----------
+        volume: float
+            Volume per bar.
+
+        Returns
+        -------
+        bars: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1) and bar fields (cols).
+        """
+        return self._threshold_bars(self.trades.amount, volume)
+
+    def dollar_bars(self, dollar_volume: float) -> pd.DataFrame:
+        """
+        Aggregates trades into bars of a fixed volume in quote currency units, labeled with the time of their
+        last trade.
+
+        Parameters
+        ----------
+        dollar_volume: float
+            Quote currency volume per bar.
+
+        Returns
+        -------
+        bars: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1) and bar fields (cols).
+        """
+        return self._threshold_bars(self.trades.notional, dollar_volume)
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Union, Dict, List, Optional, Any
 from importlib import resources
 
+import numpy as np
 import pandas as pd
 
 from cryptodatapy.extract.datarequest import DataRequest
@@ -788,25 +789,53 @@ class WrangleData:
         """
         Wrangles CCXT OHLCV data response to dataframe with tidy data format.
 
+        Candles are stacked into a single float64 array and the MultiIndex is built from codes, in one pass.
+        Zero values are set to NaN and duplicate rows are removed.
+
         Returns
         -------
         pd.DataFrame
             Dataframe with tidy data format.
         """
         # field cols
-        cols = ["date", "open", "high", "low", "close", "volume"]
-
-        # add tickers
-        for i in range(len(self.data_req.source_markets)):
-            df = pd.DataFrame(self.data_resp[i], columns=cols)
-            df['ticker'] = self.data_req.source_markets[i]
-            self.tidy_data = pd.concat([self.tidy_data, df])
-
-        # convert to datetime
-        self.tidy_data['date'] = pd.to_datetime(self.tidy_data['date'], unit='ms')
-
-        # set index
-        self.tidy_data = self.tidy_data.set_index(['date', 'ticker']).sort_index()
+        cols = ["open", "high", "low", "close", "volume"]
+        tickers = self.data_req.source_markets
+        data_resp = self.data_resp[:len(tickers)]
+
+        # stack candles into preallocated array
+        lengths = np.array([len(data) if data else 0 for data in data_resp], dtype=np.int64)
+        values = np.empty((lengths.sum(), 6), dtype=np.float64)
+        pos = 0
+        for data, length in zip(data_resp, lengths):
+            if length:
+                try:
+                    values[pos: pos + length] = np.asarray(data, dtype=np.float64)[:, :6]
+                except (TypeError, ValueError):  # non-numeric values
+                    values[pos: pos + length] = pd.DataFrame(data).iloc[:, :6].apply(
+                        pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+                pos += length
+
+        # timestamps and tickers as codes
+        timestamps = values[:, 0].astype(np.int64)
+        dates, date_codes = np.unique(timestamps, return_inverse=True)
+        ticker_codes, ticker_level = pd.factorize(np.asarray(tickers, dtype=object), sort=True)
+        ticker_codes = np.repeat(ticker_codes, lengths)
+
+        # sort by date, ticker and drop duplicate rows
+        order = np.lexsort((ticker_codes, date_codes))
+        date_codes, ticker_codes, values = date_codes[order], ticker_codes[order], values[order, 1:]
+        unique = np.ones(len(order), dtype=bool)
+        unique[1:] = (date_codes[1:] != date_codes[:-1]) | (ticker_codes[1:] != ticker_codes[:-1])
+        date_codes, ticker_codes, values = date_codes[unique], ticker_codes[unique], values[unique]
+
+        # remove 0 values
+        values[values == 0] = np.nan
+
+        # ms timestamps to datetime
+        date_level = pd.DatetimeIndex((dates * 1_000_000).astype('datetime64[ns]'))
+        index = pd.MultiIndex(levels=[date_level, ticker_level], codes=[date_codes, ticker_codes],
+                              names=['date', 'ticker'], verify_integrity=False)
+        self.tidy_data = pd.DataFrame(values, index=index, columns=cols)
 
         return self.tidy_data
 
@@ -891,14 +920,16 @@ class WrangleData:
         else:
             raise ValueError(f"Data type {data_type} not supported.")
 
-        # type conversion
-        self.tidy_data = self.tidy_data.apply(pd.to_numeric, errors='coerce').convert_dtypes()
-
-        # remove bad data
-        if data_type != 'funding_rates':
-            self.tidy_data = self.tidy_data[self.tidy_data != 0]  # 0 values
-        self.tidy_data = self.tidy_data[~self.tidy_data.index.duplicated()]  # duplicate rows
-        self.tidy_data = self.tidy_data.dropna(how='all').dropna(how='all', axis=1)  # entire row or col NaNs
+        # type conversion and remove bad data
+        if data_type == 'ohlcv':
+            # already float64, with 0 values and duplicate rows removed
+            self.tidy_data = self.tidy_data.dropna(how='all').dropna(how='all', axis=1).astype('Float64')
+        else:
+            self.tidy_data = self.tidy_data.apply(pd.to_numeric, errors='coerce').convert_dtypes()
+            if data_type != 'funding_rates':
+                self.tidy_data = self.tidy_data[self.tidy_data != 0]  # 0 values
+            self.tidy_data = self.tidy_data[~self.tidy_data.index.duplicated()]  # duplicate rows
+            self.tidy_data = self.tidy_data.dropna(how='all').dropna(how='all', axis=1)  # entire row or col NaNs
 
         return self.tidy_data
 
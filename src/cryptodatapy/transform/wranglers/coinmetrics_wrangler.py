@@ -37,7 +37,7 @@ class CoinMetricsWrangler(BaseDataWrangler):
         Union[pd.DataFrame, list]
             Wrangled DataFrame or list of chain names.
         """
-        df = self.data_resp.to_dataframe().copy()
+        df = pd.DataFrame(self.data_resp)
         df.set_index("asset", inplace=True)
         df = df.sort_index()
 
@@ -57,7 +57,7 @@ class CoinMetricsWrangler(BaseDataWrangler):
         Union[pd.DataFrame, list]
             Wrangled DataFrame or list of market names.
         """
-        df = self.data_resp.to_dataframe().copy()
+        df = pd.DataFrame(self.data_resp)
         df.set_index("market", inplace=True)
         df = df.sort_index()
 
@@ -77,7 +77,7 @@ class CoinMetricsWrangler(BaseDataWrangler):
         Union[pd.DataFrame, list]
             Wrangled DataFrame or list of exchange names.
         """
-        df = self.data_resp.to_dataframe().copy()
+        df = pd.DataFrame(self.data_resp)
         df.set_index("exchange", inplace=True)
         df = df.sort_index()
 
@@ -97,7 +97,7 @@ class CoinMetricsWrangler(BaseDataWrangler):
         Union[pd.DataFrame, list]
             Wrangled DataFrame or list of index names.
         """
-        df = self.data_resp.to_dataframe().copy()
+        df = pd.DataFrame(self.data_resp)
         df.set_index("index", inplace=True)
         df = df.sort_index()
 
@@ -117,7 +117,7 @@ class CoinMetricsWrangler(BaseDataWrangler):
         Union[pd.DataFrame, list]
             Wrangled DataFrame or list of field names.
         """
-        df = self.data_resp.to_dataframe().copy()
+        df = pd.DataFrame(self.data_resp)
         df.set_index("metric", inplace=True)
         df = df.sort_index()
 
@@ -137,7 +137,10 @@ class CoinMetricsWrangler(BaseDataWrangler):
         Union[pd.DataFrame, list]
             Wrangled DataFrame or list of available field names.
         """
-        df = self.data_resp.to_dataframe().copy()
+        # one row per asset, metric and frequency
+        df = pd.json_normalize(self.data_resp, record_path=['metrics', 'frequencies'],
+                               meta=['asset', ['metrics', 'metric']])
+        df = df.rename(columns={'metrics.metric': 'metric'})
         df.set_index("metric", inplace=True)
         df = df.sort_index()
 
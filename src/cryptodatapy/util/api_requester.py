@@ -1,7 +1,19 @@
+import asyncio
+import weakref
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from typing import Dict, Any, Union, Optional
+from typing import Callable, Dict, Any, Union, Optional, Tuple, List, Coroutine
+from tqdm import tqdm
+
+from cryptodatapy.util.circuit_breaker import circuit_breakers
+from cryptodatapy.util.http_session import session_pool
+from cryptodatapy.util.json_decoder import json_decoder
+from cryptodatapy.util.pacing import pacing
+from cryptodatapy.util.response_cache import response_cache
+from cryptodatapy.util.single_flight import single_flight
+from cryptodatapy.util.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +23,11 @@ class APIRequester:
     A robust client for making external API GET requests.
 
     Encapsulates retry logic, error handling, and throttling based on
-    parameters supplied by the DataRequest object.
+    parameters supplied by the DataRequest object. Requests are sent through
+    the shared keep-alive session pool, so connections to each host are reused, and
+    metadata responses are served from the shared response cache when it is enabled.
+    Identical requests in flight at the same time share one response, and requests to a
+    vendor are short-circuited while its circuit breaker is open.
     """
 
     @staticmethod
@@ -20,7 +36,11 @@ class APIRequester:
             params: Dict[str, Union[str, int]],
             headers: Optional[Dict[str, str]] = None,
             trials: int = 3,
-            pause: float = 0.1
+            pause: float = 0.1,
+            timeout: Optional[Tuple[float, float]] = None,
+            rate_limiter: Optional[TokenBucket] = None,
+            columns_key: Optional[str] = None,
+            decoder: Optional[Callable[[bytes], Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Submits a resilient GET request to the API with retry logic.
@@ -36,22 +56,81 @@ class APIRequester:
         trials : int, default=3
             Maximum number of attempts to make for the request.
         pause : float, default=0.1
-            Number of seconds to pause between failed attempts.
+            Number of seconds to pause between failed attempts, unless the response advertises
+            a wait (Retry-After / X-RateLimit-Reset).
+        timeout : tuple, optional
+            (connect, read) timeout in seconds. Defaults to the session pool timeout.
+        rate_limiter : TokenBucket, optional
+            Vendor rate limiter. If provided, a token is taken before each attempt and its pace is
+            adjusted from the vendor's rate-limit response headers.
+        columns_key : str, optional
+            Key of the records array in the response, e.g. 'data'. If provided, the records are
+            decoded into a dictionary of columns.
+        decoder : callable, optional
+            Function decoding the response body, e.g. a CSV reader, for responses which aren't JSON.
+            If provided, columns_key is ignored.
 
         Returns
         -------
         Optional[Dict[str, Any]]
-            Data response in JSON format (dict) if successful, otherwise None.
+            Data response in JSON format (dict) if successful, otherwise None, including when
+            the vendor's circuit breaker is open.
         """
+        def _decode(content: bytes) -> Any:
+            if decoder is not None:
+                return decoder(content)
+            if columns_key is not None:
+                return json_decoder.decode_columns(content, key=columns_key)
+            return json_decoder.loads(content)
+
+        # serve fresh responses from the cache, revalidate stale ones
+        cache_entry = response_cache.lookup(url, params)
+        if cache_entry is not None:
+            if cache_entry.is_fresh:
+                return _decode(cache_entry.content())
+            headers = {**(headers or {}), **cache_entry.validators}
+
+        # fail fast while the vendor is down
+        breaker = circuit_breakers.get(circuit_breakers.make_key(url))
+
+        def _send() -> requests.Response:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                resp = session_pool.get(url, params=params, headers=headers, timeout=timeout)
+            except requests.exceptions.RequestException:
+                breaker.record_failure()
+                raise
+            # client errors and rate limits don't mean the vendor is down
+            if resp.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            return resp
+
+        # identical requests in flight share one response
+        flight_key = single_flight.make_key(url, params, headers)
+
         # set number of attempts
         attempts = 0
-        resp = None
 
         while attempts < trials:
+            if not breaker.allow_request():
+                logger.warning(f"Circuit open, skipping request to {url}.")  # Warning: Vendor outage
+                return None
+
+            resp, wait = None, None
             try:
-                resp = requests.get(url, params=params, headers=headers)
+                resp = single_flight.do(flight_key, _send)
+                wait = pacing.update(resp, rate_limiter)
+                # not modified since cached
+                if cache_entry is not None and resp.status_code == 304:
+                    response_cache.refresh(cache_entry, resp)
+                    return _decode(cache_entry.content())
                 resp.raise_for_status()
-                return resp.json()
+                data = _decode(resp.content)
+                response_cache.store(cache_entry, resp)
+                return data
 
             # handle HTTP errors
             except requests.exceptions.HTTPError as http_err:
@@ -66,6 +145,8 @@ class APIRequester:
                     logger.error(f"Forbidden (403): {log_msg}")  # Error: Configuration issue
                 elif status_code == 404:
                     logger.warning(f"Not Found (404): {log_msg}")  # Warning: Resource not found/Input issue
+                elif status_code == 429:
+                    logger.warning(f"Too Many Requests (429): {log_msg}")  # Warning: Rate limit reached
                 elif status_code >= 500:
                     logger.error(f"Server Error: {log_msg}")  # Error: System failure
                 else:
@@ -82,11 +163,199 @@ class APIRequester:
             # retry Logic
             attempts += 1
             if attempts < trials:
-                logger.info(f"Retrying attempt #{attempts + 1}/{trials} after {pause} seconds...")  # Info: Normal trace
-                sleep(pause)
+                # short-circuited at the top of the loop
+                if breaker.state == breaker.OPEN:
+                    continue
+                # wait advertised by the vendor, if any
+                wait = pause if wait is None else wait
+                logger.info(f"Retrying attempt #{attempts + 1}/{trials} after {wait} seconds...")  # Info: Normal trace
+                sleep(wait)
             else:
                 logger.error(f"Max attempts ({trials}) reached. Unable to fetch data from {url}.")  # Error: failure
                 break
 
         # failure case
         return None
+
+
+class AsyncAPIRequester:
+    """
+    Async counterpart to APIRequester for issuing many GET requests concurrently.
+
+    Each request runs the resilient APIRequester.get_request in a worker thread, over
+    the shared keep-alive session pool, while a per-vendor semaphore bounds the number
+    of requests in flight and an optional token-bucket limiter paces them.
+    """
+
+    # per event loop, per vendor semaphores
+    _semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]' = \
+        weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _get_semaphore(cls, vendor: str, max_concurrency: int) -> asyncio.Semaphore:
+        """
+        Gets the semaphore bounding concurrent requests to a vendor on the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        semaphores = cls._semaphores.setdefault(loop, {})
+        if vendor not in semaphores:
+            semaphores[vendor] = asyncio.Semaphore(max_concurrency)
+
+        return semaphores[vendor]
+
+    @classmethod
+    async def get_request(
+            cls,
+            url: str,
+            params: Optional[Dict[str, Union[str, int]]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            trials: int = 3,
+            pause: float = 0.1,
+            vendor: str = 'default',
+            max_concurrency: int = 8,
+            rate_limiter: Optional[TokenBucket] = None,
+            columns_key: Optional[str] = None,
+            decoder: Optional[Callable[[bytes], Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Submits a resilient GET request without blocking the event loop.
+
+        Parameters
+        ----------
+        url : str
+            The target endpoint URL for the GET request.
+        params : dict, optional
+            Dictionary containing query parameters for the request.
+        headers : dict, optional
+            Dictionary containing HTTP headers for the request.
+        trials : int, default=3
+            Maximum number of attempts to make for the request.
+        pause : float, default=0.1
+            Number of seconds to pause between failed attempts.
+        vendor : str, default='default'
+            Name of the vendor, used to share the concurrency limit across calls.
+        max_concurrency : int, default=8
+            Maximum number of requests in flight to the vendor.
+        rate_limiter : TokenBucket, optional
+            Vendor rate limiter. If provided, a token is taken before each attempt.
+        columns_key : str, optional
+            Key of the records array in the response. If provided, the records are decoded into columns.
+        decoder : callable, optional
+            Function decoding the response body, for responses which aren't JSON.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Data response in JSON format (dict) if successful, otherwise None.
+        """
+        async with cls._get_semaphore(vendor, max_concurrency):
+            return await asyncio.to_thread(
+                APIRequester.get_request,
+                url=url,
+                params=params,
+                headers=headers,
+                trials=trials,
+                pause=pause,
+                rate_limiter=rate_limiter,
+                columns_key=columns_key,
+                decoder=decoder
+            )
+
+    @classmethod
+    async def get_many(
+            cls,
+            requests_list: List[Dict[str, Any]],
+            vendor: str = 'default',
+            max_concurrency: int = 8,
+            rate_limiter: Optional[TokenBucket] = None,
+            trials: int = 3,
+            pause: float = 0.1,
+            desc: Optional[str] = None,
+            columns_key: Optional[str] = None,
+            decoder: Optional[Callable[[bytes], Any]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Submits many GET requests concurrently and returns the responses in request order.
+
+        Parameters
+        ----------
+        requests_list : list
+            List of request dictionaries with 'url' and, optionally, 'params' and 'headers' keys.
+        vendor : str, default='default'
+            Name of the vendor, used to share the concurrency limit across calls.
+        max_concurrency : int, default=8
+            Maximum number of requests in flight to the vendor.
+        rate_limiter : TokenBucket, optional
+            Vendor rate limiter shared by all requests. If None, requests are only bounded by max_concurrency.
+        trials : int, default=3
+            Maximum number of attempts to make for each request.
+        pause : float, default=0.1
+            Number of seconds to pause between failed attempts.
+        desc : str, optional
+            Description for the progress bar. If None, no progress bar is shown.
+        columns_key : str, optional
+            Key of the records array in the responses. If provided, the records are decoded into columns.
+        decoder : callable, optional
+            Function decoding the response bodies, for responses which aren't JSON.
+
+        Returns
+        -------
+        List[Optional[Dict[str, Any]]]
+            Data responses in JSON format, or None for failed requests, in the same order as requests_list.
+        """
+        pbar = tqdm(total=len(requests_list), desc=desc, unit='req') if desc else None
+
+        async def _get(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            try:
+                resp = await cls.get_request(
+                    url=request['url'],
+                    params=request.get('params'),
+                    headers=request.get('headers'),
+                    trials=trials,
+                    pause=pause,
+                    vendor=vendor,
+                    max_concurrency=max_concurrency,
+                    rate_limiter=rate_limiter,
+                    columns_key=columns_key,
+                    decoder=decoder
+                )
+            except Exception as e:
+                logger.error(f"Unexpected error during API call to {request['url']}: {e}")
+                resp = None
+
+            if pbar is not None:
+                pbar.update(1)
+
+            return resp
+
+        try:
+            return list(await asyncio.gather(*[_get(request) for request in requests_list]))
+        finally:
+            if pbar is not None:
+                pbar.close()
+
+    @staticmethod
+    def run(coro: Coroutine) -> Any:
+        """
+        Runs a coroutine to completion from synchronous code.
+
+        If an event loop is already running in this thread (e.g. in a Jupyter notebook),
+        the coroutine is run on a new event loop in a worker thread.
+
+        Parameters
+        ----------
+        coro : Coroutine
+            Coroutine to run.
+
+        Returns
+        -------
+        Any
+            Result of the coroutine.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
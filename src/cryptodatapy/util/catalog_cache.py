@@ -0,0 +1,144 @@
+import threading
+import logging
+from time import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogCache:
+    """
+    TTL-controlled in-memory cache of vendor catalogs, e.g. CoinMetrics assets, markets, indexes and fields.
+
+    Catalogs change rarely but are needed to validate every data request. Wrangled catalogs are kept for the
+    life of the process and shared by every adapter instance, so only the first request within the TTL hits
+    the vendor. Concurrent callers for the same catalog wait for a single fetch.
+    """
+
+    def __init__(self, ttl: float = 86400):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        ttl: float, default 86400
+            Number of seconds a catalog is reused before it is fetched again.
+        """
+        self.ttl = ttl
+        self._catalogs: Dict[str, Tuple[float, Any]] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(vendor: str, catalog: str, **kwargs: Any) -> str:
+        """
+        Returns the cache key for a catalog.
+
+        Parameters
+        ----------
+        vendor: str
+            Name of vendor, e.g. 'coinmetrics'.
+        catalog: str
+            Name of catalog, e.g. 'assets', 'markets'.
+        kwargs: dict
+            Arguments the catalog depends on, e.g. exchange='binance'.
+
+        Returns
+        -------
+        key: str
+            Cache key.
+        """
+        args = ','.join(f"{k}={v}" for k, v in sorted(kwargs.items()))
+        return f"{vendor}:{catalog}:{args}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Gets a fresh catalog.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+
+        Returns
+        -------
+        catalog: Any, optional
+            Cached catalog, or None if there is no catalog within its TTL.
+        """
+        with self._lock:
+            entry = self._catalogs.get(key)
+
+        if entry is None or time() - entry[0] >= self.ttl:
+            return None
+
+        return entry[1]
+
+    def store(self, key: str, catalog: Any) -> None:
+        """
+        Stores a catalog.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+        catalog: Any
+            Catalog, e.g. list of tickers or DataFrame.
+        """
+        with self._lock:
+            self._catalogs[key] = (time(), catalog)
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Gets a fresh catalog, or fetches and stores it.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+        fetch: callable
+            Function with no arguments which fetches the catalog from the vendor.
+
+        Returns
+        -------
+        catalog: Any
+            Cached or fetched catalog.
+        """
+        catalog = self.get(key)
+        if catalog is not None:
+            return catalog
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # one fetch per key, concurrent callers wait and reuse it
+        with key_lock:
+            catalog = self.get(key)
+            if catalog is None:
+                catalog = fetch()
+                if catalog is not None:
+                    self.store(key, catalog)
+
+        return catalog
+
+    def configure(self, ttl: Optional[float] = None) -> None:
+        """
+        Updates cache settings.
+
+        Parameters
+        ----------
+        ttl: float, optional, default None
+            Number of seconds a catalog is reused.
+        """
+        if ttl is not None:
+            self.ttl = ttl
+
+    def clear(self) -> None:
+        """
+        Removes all catalogs.
+        """
+        with self._lock:
+            self._catalogs.clear()
+
+
+# shared catalog cache used by vendor adapters
+catalog_cache = CatalogCache()
@@ -0,0 +1,206 @@
+import threading
+import logging
+from time import monotonic
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for a vendor.
+
+    The circuit opens after `failure_threshold` consecutive failures (network errors or 5xx responses),
+    and requests are then short-circuited for `cooldown` seconds instead of being retried. After the
+    cooldown, the circuit is half-open: a limited number of probe requests are let through, closing the
+    circuit if they succeed and re-opening it if they fail.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0, half_open_max_calls: int = 1):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        failure_threshold: int, default 5
+            Number of consecutive failures which opens the circuit.
+        cooldown: float, default 30.0
+            Number of seconds requests are short-circuited for once the circuit opens.
+        half_open_max_calls: int, default 1
+            Number of probe requests allowed when the circuit is half-open.
+        """
+        if failure_threshold < 1:
+            raise ValueError("Failure threshold must be at least 1.")
+
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Returns the state of the circuit, {'closed', 'open', 'half_open'}.
+        """
+        with self._lock:
+            if self._state == self.OPEN and monotonic() - self._opened_at >= self.cooldown:
+                self._state, self._probes = self.HALF_OPEN, 0
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Returns True if a request may be sent, False if it should be short-circuited.
+        """
+        state = self.state
+        with self._lock:
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """
+        Records a successful request, closing the circuit.
+        """
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit closed, vendor requests resumed.")
+            self._state, self._failures = self.CLOSED, 0
+
+    def record_failure(self) -> None:
+        """
+        Records a failed request, opening the circuit after too many consecutive failures
+        or a failed probe.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self._failures} consecutive failures, "
+                                   f"short-circuiting requests for {self.cooldown} seconds.")
+                self._state, self._opened_at = self.OPEN, monotonic()
+
+    def reset(self) -> None:
+        """
+        Closes the circuit and clears the failure count.
+        """
+        with self._lock:
+            self._state, self._failures, self._probes = self.CLOSED, 0, 0
+
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide registry of circuit breakers, keyed by vendor host.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0, half_open_max_calls: int = 1):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        failure_threshold: int, default 5
+            Number of consecutive failures which opens a circuit.
+        cooldown: float, default 30.0
+            Number of seconds requests are short-circuited for once a circuit opens.
+        half_open_max_calls: int, default 1
+            Number of probe requests allowed when a circuit is half-open.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """
+        Returns the circuit breaker key for a request url, i.e. its scheme and host.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url.
+
+        Returns
+        -------
+        key: str
+            Vendor host, e.g. 'https://api.llama.fi'.
+        """
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc.lower()}"
+
+    def get(self, key: str) -> CircuitBreaker:
+        """
+        Gets the circuit breaker for a vendor host, creating it if missing.
+
+        Parameters
+        ----------
+        key: str
+            Vendor host, e.g. 'https://api.llama.fi'.
+
+        Returns
+        -------
+        breaker: CircuitBreaker
+            Shared circuit breaker for the key.
+        """
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(
+                    failure_threshold=self.failure_threshold,
+                    cooldown=self.cooldown,
+                    half_open_max_calls=self.half_open_max_calls
+                )
+
+            return self._breakers[key]
+
+    def configure(
+            self,
+            failure_threshold: Optional[int] = None,
+            cooldown: Optional[float] = None,
+            half_open_max_calls: Optional[int] = None
+    ) -> None:
+        """
+        Updates the settings of existing and new circuit breakers.
+
+        Parameters
+        ----------
+        failure_threshold: int, optional, default None
+            Number of consecutive failures which opens a circuit.
+        cooldown: float, optional, default None
+            Number of seconds requests are short-circuited for once a circuit opens.
+        half_open_max_calls: int, optional, default None
+            Number of probe requests allowed when a circuit is half-open.
+        """
+        with self._lock:
+            if failure_threshold is not None:
+                self.failure_threshold = failure_threshold
+            if cooldown is not None:
+                self.cooldown = cooldown
+            if half_open_max_calls is not None:
+                self.half_open_max_calls = half_open_max_calls
+            for breaker in self._breakers.values():
+                breaker.failure_threshold = self.failure_threshold
+                breaker.cooldown = self.cooldown
+                breaker.half_open_max_calls = self.half_open_max_calls
+
+    def clear(self) -> None:
+        """
+        Removes all circuit breakers.
+        """
+        with self._lock:
+            self._breakers.clear()
+
+
+# shared registry used by every requester
+circuit_breakers = CircuitBreakerRegistry()
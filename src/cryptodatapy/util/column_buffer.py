@@ -0,0 +1,190 @@
+import io
+import logging
+from typing import Any, Dict, List, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.json as pa_json
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnBuffer:
+    """
+    Accumulates pages of columns as Arrow tables and converts them to a DataFrame once.
+
+    Each page is packed into Arrow buffers as soon as it arrives, so the Python objects of decoded pages are
+    freed page by page instead of being held until the end of pagination. Pages are cast to a common schema
+    and concatenated in one pass, with columns missing from some pages filled with nulls.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._tables: List[pa.Table] = []
+        self.num_rows = 0
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @staticmethod
+    def _to_array(values: Sequence[Any]) -> pa.Array:
+        """
+        Converts a column to an Arrow array, as strings if its values have mixed types.
+        """
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+    @staticmethod
+    def _common_type(types: List[pa.DataType]) -> pa.DataType:
+        """
+        Gets the type a column is cast to when pages inferred different types for it: the shared type,
+        float64 for mixed numeric types, or else string.
+        """
+        types = [typ for typ in types if not pa.types.is_null(typ)]
+        if not types:
+            return pa.null()
+        if all(typ == types[0] for typ in types):
+            return types[0]
+        if all(pa.types.is_integer(typ) or pa.types.is_floating(typ) for typ in types):
+            return pa.float64()
+
+        return pa.string()
+
+    def _common_schema(self) -> pa.Schema:
+        """
+        Gets the schema of the concatenated pages, with columns in order of first appearance.
+        """
+        types: Dict[str, List[pa.DataType]] = {}
+        for table in self._tables:
+            for field in table.schema:
+                types.setdefault(field.name, []).append(field.type)
+
+        return pa.schema([(name, self._common_type(col_types)) for name, col_types in types.items()])
+
+    def append(self, columns: Union[Dict[str, Sequence[Any]], pa.Table]) -> None:
+        """
+        Appends a page of columns.
+
+        Parameters
+        ----------
+        columns: dict or pa.Table
+            Dictionary of column name and list of values, e.g. a page decoded by json_decoder.decode_columns,
+            or a table, e.g. a page decoded by decode_csv.
+        """
+        if columns is None or not len(columns):
+            return
+
+        if isinstance(columns, pa.Table):
+            table = columns
+        else:
+            table = pa.table({key: self._to_array(values) for key, values in columns.items()})
+        if table.num_rows:
+            self._tables.append(table)
+            self.num_rows += table.num_rows
+
+    def extend(self, other: 'ColumnBuffer') -> None:
+        """
+        Appends the pages of another buffer.
+
+        Parameters
+        ----------
+        other: ColumnBuffer
+            Buffer to append.
+        """
+        self._tables.extend(other._tables)
+        self.num_rows += other.num_rows
+
+    def to_table(self) -> pa.Table:
+        """
+        Concatenates the pages into one Arrow table.
+
+        Returns
+        -------
+        table: pa.Table
+            Table with all pages, in order.
+        """
+        if not self._tables:
+            return pa.table({})
+
+        # types are inferred page by page, e.g. strings in one page and doubles in another
+        schema = self._common_schema()
+        tables = [
+            pa.table([
+                table.column(field.name).cast(field.type) if field.name in table.column_names
+                else pa.nulls(table.num_rows, type=field.type)
+                for field in schema
+            ], schema=schema)
+            for table in self._tables
+        ]
+
+        return pa.concat_tables(tables)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Concatenates the pages into one DataFrame, releasing the buffered pages.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            DataFrame with all pages, in order.
+        """
+        table = self.to_table()
+        self._tables, self.num_rows = [], 0
+
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def decode_csv(content: bytes, key: str = 'data') -> Dict[str, Any]:
+    """
+    Decodes a CSV response body into a table, with the vectorized pyarrow CSV reader.
+
+    Parameters
+    ----------
+    content: bytes
+        CSV document with a header row, e.g. the body of a CoinMetrics response with format=csv.
+    key: str, default 'data'
+        Key of the table in the returned page.
+
+    Returns
+    -------
+    page: dict
+        Page with the table, and column types inferred by the reader.
+    """
+    if not content or not content.strip():
+        return {key: pa.table({})}
+
+    return {key: pa_csv.read_csv(io.BytesIO(content))}
+
+
+def decode_json_stream(content: bytes, key: str = 'data') -> Dict[str, Any]:
+    """
+    Decodes a newline-delimited JSON response body into a table, with the vectorized pyarrow JSON reader.
+
+    Parameters
+    ----------
+    content: bytes
+        JSON document with one record per line, e.g. the body of a CoinMetrics response with format=json_stream.
+    key: str, default 'data'
+        Key of the table in the returned page.
+
+    Returns
+    -------
+    page: dict
+        Page with the table, and column types inferred by the reader.
+    """
+    if not content or not content.strip():
+        return {key: pa.table({})}
+
+    return {key: pa_json.read_json(io.BytesIO(content))}
+
+
+# decoders of streaming response formats, by format
+STREAM_DECODERS = {
+    'csv': decode_csv,
+    'json_stream': decode_json_stream,
+}
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import threading
+import weakref
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import ccxt
+import ccxt.async_support as ccxt_async
+
+from cryptodatapy.util.markets_cache import markets_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ExchangePool:
+    """
+    Process-wide pool of CCXT exchange instances.
+
+    Instances are keyed by exchange and options, and reused across CCXT objects and requests along with
+    their HTTP sessions and loaded markets. New instances are hydrated from the markets snapshot cache.
+    Async instances are bound to the event loop they were created on, so they are pooled per loop and
+    their sessions are closed when the loop shuts down, or on an explicit close_async.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._sync: Dict[Tuple[str, str], Any] = {}
+        self._async: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], Any]]' = \
+            weakref.WeakKeyDictionary()
+        self._closers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]' = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(exch: str, options: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+        """
+        Returns the pool key for an exchange and its options.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        options: dict, optional, default None
+            Exchange constructor options, e.g. {'enableRateLimit': True}.
+
+        Returns
+        -------
+        key: tuple
+            Exchange name and canonical options.
+        """
+        return exch, json.dumps(options or {}, sort_keys=True, default=str)
+
+    @staticmethod
+    def _create(exch: str, module: Any, options: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Creates an exchange instance, hydrated from the markets snapshot cache if available.
+        """
+        if exch not in ccxt.exchanges:
+            raise ValueError(
+                f"{exch} is not a supported exchange. Use get_exchanges_info() to get a list of supported exchanges.")
+
+        exchange = getattr(module, exch)(dict(options or {}))
+        markets_cache.hydrate(exch, exchange)
+
+        return exchange
+
+    def create(self, exch: str, options: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Creates a sync exchange instance outside the pool, e.g. for a worker thread, since sync instances
+        aren't thread-safe.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        options: dict, optional, default None
+            Exchange constructor options.
+
+        Returns
+        -------
+        exchange: ccxt.Exchange
+            New sync exchange instance.
+        """
+        return self._create(exch, ccxt, options)
+
+    def get(self, exch: str, options: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Gets the pooled sync exchange instance.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        options: dict, optional, default None
+            Exchange constructor options.
+
+        Returns
+        -------
+        exchange: ccxt.Exchange
+            Shared sync exchange instance.
+        """
+        key = self.make_key(exch, options)
+        with self._lock:
+            if key not in self._sync:
+                self._sync[key] = self._create(exch, ccxt, options)
+
+            return self._sync[key]
+
+    def get_async(self, exch: str, options: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Gets the pooled async exchange instance for the running event loop.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        options: dict, optional, default None
+            Exchange constructor options.
+
+        Returns
+        -------
+        exchange: ccxt.async_support.Exchange
+            Shared async exchange instance.
+        """
+        loop = asyncio.get_running_loop()
+        key = self.make_key(exch, options)
+        with self._lock:
+            exchanges = self._async.setdefault(loop, {})
+            if key not in exchanges:
+                exchanges[key] = self._create(exch, ccxt_async, options)
+            if loop not in self._closers:
+                self._closers[loop] = loop.create_task(self._close_on_shutdown(loop))
+
+            return exchanges[key]
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Waits until the event loop shuts down, then closes its async instances.
+
+        asyncio.run cancels pending tasks before closing the loop, which lets this task close the sessions.
+        """
+        try:
+            await asyncio.Event().wait()
+        finally:
+            with self._lock:
+                self._closers.pop(loop, None)
+            await self.close_async()
+
+    async def close_async(self) -> None:
+        """
+        Closes the sessions of the async exchange instances created on the running event loop
+        and removes them from the pool.
+        """
+        with self._lock:
+            exchanges = self._async.pop(asyncio.get_running_loop(), {})
+
+        for exchange in exchanges.values():
+            try:
+                await exchange.close()
+            except Exception as e:
+                logger.warning(f"Failed to close {exchange.id} session: {e}")
+
+    def clear(self) -> None:
+        """
+        Removes all exchange instances from the pool, without closing async sessions.
+        """
+        with self._lock:
+            self._sync.clear()
+            self._async.clear()
+
+
+# shared pool used by every CCXT instance
+exchange_pool = ExchangePool()
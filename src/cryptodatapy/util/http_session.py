@@ -0,0 +1,173 @@
+import threading
+import logging
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool:
+    """
+    Thread-safe registry of keep-alive HTTP sessions, one per host.
+
+    Reusing a session for every request to the same host keeps the underlying
+    TCP/TLS connections open, so paginated and batched requests avoid paying a
+    new handshake on every call.
+    """
+
+    def __init__(
+            self,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            keep_alive: bool = True,
+            connect_timeout: float = 10.0,
+            read_timeout: float = 60.0
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        pool_connections: int, default 10
+            Number of connection pools to cache per session.
+        pool_maxsize: int, default 10
+            Maximum number of connections kept alive per pool. Should be at least the number of
+            threads issuing requests to the same host concurrently.
+        keep_alive: bool, default True
+            Keeps connections open between requests. If False, each response closes its connection.
+        connect_timeout: float, default 10.0
+            Seconds to wait for a connection to be established.
+        read_timeout: float, default 60.0
+            Seconds to wait for the server to send a response.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """
+        Returns the (connect, read) timeout tuple passed to each request.
+        """
+        return self.connect_timeout, self.read_timeout
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        """
+        Returns the scheme and host of a url, used as the session key.
+        """
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Creates a new session with a pooled HTTP adapter mounted.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Gets the session for the url's host, creating it if missing.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url for the request.
+
+        Returns
+        -------
+        session: requests.Session
+            Shared session for the url's host.
+        """
+        host = self._get_host(url)
+
+        with self._lock:
+            if host not in self._sessions:
+                logger.debug(f"Creating HTTP session for {host}.")
+                self._sessions[host] = self._create_session()
+
+            return self._sessions[host]
+
+    def get(self, url: str, timeout: Optional[Tuple[float, float]] = None, **kwargs) -> requests.Response:
+        """
+        Submits a GET request through the pooled session for the url's host.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url for the request.
+        timeout: tuple, optional, default None
+            (connect, read) timeout in seconds. Defaults to the pool timeout.
+        kwargs: additional keyword arguments passed to requests.Session.get (params, headers, etc.).
+
+        Returns
+        -------
+        resp: requests.Response
+            Response object.
+        """
+        return self.get_session(url).get(url, timeout=timeout or self.timeout, **kwargs)
+
+    def configure(
+            self,
+            pool_connections: Optional[int] = None,
+            pool_maxsize: Optional[int] = None,
+            keep_alive: Optional[bool] = None,
+            connect_timeout: Optional[float] = None,
+            read_timeout: Optional[float] = None
+    ) -> None:
+        """
+        Updates pool settings. Existing sessions are closed and recreated on next use.
+
+        Parameters
+        ----------
+        pool_connections: int, optional, default None
+            Number of connection pools to cache per session.
+        pool_maxsize: int, optional, default None
+            Maximum number of connections kept alive per pool.
+        keep_alive: bool, optional, default None
+            Keeps connections open between requests.
+        connect_timeout: float, optional, default None
+            Seconds to wait for a connection to be established.
+        read_timeout: float, optional, default None
+            Seconds to wait for the server to send a response.
+        """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if keep_alive is not None:
+            self.keep_alive = keep_alive
+        if connect_timeout is not None:
+            self.connect_timeout = connect_timeout
+        if read_timeout is not None:
+            self.read_timeout = read_timeout
+
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes all sessions and their open connections.
+        """
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# shared pool used by every adapter and vendor class
+session_pool = SessionPool()
@@ -0,0 +1,146 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# optional fast decoders, in order of preference
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+class JSONDecoder:
+    """
+    Pluggable JSON decoder for API responses.
+
+    Uses orjson or simdjson when installed, falling back to the standard library json module. Also
+    decodes the records array of a page (e.g. the 'data' array of CoinMetrics responses) into
+    columns, which builds DataFrames much faster than a list of dicts.
+    """
+
+    BACKENDS = ['orjson', 'simdjson', 'json']
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        backend: str, {'orjson', 'simdjson', 'json'}, optional, default None
+            JSON library used to decode responses. If None, the fastest installed library is used.
+        """
+        self.backend = None
+        self.set_backend(backend)
+
+    @staticmethod
+    def _is_available(backend: str) -> bool:
+        """
+        Returns True if the backend library is installed.
+        """
+        return {'orjson': orjson is not None, 'simdjson': simdjson is not None, 'json': True}[backend]
+
+    def set_backend(self, backend: Optional[str] = None) -> None:
+        """
+        Sets the JSON library used to decode responses.
+
+        Parameters
+        ----------
+        backend: str, {'orjson', 'simdjson', 'json'}, optional, default None
+            JSON library. If None, the fastest installed library is used.
+        """
+        if backend is None:
+            backend = next(b for b in self.BACKENDS if self._is_available(b))
+        elif backend not in self.BACKENDS:
+            raise ValueError(f"Invalid JSON backend. Valid backends are: {self.BACKENDS}")
+        elif not self._is_available(backend):
+            raise ImportError(f"{backend} is not installed. Install it with 'pip install {backend}'.")
+
+        self.backend = backend
+        logger.debug(f"Using {backend} to decode JSON responses.")
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document.
+
+        Parameters
+        ----------
+        content: bytes or str
+            JSON document, e.g. the body of a response.
+
+        Returns
+        -------
+        obj: Any
+            Decoded object.
+        """
+        if self.backend == 'orjson':
+            return orjson.loads(content)
+        if self.backend == 'simdjson':
+            return simdjson.loads(content)
+
+        return json.loads(content)
+
+    @staticmethod
+    def records_to_columns(records: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Converts a list of records to a dictionary of columns.
+
+        Keys missing from some records are filled with None, and columns are ordered by first appearance.
+
+        Parameters
+        ----------
+        records: list
+            List of dictionaries, e.g. [{'time': ..., 'asset': 'btc', 'PriceUSD': ...}, ...].
+
+        Returns
+        -------
+        columns: dict
+            Dictionary of column name and list of values.
+        """
+        if not records:
+            return {}
+
+        # fast path for records with the same keys, the common case for vendor pages
+        keys = list(records[0])
+        if all(len(record) == len(keys) for record in records):
+            try:
+                return {key: [record[key] for record in records] for key in keys}
+            except KeyError:
+                pass
+
+        keys = list(dict.fromkeys(key for record in records for key in record))
+
+        return {key: [record.get(key) for record in records] for key in keys}
+
+    def decode_columns(self, content: Union[bytes, str], key: str = 'data') -> Dict[str, Any]:
+        """
+        Decodes a JSON page and converts its records array to columns.
+
+        Parameters
+        ----------
+        content: bytes or str
+            JSON document, e.g. the body of a CoinMetrics response.
+        key: str, default 'data'
+            Key of the records array in the page.
+
+        Returns
+        -------
+        page: dict
+            Decoded page, with the records array replaced by a dictionary of columns.
+            Other keys (e.g. 'next_page_url') are left unchanged.
+        """
+        page = self.loads(content)
+        if isinstance(page, list):
+            page = {key: page}
+        page[key] = self.records_to_columns(page.get(key) or [])
+
+        return page
+
+
+# shared decoder used by every requester
+json_decoder = JSONDecoder()
@@ -0,0 +1,223 @@
+import json
+import os
+import tempfile
+import threading
+import logging
+from time import time
+from typing import Any, Dict, Optional
+
+from cryptodatapy.util.json_decoder import json_decoder
+
+logger = logging.getLogger(__name__)
+
+
+class MarketsCache:
+    """
+    TTL-controlled snapshot cache of CCXT exchange markets, currencies and timeframes.
+
+    Loading markets downloads several MB from large exchanges on every new exchange instance.
+    Snapshots are kept in memory for the life of the process, so exchange instances are hydrated with
+    set_markets instead. With persist, snapshots are also stored on disk in cache_dir and shared across
+    processes. The global markets_cache persists only when CRYPTODATAPY_CACHE_DIR is set.
+    """
+
+    def __init__(
+            self,
+            cache_dir: Optional[str] = None,
+            ttl: float = 86400,
+            persist: bool = False
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        cache_dir: str, optional, default None
+            Directory where snapshots are stored. Defaults to ~/.cache/cryptodatapy/ccxt.
+        ttl: float, default 86400
+            Number of seconds a snapshot is reused before markets are reloaded from the exchange.
+        persist: bool, default False
+            Stores snapshots on disk, in addition to memory.
+        """
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'cryptodatapy', 'ccxt')
+        self.ttl = ttl
+        self.persist = persist
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_path(self, exch: str) -> str:
+        """
+        Returns the snapshot file path for an exchange.
+        """
+        return os.path.join(self.cache_dir, f"{exch}.json")
+
+    def get(self, exch: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets the fresh snapshot for an exchange.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+
+        Returns
+        -------
+        snapshot: dict, optional
+            Dictionary with markets, currencies, timeframes and stored_at keys, or None if there is
+            no snapshot within its TTL.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(exch)
+
+        if snapshot is None and self.persist:
+            try:
+                with open(self._get_path(exch), 'rb') as f:
+                    snapshot = json_decoder.loads(f.read())
+            except (OSError, ValueError):
+                snapshot = None
+
+        if snapshot is None or time() - snapshot.get('stored_at', 0) >= self.ttl:
+            return None
+
+        with self._lock:
+            self._snapshots[exch] = snapshot
+
+        return snapshot
+
+    def store(self, exch: str, exchange: Any) -> None:
+        """
+        Stores a snapshot of an exchange's loaded markets.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        exchange: ccxt.Exchange
+            Exchange instance with loaded markets.
+        """
+        snapshot = {
+            'markets': exchange.markets,
+            'currencies': exchange.currencies,
+            'timeframes': exchange.timeframes,
+            'stored_at': time()
+        }
+        with self._lock:
+            self._snapshots[exch] = snapshot
+
+        if not self.persist:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(snapshot, f, default=str)
+                os.replace(tmp_path, self._get_path(exch))
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to store markets snapshot for {exch}: {e}")
+
+    def hydrate(self, exch: str, exchange: Any) -> bool:
+        """
+        Hydrates an exchange instance from the snapshot, without a network request.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        exchange: ccxt.Exchange
+            Sync or async exchange instance.
+
+        Returns
+        -------
+        hydrated: bool
+            True if the exchange was hydrated, False if there is no fresh snapshot.
+        """
+        snapshot = self.get(exch)
+        if snapshot is None:
+            return False
+
+        exchange.set_markets(snapshot['markets'], snapshot['currencies'])
+        if snapshot.get('timeframes'):
+            exchange.timeframes = snapshot['timeframes']
+
+        return True
+
+    def load_markets(self, exch: str, exchange: Any, reload: bool = False) -> Dict[str, Any]:
+        """
+        Loads markets for a sync exchange instance, from the snapshot if fresh or else from the exchange.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        exchange: ccxt.Exchange
+            Sync exchange instance.
+        reload: bool, default False
+            Reloads markets from the exchange and refreshes the snapshot.
+
+        Returns
+        -------
+        markets: dict
+            Dictionary of markets, by symbol.
+        """
+        if exchange.markets and not reload:
+            return exchange.markets
+        if not reload and self.hydrate(exch, exchange):
+            return exchange.markets
+
+        markets = exchange.load_markets(reload=reload)
+        self.store(exch, exchange)
+
+        return markets
+
+    def configure(
+            self,
+            cache_dir: Optional[str] = None,
+            ttl: Optional[float] = None,
+            persist: Optional[bool] = None
+    ) -> None:
+        """
+        Updates cache settings.
+
+        Parameters
+        ----------
+        cache_dir: str, optional, default None
+            Directory where snapshots are stored.
+        ttl: float, optional, default None
+            Number of seconds a snapshot is reused.
+        persist: bool, optional, default None
+            Stores snapshots on disk, in addition to memory.
+        """
+        if cache_dir is not None:
+            self.cache_dir = cache_dir
+        if ttl is not None:
+            self.ttl = ttl
+        if persist is not None:
+            self.persist = persist
+
+    def clear(self) -> None:
+        """
+        Removes all snapshots, in memory and on disk.
+        """
+        with self._lock:
+            self._snapshots.clear()
+
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        for file in os.listdir(self.cache_dir):
+            if file.endswith('.json'):
+                os.remove(os.path.join(self.cache_dir, file))
+
+
+# shared snapshot cache used by every CCXT instance
+# set CRYPTODATAPY_CACHE_DIR to a directory to persist snapshots across processes
+markets_cache = MarketsCache(
+    cache_dir=os.path.join(os.environ['CRYPTODATAPY_CACHE_DIR'], 'ccxt')
+    if os.environ.get('CRYPTODATAPY_CACHE_DIR') else None,
+    persist=bool(os.environ.get('CRYPTODATAPY_CACHE_DIR'))
+)
@@ -0,0 +1,150 @@
+import logging
+from email.utils import parsedate_to_datetime
+from time import time
+from typing import Dict, Mapping, Optional
+
+import requests
+
+from cryptodatapy.util.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class PacingController:
+    """
+    Adapts request pacing to the rate-limit headers sent by vendors.
+
+    Reads Retry-After, X-RateLimit-Remaining and X-RateLimit-Reset (or their RateLimit-* equivalents) from
+    each response and adjusts the vendor's rate limiter: the rate is raised when plenty of quota is left,
+    lowered as the quota runs out, and requests are blocked until the advertised reset on 429 responses.
+    """
+
+    def __init__(self, min_factor: float = 0.1, max_factor: float = 2.0, safety_margin: float = 0.1):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        min_factor: float, default 0.1
+            Lowest allowed rate, as a multiple of the limiter's configured base rate.
+        max_factor: float, default 2.0
+            Highest allowed rate, as a multiple of the limiter's configured base rate.
+        safety_margin: float, default 0.1
+            Fraction of the remaining quota left unused, to absorb requests from other clients of the same key.
+        """
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.safety_margin = safety_margin
+
+    @staticmethod
+    def _get_header(headers: Mapping[str, str], *names: str) -> Optional[str]:
+        """
+        Returns the value of the first header found, or None.
+        """
+        for name in names:
+            value = headers.get(name)
+            if value is not None:
+                return value
+
+        return None
+
+    @staticmethod
+    def _to_seconds(value: Optional[str], now: float) -> Optional[float]:
+        """
+        Converts a reset or retry header value to a number of seconds from now.
+
+        Accepts delta seconds, Unix timestamps in seconds or milliseconds, and HTTP dates.
+        """
+        if value is None:
+            return None
+
+        try:
+            num = float(value)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+            except (TypeError, ValueError):
+                return None
+
+        if num > 1e12:  # timestamp in milliseconds
+            num = num / 1000 - now
+        elif num > 1e9:  # timestamp in seconds
+            num = num - now
+
+        return max(0.0, num)
+
+    def parse_headers(self, headers: Mapping[str, str]) -> Dict[str, Optional[float]]:
+        """
+        Parses rate-limit headers.
+
+        Parameters
+        ----------
+        headers: Mapping
+            Response headers (case-insensitive, as in requests.Response.headers).
+
+        Returns
+        -------
+        rate_limit: dict
+            Dictionary with retry_after and reset (seconds from now) and remaining (number of requests),
+            None where the header is missing.
+        """
+        now = time()
+        remaining = self._get_header(headers, 'X-RateLimit-Remaining', 'RateLimit-Remaining')
+        try:
+            remaining = float(remaining) if remaining is not None else None
+        except ValueError:
+            remaining = None
+
+        return {
+            'retry_after': self._to_seconds(self._get_header(headers, 'Retry-After'), now),
+            'remaining': remaining,
+            'reset': self._to_seconds(self._get_header(headers, 'X-RateLimit-Reset', 'RateLimit-Reset'), now)
+        }
+
+    def update(self, resp: Optional[requests.Response], rate_limiter: Optional[TokenBucket] = None) -> Optional[float]:
+        """
+        Updates pacing from a response and returns how long to wait before retrying.
+
+        Parameters
+        ----------
+        resp: requests.Response, optional
+            Response object. If None (e.g. network error), pacing is left unchanged.
+        rate_limiter: TokenBucket, optional, default None
+            Vendor rate limiter to adjust.
+
+        Returns
+        -------
+        wait: float, optional
+            Number of seconds the caller should sleep before retrying. 0 if the wait is enforced by the
+            rate limiter, None if the response does not advertise one.
+        """
+        if resp is None:
+            return None
+
+        rate_limit = self.parse_headers(resp.headers)
+        retry_after, remaining, reset = rate_limit['retry_after'], rate_limit['remaining'], rate_limit['reset']
+
+        # quota exhausted, wait until the advertised reset
+        if resp.status_code in (429, 503) or remaining == 0:
+            wait = retry_after if retry_after is not None else reset
+            if wait is None:
+                return None
+            logger.warning(f"Rate limit reached ({resp.status_code}), waiting {wait:.2f} seconds.")
+            if rate_limiter is None:
+                return wait
+            rate_limiter.block(wait)
+            return 0.0
+
+        # spread the remaining quota over the time left in the window
+        if rate_limiter is not None and remaining is not None and reset:
+            target = remaining * (1 - self.safety_margin) / reset
+            rate = min(max(target, rate_limiter.base_rate * self.min_factor), rate_limiter.base_rate * self.max_factor)
+            if rate != rate_limiter.rate:
+                logger.debug(f"Adjusting pace to {rate:.2f} req/s ({remaining:.0f} requests left).")
+                rate_limiter.adjust_rate(rate)
+
+        return None
+
+
+# shared controller used by every requester
+pacing = PacingController()
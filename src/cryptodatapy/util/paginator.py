@@ -0,0 +1,201 @@
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class Paginator:
+    """
+    Pipelined pagination engine.
+
+    Pages are fetched in a background thread while the caller parses the previous page, so long paginated
+    pulls are bound by the network rather than by network + parsing time. Supports:
+
+    - cursor pagination (e.g. next_page_url), where the next request is read from the current page,
+    - walk-back pagination (e.g. toTs, toISO), where the next request is built from the oldest timestamp
+      of the current page,
+    - window pagination (e.g. ISO start/end windows), where all requests are known upfront and up to
+      `prefetch` pages are fetched ahead.
+    """
+
+    def __init__(
+            self,
+            fetch: Callable[[Any], Optional[Any]],
+            first_request: Optional[Any] = None,
+            next_request: Optional[Callable[[Any, Any], Optional[Any]]] = None,
+            requests: Optional[Iterable[Any]] = None,
+            parse: Optional[Callable[[Any], Any]] = None,
+            prefetch: int = 2,
+            max_pages: Optional[int] = None,
+            allow_partial: bool = False
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        fetch: Callable
+            Function fetching a page for a request, returning the decoded page or None on failure.
+        first_request: Any, optional, default None
+            First request, for cursor and walk-back pagination.
+        next_request: Callable, optional, default None
+            Function returning the next request from the current request and page, or None when pagination
+            is complete. It runs before the page is parsed, so it should only read what it needs from the page.
+        requests: Iterable, optional, default None
+            Requests known upfront, for window pagination. Used instead of first_request and next_request.
+        parse: Callable, optional, default None
+            Function parsing a page, e.g. into a DataFrame. It runs while the next page is fetched.
+            If None, pages are returned as fetched.
+        prefetch: int, default 2
+            Maximum number of pages fetched ahead of the page being parsed, for window pagination.
+            Cursor and walk-back pagination can only fetch one page ahead.
+        max_pages: int, optional, default None
+            Maximum number of pages to fetch.
+        allow_partial: bool, default False
+            If True, a failed page is skipped with a warning: cursor and walk-back pagination stop and return the
+            pages fetched so far, window pagination moves on to the next window. Otherwise, an exception is raised
+            so a partial history is never returned as complete. A failed first cursor page returns no pages.
+        """
+        if requests is None and (first_request is None or next_request is None):
+            raise ValueError("Either requests, or first_request and next_request, must be provided.")
+        if prefetch < 1:
+            raise ValueError("Prefetch must be at least 1.")
+
+        self.fetch = fetch
+        self.first_request = first_request
+        self.next_request = next_request
+        self.requests = requests
+        self.parse = parse
+        self.prefetch = prefetch
+        self.max_pages = max_pages
+        self.allow_partial = allow_partial
+
+    def _parse(self, page: Any) -> Any:
+        """
+        Parses a page, if a parser was provided.
+        """
+        return self.parse(page) if self.parse is not None else page
+
+    def _on_failed_page(self, page_count: int) -> None:
+        """
+        Handles a failed page which leaves a gap in the history, raising unless partial results are allowed.
+        """
+        if not self.allow_partial:
+            raise Exception(f"Failed to fetch page {page_count} after multiple attempts. "
+                            f"The pages fetched so far are an incomplete history.")
+        logger.warning(f"Failed to fetch page {page_count}, skipping it.")
+
+    def _iter_cursor(self, executor: ThreadPoolExecutor) -> Iterator[Any]:
+        """
+        Iterates over pages whose next request depends on the current page.
+        """
+        request, page_count = self.first_request, 1
+        future = executor.submit(self.fetch, request)
+
+        while future is not None:
+            page = future.result()
+            if page is None:
+                if page_count > 1:
+                    self._on_failed_page(page_count)
+                break
+
+            # request the next page before parsing the current one
+            future = None
+            if self.max_pages is None or page_count < self.max_pages:
+                request = self.next_request(request, page)
+                if request is not None:
+                    future = executor.submit(self.fetch, request)
+                    page_count += 1
+
+            yield self._parse(page)
+
+    def _iter_windows(self, executor: ThreadPoolExecutor) -> Iterator[Any]:
+        """
+        Iterates over pages for requests known upfront, in request order.
+        """
+        requests = iter(self.requests)
+        futures: deque = deque()
+        page_count = 0
+
+        def _submit() -> None:
+            nonlocal page_count
+            if self.max_pages is not None and page_count >= self.max_pages:
+                return
+            request = next(requests, None)
+            if request is not None:
+                futures.append(executor.submit(self.fetch, request))
+                page_count += 1
+
+        for _ in range(self.prefetch):
+            _submit()
+
+        n_pages = 0
+        while futures:
+            page = futures.popleft().result()
+            n_pages += 1
+            _submit()
+            if page is None:
+                # a failed window is a gap in the history, whichever window it is
+                self._on_failed_page(n_pages)
+                continue
+            yield self._parse(page)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over parsed pages.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.prefetch if self.requests is not None else 1)
+        try:
+            if self.requests is not None:
+                yield from self._iter_windows(executor)
+            else:
+                yield from self._iter_cursor(executor)
+        finally:
+            # don't wait for pages prefetched after the caller stopped iterating
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def collect(self) -> List[Any]:
+        """
+        Fetches and parses all pages.
+
+        Returns
+        -------
+        pages: list
+            List of parsed pages, in page order.
+        """
+        return list(self)
+
+
+def split_date_range(
+        start_date: Any,
+        end_date: Any,
+        window: Any
+) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    Splits a date range into consecutive windows, for window pagination.
+
+    Parameters
+    ----------
+    start_date: str, datetime or pd.Timestamp
+        Start of the date range.
+    end_date: str, datetime or pd.Timestamp
+        End of the date range.
+    window: str or pd.Timedelta
+        Length of each window, e.g. '30D'.
+
+    Returns
+    -------
+    windows: list
+        List of (start, end) tuples. The last window ends at end_date.
+    """
+    start, end, window = pd.Timestamp(start_date), pd.Timestamp(end_date), pd.Timedelta(window)
+    windows = []
+    while start < end:
+        windows.append((start, min(start + window, end)))
+        start = start + window
+
+    return windows
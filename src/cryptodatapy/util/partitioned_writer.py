@@ -0,0 +1,189 @@
+import os
+import logging
+from itertools import count
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+from uuid import uuid4
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+DAY_MS = 86_400_000
+
+
+class PartitionedWriter:
+    """
+    Spills pages of tick data to chunked columnar files, partitioned by ticker and day.
+
+    Pages are buffered per ticker and day and written to a new part file once a partition reaches chunk_rows
+    rows, or once a later day starts for the ticker. Only the open partitions are held in memory, so histories
+    far larger than RAM can be written. Files are laid out as <path>/ticker=<ticker>/date=<YYYY-MM-DD>/ and read
+    back lazily with dataset().
+
+    The part files already in a partition are removed before the writer's first file for it is written, so
+    re-running a download into the same path replaces the partitions it writes instead of duplicating their rows.
+    Other partitions are kept.
+    """
+
+    FORMATS = ['parquet', 'ipc']
+
+    def __init__(
+            self,
+            path: str,
+            schema: pa.Schema,
+            time_col: str = 'timestamp',
+            file_format: str = 'parquet',
+            chunk_rows: int = 1_000_000,
+            compression: Optional[str] = 'zstd'
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str
+            Root directory of the dataset.
+        schema: pa.Schema
+            Schema of the pages, e.g. timestamp, price and amount columns.
+        time_col: str, default 'timestamp'
+            Name of the column with timestamps, as a timestamp type or in milliseconds since Unix epoch, used to
+            partition by day.
+        file_format: str, {'parquet', 'ipc'}, default 'parquet'
+            Format of the part files. 'ipc' writes Arrow IPC (Feather V2) files.
+        chunk_rows: int, default 1,000,000
+            Maximum number of rows buffered per partition before it is written to a part file.
+        compression: str, optional, default 'zstd'
+            Compression codec of the part files.
+        """
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Invalid file format. Valid formats are: {self.FORMATS}")
+
+        self.path = path
+        self.schema = schema
+        self.time_col = time_col
+        self.file_format = file_format
+        self.chunk_rows = chunk_rows
+        self.compression = compression
+        self.rows_written = 0
+
+        self._buffers: Dict[Tuple[str, int], List[pa.Table]] = {}
+        self._buffered_rows: Dict[Tuple[str, int], int] = {}
+        self._part = count()
+        self._replaced: set = set()  # partitions whose existing part files were removed
+        self._prefix = uuid4().hex[:8]  # avoids overwriting parts from other writers
+
+    def __enter__(self) -> 'PartitionedWriter':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _get_partition_dir(self, ticker: str, day: int) -> str:
+        """
+        Returns the directory of a ticker and day partition.
+        """
+        date = np.datetime64(day, 'D').astype(str)
+        return os.path.join(self.path, f"ticker={quote(ticker, safe='')}", f"date={date}")
+
+    def write(self, ticker: str, columns: Dict[str, Sequence]) -> None:
+        """
+        Buffers a page of rows for a ticker, writing full or finished partitions to disk.
+
+        Parameters
+        ----------
+        ticker: str
+            Ticker or market symbol of the page.
+        columns: dict
+            Dictionary of column values, by column name in the schema.
+        """
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+        if table.num_rows == 0:
+            return
+
+        # split page by day
+        times = table.column(self.time_col)
+        if pa.types.is_timestamp(times.type):
+            times = times.cast(pa.timestamp('ms'), safe=False)
+        ts = times.cast(pa.int64()).to_numpy()
+        days = ts // DAY_MS
+        for day in np.unique(days):
+            part = table.filter(pa.array(days == day))
+            key = (ticker, int(day))
+            self._buffers.setdefault(key, []).append(part)
+            self._buffered_rows[key] = self._buffered_rows.get(key, 0) + part.num_rows
+            if self._buffered_rows[key] >= self.chunk_rows:
+                self._flush_partition(key)
+
+        # pages arrive in time order, earlier days are finished
+        last_day = int(days.max())
+        for key in [key for key in self._buffers if key[0] == ticker and key[1] < last_day]:
+            self._flush_partition(key)
+
+    def _flush_partition(self, key: Tuple[str, int]) -> None:
+        """
+        Writes the buffered rows of a partition to a new part file.
+        """
+        tables = self._buffers.pop(key, [])
+        self._buffered_rows.pop(key, None)
+        if not tables:
+            return
+
+        table = pa.concat_tables(tables)
+        partition_dir = self._get_partition_dir(*key)
+        os.makedirs(partition_dir, exist_ok=True)
+        if key not in self._replaced:
+            self._remove_parts(partition_dir)
+            self._replaced.add(key)
+        file_path = os.path.join(partition_dir, f"part-{self._prefix}-{next(self._part):06d}.{self.file_format}")
+
+        if self.file_format == 'parquet':
+            pq.write_table(table, file_path, compression=self.compression)
+        else:
+            feather.write_feather(table, file_path, compression=self.compression)
+        self.rows_written += table.num_rows
+
+    @staticmethod
+    def _remove_parts(partition_dir: str) -> None:
+        """
+        Removes the part files left in a partition by a previous download.
+        """
+        for file in os.listdir(partition_dir):
+            if file.startswith('part-'):
+                os.remove(os.path.join(partition_dir, file))
+                logger.info(f"Replaced {os.path.join(partition_dir, file)}.")
+
+    def flush(self) -> None:
+        """
+        Writes all buffered rows to disk.
+        """
+        for key in list(self._buffers):
+            self._flush_partition(key)
+
+    def close(self) -> None:
+        """
+        Writes all buffered rows to disk and logs the number of rows written.
+        """
+        self.flush()
+        logger.info(f"Wrote {self.rows_written} rows to {self.path}.")
+
+    def dataset(self) -> ds.Dataset:
+        """
+        Returns a lazy handle to the written dataset.
+
+        Returns
+        -------
+        dataset: pyarrow.dataset.Dataset
+            Dataset with the page columns and ticker and date partition columns. Use to_table(filter=...)
+            or to_batches() to read it in chunks.
+        """
+        return ds.dataset(
+            self.path,
+            schema=self.schema.append(pa.field('ticker', pa.string())).append(pa.field('date', pa.string())),
+            format='parquet' if self.file_format == 'parquet' else 'ipc',
+            partitioning='hive'
+        )
@@ -0,0 +1,430 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import logging
+from time import monotonic, sleep, time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteRateLimitBackend:
+    """
+    Token-bucket state stored in a SQLite database, shared by every process on the host.
+
+    Each reservation runs in an exclusive transaction, so parallel workers pointed at the same
+    database file draw from one quota per vendor instead of pacing themselves independently.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str
+            Path to the SQLite database file. Created if missing.
+        timeout: float, default 30.0
+            Seconds to wait for another process to release the database lock.
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+        # create table
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, last REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Gets the connection for the current thread and process, creating it if missing.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+
+        return conn
+
+    def reserve(self, key: str, tokens: int, rate: float, burst: int) -> float:
+        """
+        Takes tokens from the shared bucket and returns how long the caller must wait before using them.
+
+        Parameters
+        ----------
+        key: str
+            Vendor or host name.
+        tokens: int
+            Number of tokens to take.
+        rate: float
+            Number of requests allowed per second.
+        burst: int
+            Maximum number of requests which can be made back-to-back.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds to wait before making the request.
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time()
+            row = conn.execute("SELECT tokens, last FROM buckets WHERE key = ?", (key,)).fetchone()
+            # refill
+            available = float(burst) if row is None else min(burst, row[0] + max(0.0, now - row[1]) * rate)
+            available -= tokens
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, last) VALUES (?, ?, ?)", (key, available, now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return 0.0 if available >= 0 else -available / rate
+
+    def block(self, key: str, seconds: float, rate: float, burst: int) -> None:
+        """
+        Empties the shared bucket so that no process makes a request for the given number of seconds.
+
+        Parameters
+        ----------
+        key: str
+            Vendor or host name.
+        seconds: float
+            Number of seconds to block requests for.
+        rate: float
+            Number of requests allowed per second.
+        burst: int
+            Maximum number of requests which can be made back-to-back.
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time()
+            row = conn.execute("SELECT tokens, last FROM buckets WHERE key = ?", (key,)).fetchone()
+            available = float(burst) if row is None else min(burst, row[0] + max(0.0, now - row[1]) * rate)
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, last) VALUES (?, ?, ?)",
+                (key, min(available, -seconds * rate), now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """
+        Removes the stored state for a key, or for all keys.
+
+        Parameters
+        ----------
+        key: str, optional, default None
+            Vendor or host name. If None, all buckets are removed.
+        """
+        if key is None:
+            self._connect().execute("DELETE FROM buckets")
+        else:
+            self._connect().execute("DELETE FROM buckets WHERE key = ?", (key,))
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each request takes a token,
+    waiting only as long as needed for one to become available, so requests run at the vendor's
+    allowed rate instead of sleeping a fixed pause after every call.
+
+    By default tokens are held in memory and shared by the threads of one process. With a backend,
+    they are held in a store shared by several processes.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int = 1,
+            key: Optional[str] = None,
+            backend: Optional[SQLiteRateLimitBackend] = None
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        rate: float
+            Number of requests allowed per second.
+        burst: int, default 1
+            Maximum number of requests which can be made back-to-back when the bucket is full.
+        key: str, optional, default None
+            Vendor or host name, used to identify the bucket in the backend.
+        backend: SQLiteRateLimitBackend, optional, default None
+            Cross-process token store. If None, tokens are held in memory.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be a positive number of requests per second.")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1.")
+
+        self.rate = float(rate)
+        self.base_rate = self.rate
+        self.burst = int(burst)
+        self.key = key
+        self.backend = backend
+        self._tokens = float(burst)
+        self._last = monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """
+        Adds the tokens accrued since the last refill, up to the burst size.
+        """
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Takes tokens from the bucket and returns how long the caller must wait before using them.
+
+        Tokens are reserved immediately, even when the bucket is empty, so concurrent callers are
+        served in order.
+
+        Parameters
+        ----------
+        tokens: int, default 1
+            Number of tokens to take.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds to wait before making the request.
+        """
+        if self.backend is not None:
+            return self.backend.reserve(self.key, tokens, self.rate, self.burst)
+
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Blocks until tokens are available.
+
+        Parameters
+        ----------
+        tokens: int, default 1
+            Number of tokens to take.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            sleep(wait)
+
+        return wait
+
+    async def acquire_async(self, tokens: int = 1) -> float:
+        """
+        Waits without blocking the event loop until tokens are available.
+
+        Parameters
+        ----------
+        tokens: int, default 1
+            Number of tokens to take.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def configure(self, rate: Optional[float] = None, burst: Optional[int] = None) -> None:
+        """
+        Updates the rate and/or burst size.
+
+        Parameters
+        ----------
+        rate: float, optional, default None
+            Number of requests allowed per second.
+        burst: int, optional, default None
+            Maximum number of requests which can be made back-to-back.
+        """
+        with self._lock:
+            self._refill()
+            if rate is not None:
+                if rate <= 0:
+                    raise ValueError("Rate must be a positive number of requests per second.")
+                self.rate = float(rate)
+                self.base_rate = self.rate
+            if burst is not None:
+                if burst < 1:
+                    raise ValueError("Burst must be at least 1.")
+                self.burst = int(burst)
+                self._tokens = min(self._tokens, self.burst)
+
+    def adjust_rate(self, rate: float) -> None:
+        """
+        Sets the current rate, e.g. from vendor rate-limit headers, keeping the configured base rate.
+
+        Parameters
+        ----------
+        rate: float
+            Number of requests allowed per second.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be a positive number of requests per second.")
+
+        with self._lock:
+            self._refill()
+            self.rate = float(rate)
+
+    def block(self, seconds: float) -> None:
+        """
+        Empties the bucket so that no request is made for the given number of seconds.
+
+        Parameters
+        ----------
+        seconds: float
+            Number of seconds to block requests for, e.g. the Retry-After value of a 429 response.
+        """
+        if self.backend is not None:
+            self.backend.block(self.key, seconds, self.rate, self.burst)
+            return
+
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimiterRegistry:
+    """
+    Process-wide registry of token-bucket rate limiters, keyed by vendor or host.
+
+    Every adapter, vendor class and fetch loop targeting the same vendor shares one limiter,
+    so their requests are paced together. With a backend, limiters are also shared across processes.
+    """
+
+    def __init__(
+            self,
+            default_rate: float = 10.0,
+            default_burst: int = 1,
+            backend: Optional[SQLiteRateLimitBackend] = None
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        default_rate: float, default 10.0
+            Requests per second for limiters created without an explicit rate.
+        default_burst: int, default 1
+            Burst size for limiters created without an explicit burst.
+        backend: SQLiteRateLimitBackend, optional, default None
+            Cross-process token store. If None, limiters are local to the process.
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.backend = backend
+        self._limiters: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, rate: Optional[float] = None, burst: Optional[int] = None) -> TokenBucket:
+        """
+        Gets the limiter for a vendor or host, creating it if missing.
+
+        The rate and burst seed a new limiter only; use configure() to change an existing one.
+
+        Parameters
+        ----------
+        key: str
+            Vendor or host name, e.g. 'coinmetrics', 'ccxt:binance'.
+        rate: float, optional, default None
+            Requests per second for a new limiter.
+        burst: int, optional, default None
+            Burst size for a new limiter.
+
+        Returns
+        -------
+        limiter: TokenBucket
+            Shared limiter for the key.
+        """
+        with self._lock:
+            if key not in self._limiters:
+                self._limiters[key] = TokenBucket(
+                    rate=rate if rate is not None else self.default_rate,
+                    burst=burst if burst is not None else self.default_burst,
+                    key=key,
+                    backend=self.backend
+                )
+                logger.debug(f"Created rate limiter for {key}: {self._limiters[key].rate:.2f} req/s.")
+
+            return self._limiters[key]
+
+    def configure(self, key: str, rate: Optional[float] = None, burst: Optional[int] = None) -> TokenBucket:
+        """
+        Sets the rate and/or burst size of the limiter for a vendor or host.
+
+        Parameters
+        ----------
+        key: str
+            Vendor or host name.
+        rate: float, optional, default None
+            Requests per second.
+        burst: int, optional, default None
+            Burst size.
+
+        Returns
+        -------
+        limiter: TokenBucket
+            Shared limiter for the key.
+        """
+        limiter = self.get(key, rate=rate, burst=burst)
+        limiter.configure(rate=rate, burst=burst)
+
+        return limiter
+
+    def set_backend(self, backend: Optional[SQLiteRateLimitBackend]) -> None:
+        """
+        Sets the token store used by existing and new limiters.
+
+        Parameters
+        ----------
+        backend: SQLiteRateLimitBackend, optional
+            Cross-process token store. If None, limiters revert to in-memory tokens.
+        """
+        with self._lock:
+            self.backend = backend
+            for limiter in self._limiters.values():
+                limiter.backend = backend
+
+    def clear(self) -> None:
+        """
+        Removes all limiters.
+        """
+        with self._lock:
+            self._limiters.clear()
+
+
+# shared registry used by every adapter and vendor class
+# set CRYPTODATAPY_RATE_LIMIT_DB to a file path to share rate limits across worker processes
+rate_limiters = RateLimiterRegistry(
+    backend=SQLiteRateLimitBackend(os.environ['CRYPTODATAPY_RATE_LIMIT_DB'])
+    if os.environ.get('CRYPTODATAPY_RATE_LIMIT_DB') else None
+)
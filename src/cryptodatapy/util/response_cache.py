@@ -0,0 +1,328 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import logging
+from dataclasses import dataclass
+from time import time
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from cryptodatapy.util.json_decoder import json_decoder
+
+logger = logging.getLogger(__name__)
+
+# TTLs in seconds for metadata endpoints, by regex matched against the url's host and path
+# time series endpoints are not cached unless a TTL is added for them
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    r'coinmetrics\.io/v4/(catalog|catalog-all|catalog-v2|catalog-all-v2|reference-data)/': 86400,
+    r'llama\.fi/(protocols|v2/chains|overview/fees)$': 3600,
+    r'stablecoins\.llama\.fi/stablecoins$': 3600,
+    r'yields\.llama\.fi/pools$': 3600,
+    r'cryptocompare\.com/data/(all/coinlist|exchanges/general|index/list|v2/cccagg/pairs|blockchain/list|'
+    r'news/feeds)$': 86400,
+}
+
+# query params left out of the cache key
+IGNORED_PARAMS = ('api_key', 'apikey', 'api-key', 'key', 'token', 'x-api-key')
+
+
+@dataclass
+class CacheEntry:
+    """
+    Cached response stored on disk.
+    """
+    key: str
+    url: str
+    ttl: float
+    stored_at: float = 0.0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body_path: Optional[str] = None
+
+    @property
+    def is_stored(self) -> bool:
+        """
+        Returns True if a response body is stored for the entry.
+        """
+        return self.body_path is not None and os.path.exists(self.body_path)
+
+    @property
+    def is_fresh(self) -> bool:
+        """
+        Returns True if the stored response is within its TTL.
+        """
+        return self.is_stored and time() - self.stored_at < self.ttl
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """
+        Returns the conditional request headers used to revalidate a stale response.
+        """
+        headers = {}
+        if self.is_stored:
+            if self.etag:
+                headers['If-None-Match'] = self.etag
+            if self.last_modified:
+                headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+    def content(self) -> bytes:
+        """
+        Returns the stored response body.
+        """
+        with open(self.body_path, 'rb') as f:
+            return f.read()
+
+    def json(self) -> Any:
+        """
+        Returns the stored response body decoded from JSON.
+        """
+        return json_decoder.loads(self.content())
+
+
+class ResponseCache:
+    """
+    Optional on-disk cache of API responses, with per-endpoint TTLs and ETag/Last-Modified revalidation.
+
+    Responses are keyed by canonical url and query params, ignoring api keys, so the same metadata
+    request made with different keys or param order hits the same entry. Stale entries are revalidated
+    with a conditional request and reused on 304 Not Modified.
+    """
+
+    def __init__(
+            self,
+            cache_dir: Optional[str] = None,
+            ttls: Optional[Dict[str, float]] = None,
+            enabled: bool = False
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        cache_dir: str, optional, default None
+            Directory where responses are stored. Defaults to ~/.cache/cryptodatapy/http.
+        ttls: dict, optional, default None
+            TTL in seconds, by regex matched against the url's host and path. Only matching urls are cached.
+            A TTL of 0 revalidates the response on every request. Defaults to DEFAULT_CACHE_TTLS.
+        enabled: bool, default False
+            Enables the cache.
+        """
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'cryptodatapy', 'http')
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def canonicalize(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+        """
+        Returns the canonical endpoint (host and path) and query string of a request, without api keys.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url, with or without a query string.
+        params: dict, optional, default None
+            Query parameters.
+
+        Returns
+        -------
+        endpoint: str
+            Lowercase host and path.
+        query: str
+            Sorted query string.
+        """
+        parts = urlsplit(url)
+        endpoint = f"{parts.netloc.lower()}{parts.path}".rstrip('/')
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        query += [(k, v) for k, v in (params or {}).items() if v is not None]
+        query = sorted((str(k), str(v)) for k, v in query if str(k).lower() not in IGNORED_PARAMS)
+
+        return endpoint, urlencode(query)
+
+    def get_ttl(self, endpoint: str) -> Optional[float]:
+        """
+        Returns the TTL for an endpoint, or None if it is not cached.
+
+        Parameters
+        ----------
+        endpoint: str
+            Canonical host and path.
+
+        Returns
+        -------
+        ttl: float, optional
+            TTL in seconds.
+        """
+        for pattern, ttl in self.ttls.items():
+            if re.search(pattern, endpoint):
+                return ttl
+
+        return None
+
+    def _get_paths(self, key: str) -> Tuple[str, str]:
+        """
+        Returns the metadata and body file paths for a key.
+        """
+        return os.path.join(self.cache_dir, f"{key}.json"), os.path.join(self.cache_dir, f"{key}.body")
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
+        """
+        Looks up the cache entry for a request.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url.
+        params: dict, optional, default None
+            Query parameters.
+
+        Returns
+        -------
+        entry: CacheEntry, optional
+            Cache entry, with no stored body on a cache miss. None if the cache is disabled
+            or the endpoint is not cached.
+        """
+        if not self.enabled:
+            return None
+
+        endpoint, query = self.canonicalize(url, params)
+        ttl = self.get_ttl(endpoint)
+        if ttl is None:
+            return None
+
+        key = hashlib.sha256(f"{endpoint}?{query}".encode()).hexdigest()
+        entry = CacheEntry(key=key, url=f"{endpoint}?{query}", ttl=ttl)
+
+        meta_path, body_path = self._get_paths(key)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            entry.stored_at = meta['stored_at']
+            entry.etag, entry.last_modified = meta.get('etag'), meta.get('last_modified')
+            entry.body_path = body_path
+        except (OSError, ValueError, KeyError):
+            pass
+
+        return entry
+
+    def _write(self, path: str, data: Union[str, bytes]) -> None:
+        """
+        Writes a file atomically, so concurrent readers never see a partial file.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'wb' if isinstance(data, bytes) else 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def _write_meta(self, entry: CacheEntry) -> None:
+        """
+        Writes the metadata of an entry.
+        """
+        meta_path, _ = self._get_paths(entry.key)
+        self._write(meta_path, json.dumps({
+            'url': entry.url,
+            'stored_at': entry.stored_at,
+            'etag': entry.etag,
+            'last_modified': entry.last_modified
+        }))
+
+    def store(self, entry: Optional[CacheEntry], resp: requests.Response) -> None:
+        """
+        Stores a successful response.
+
+        Parameters
+        ----------
+        entry: CacheEntry, optional
+            Cache entry returned by lookup. If None, nothing is stored.
+        resp: requests.Response
+            Response object.
+        """
+        if entry is None or resp.status_code != 200:
+            return
+
+        try:
+            with self._lock:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            _, body_path = self._get_paths(entry.key)
+            self._write(body_path, resp.content)
+            entry.body_path = body_path
+            entry.stored_at = time()
+            entry.etag, entry.last_modified = resp.headers.get('ETag'), resp.headers.get('Last-Modified')
+            self._write_meta(entry)
+        except OSError as e:
+            logger.warning(f"Failed to cache response for {entry.url}: {e}")
+
+    def refresh(self, entry: CacheEntry, resp: Optional[requests.Response] = None) -> None:
+        """
+        Marks a revalidated (304 Not Modified) entry as fresh.
+
+        Parameters
+        ----------
+        entry: CacheEntry
+            Cache entry returned by lookup.
+        resp: requests.Response, optional, default None
+            304 response, used to update the validators.
+        """
+        entry.stored_at = time()
+        if resp is not None:
+            entry.etag = resp.headers.get('ETag', entry.etag)
+            entry.last_modified = resp.headers.get('Last-Modified', entry.last_modified)
+        try:
+            self._write_meta(entry)
+        except OSError as e:
+            logger.warning(f"Failed to refresh cached response for {entry.url}: {e}")
+
+    def configure(
+            self,
+            cache_dir: Optional[str] = None,
+            ttls: Optional[Dict[str, float]] = None,
+            enabled: Optional[bool] = None
+    ) -> None:
+        """
+        Updates cache settings.
+
+        Parameters
+        ----------
+        cache_dir: str, optional, default None
+            Directory where responses are stored.
+        ttls: dict, optional, default None
+            TTLs in seconds, by regex matched against the url's host and path. Updates the existing TTLs.
+        enabled: bool, optional, default None
+            Enables or disables the cache.
+        """
+        if cache_dir is not None:
+            self.cache_dir = cache_dir
+        if ttls is not None:
+            self.ttls.update(ttls)
+        if enabled is not None:
+            self.enabled = enabled
+
+    def clear(self) -> None:
+        """
+        Removes all cached responses.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        for file in os.listdir(self.cache_dir):
+            if file.endswith(('.json', '.body')):
+                os.remove(os.path.join(self.cache_dir, file))
+
+
+# shared cache used by every requester
+# set CRYPTODATAPY_CACHE_DIR to a directory to enable it without code changes
+response_cache = ResponseCache(
+    cache_dir=os.environ.get('CRYPTODATAPY_CACHE_DIR'),
+    enabled=bool(os.environ.get('CRYPTODATAPY_CACHE_DIR'))
+)
@@ -0,0 +1,109 @@
+import json
+import threading
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesces identical in-flight requests.
+
+    The first caller for a key runs the request, while concurrent callers with the same key wait for
+    and share its result, so identical requests made at once by several threads or async tasks hit the
+    vendor only once.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        enabled: bool, default True
+            Enables coalescing. If False, every call runs its own request.
+        """
+        self.enabled = enabled
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Returns the key identifying a request.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url.
+        params: dict, optional, default None
+            Query parameters.
+        headers: dict, optional, default None
+            Request headers.
+
+        Returns
+        -------
+        key: str
+            Request key.
+        """
+        return json.dumps([url, params or {}, headers or {}], sort_keys=True, default=str)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Runs fn, or waits for the in-flight call with the same key and returns its result.
+
+        Parameters
+        ----------
+        key: str
+            Request key.
+        fn: Callable
+            Function making the request.
+
+        Returns
+        -------
+        result: Any
+            Result of fn. Exceptions raised by fn are raised to every waiting caller.
+        """
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        # wait for the in-flight call
+        if not leader:
+            logger.debug(f"Joining in-flight request: {key}")
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._done(key)
+            future.set_exception(e)
+            raise
+
+        self._done(key)
+        future.set_result(result)
+
+        return result
+
+    def _done(self, key: str) -> None:
+        """
+        Removes a completed call, so later requests are sent again.
+        """
+        with self._lock:
+            self._calls.pop(key, None)
+
+
+# shared single-flight group used by every requester
+single_flight = SingleFlight()
@@ -0,0 +1,163 @@
+import json
+import os
+import tempfile
+import threading
+import logging
+from typing import Dict, Optional
+
+from cryptodatapy.util.json_decoder import json_decoder
+
+logger = logging.getLogger(__name__)
+
+
+class TimestampStore:
+    """
+    Store of the last timestamp retrieved for each market, by exchange and data type.
+
+    Incremental updates start from the last stored timestamp instead of the start of the history.
+    Timestamps are kept in memory for the life of the process and, when persist is set, in a JSON file.
+    Subclass and override get and update to keep timestamps elsewhere, e.g. alongside the stored data.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            persist: bool = False
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str, optional, default None
+            JSON file where timestamps are stored. Defaults to ~/.cache/cryptodatapy/ccxt/timestamps.json.
+        persist: bool, default False
+            Stores timestamps on disk, in addition to memory.
+        """
+        self.path = path or os.path.join(os.path.expanduser('~'), '.cache', 'cryptodatapy', 'ccxt',
+                                         'timestamps.json')
+        self.persist = persist
+        self._timestamps: Optional[Dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(exch: str, data_type: str, ticker: str, freq: Optional[str] = None) -> str:
+        """
+        Returns the store key for a market.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        data_type: str
+            Type of data, e.g. 'ohlcv', 'funding_rates', 'open_interest'.
+        ticker: str
+            Market symbol, e.g. 'BTC/USDT:USDT'.
+        freq: str, optional, default None
+            Frequency of data, e.g. '1h', '1d'. None for data types without a frequency.
+
+        Returns
+        -------
+        key: str
+            Store key.
+        """
+        return f"{exch}:{data_type}:{freq or ''}:{ticker}"
+
+    def _load(self) -> Dict[str, int]:
+        """
+        Loads timestamps from disk on first use. Must be called with the lock held.
+        """
+        if self._timestamps is None:
+            self._timestamps = {}
+            if self.persist:
+                try:
+                    with open(self.path, 'rb') as f:
+                        self._timestamps = json_decoder.loads(f.read())
+                except (OSError, ValueError):
+                    pass
+
+        return self._timestamps
+
+    def get(self, exch: str, data_type: str, ticker: str, freq: Optional[str] = None) -> Optional[int]:
+        """
+        Gets the last stored timestamp for a market.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        data_type: str
+            Type of data, e.g. 'ohlcv', 'funding_rates', 'open_interest'.
+        ticker: str
+            Market symbol.
+        freq: str, optional, default None
+            Frequency of data.
+
+        Returns
+        -------
+        timestamp: int, optional
+            Last timestamp in milliseconds since Unix epoch, or None if the market has no stored timestamp.
+        """
+        with self._lock:
+            return self._load().get(self.make_key(exch, data_type, ticker, freq))
+
+    def update(self, exch: str, data_type: str, timestamps: Dict[str, int], freq: Optional[str] = None) -> None:
+        """
+        Updates the last stored timestamps for markets. Timestamps never move backwards.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+        data_type: str
+            Type of data, e.g. 'ohlcv', 'funding_rates', 'open_interest'.
+        timestamps: dict
+            Dictionary of last timestamps in milliseconds since Unix epoch, by market symbol.
+        freq: str, optional, default None
+            Frequency of data.
+        """
+        if not timestamps:
+            return
+
+        with self._lock:
+            stored = self._load()
+            for ticker, ts in timestamps.items():
+                key = self.make_key(exch, data_type, ticker, freq)
+                stored[key] = max(int(ts), stored.get(key, int(ts)))
+            snapshot = dict(stored)
+
+        if not self.persist:
+            return
+
+        try:
+            cache_dir = os.path.dirname(self.path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to store timestamps for {exch}: {e}")
+
+    def clear(self) -> None:
+        """
+        Removes all timestamps, in memory and on disk.
+        """
+        with self._lock:
+            self._timestamps = {}
+
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+# shared timestamp store used by CCXT incremental updates
+# set CRYPTODATAPY_CACHE_DIR to a directory to persist timestamps across processes
+timestamp_store = TimestampStore(
+    path=os.path.join(os.environ['CRYPTODATAPY_CACHE_DIR'], 'ccxt', 'timestamps.json')
+    if os.environ.get('CRYPTODATAPY_CACHE_DIR') else None,
+    persist=bool(os.environ.get('CRYPTODATAPY_CACHE_DIR'))
+)
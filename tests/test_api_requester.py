@@ -0,0 +1,96 @@
+import pytest
+import responses
+
+from cryptodatapy.util.api_requester import APIRequester, AsyncAPIRequester
+from cryptodatapy.util.http_session import SessionPool, session_pool
+
+
+@responses.activate
+def test_get_request() -> None:
+    """
+    Test GET request through the shared session pool.
+    """
+    url = "https://api.example.com/v1/data"
+    responses.add(responses.GET, url, json={"data": [1, 2, 3]}, status=200)
+
+    resp = APIRequester.get_request(url=url, params={"page": 1})
+    assert resp == {"data": [1, 2, 3]}, "Failed to get data response."
+
+
+@responses.activate
+def test_get_request_failure() -> None:
+    """
+    Test GET request returns None after max attempts.
+    """
+    url = "https://api.example.com/v1/missing"
+    responses.add(responses.GET, url, json={"error": "not found"}, status=404)
+
+    resp = APIRequester.get_request(url=url, params={}, trials=2, pause=0)
+    assert resp is None, "Failed request should return None."
+    assert len(responses.calls) == 2, "Failed request should be retried."
+
+
+def test_session_pool_reuses_sessions() -> None:
+    """
+    Test sessions are shared per host.
+    """
+    pool = SessionPool(pool_maxsize=4, connect_timeout=1.0, read_timeout=2.0)
+    s1 = pool.get_session("https://api.example.com/v1/a")
+    s2 = pool.get_session("https://API.example.com/v1/b?x=1")
+    s3 = pool.get_session("https://other.example.com/v1/a")
+
+    assert s1 is s2, "Requests to the same host should share a session."
+    assert s1 is not s3, "Requests to different hosts should not share a session."
+    assert pool.timeout == (1.0, 2.0), "Incorrect timeout."
+    assert s1.get_adapter("https://api.example.com")._pool_maxsize == 4, "Incorrect pool size."
+
+
+def test_session_pool_configure() -> None:
+    """
+    Test reconfiguring the pool recreates sessions.
+    """
+    pool = SessionPool()
+    s1 = pool.get_session("https://api.example.com")
+    pool.configure(keep_alive=False, read_timeout=5.0)
+    s2 = pool.get_session("https://api.example.com")
+
+    assert s1 is not s2, "Sessions should be recreated after configure."
+    assert s2.headers["Connection"] == "close", "Keep-alive should be disabled."
+    assert pool.timeout[1] == 5.0, "Incorrect read timeout."
+    assert isinstance(session_pool, SessionPool)
+
+
+@responses.activate
+def test_get_many_returns_in_order() -> None:
+    """
+    Test concurrent GET requests are returned in request order.
+    """
+    urls = [f"https://api.example.com/v1/item/{i}" for i in range(10)]
+    for i, url in enumerate(urls):
+        responses.add(responses.GET, url, json={"id": i}, status=200)
+    responses.add(responses.GET, "https://api.example.com/v1/bad", json={}, status=404)
+
+    reqs = [{"url": url} for url in urls] + [{"url": "https://api.example.com/v1/bad"}]
+    resps = AsyncAPIRequester.run(
+        AsyncAPIRequester.get_many(reqs, vendor="example", max_concurrency=4, trials=1)
+    )
+    assert resps[:-1] == [{"id": i} for i in range(10)], "Responses should be returned in request order."
+    assert resps[-1] is None, "Failed request should return None."
+
+
+@responses.activate
+def test_run_inside_event_loop() -> None:
+    """
+    Test the sync bridge works when an event loop is already running.
+    """
+    url = "https://api.example.com/v1/data"
+    responses.add(responses.GET, url, json={"data": []}, status=200)
+
+    async def main():
+        return AsyncAPIRequester.run(AsyncAPIRequester.get_many([{"url": url}], vendor="example"))
+
+    assert AsyncAPIRequester.run(main()) == [{"data": []}]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptodatapy.transform.bars import Bars
+
+
+@pytest.fixture
+def trades():
+    minute = 60_000
+    return pd.DataFrame({
+        'timestamp': [0, 10, 20, minute, minute + 10, 0],
+        'ticker': ['BTC/USDT'] * 5 + ['ETH/USDT'],
+        'price': [100.0, 110.0, 90.0, 105.0, 95.0, 10.0],
+        'amount': [1.0, 2.0, 1.0, 3.0, 1.0, 5.0],
+        'side': ['buy', 'sell', 'buy', 'buy', 'sell', 'sell'],
+    })
+
+
+class TestBars:
+    """
+    Test class for Bars.
+    """
+    @pytest.fixture(autouse=True)
+    def bars_instance(self, trades):
+        self.bars_instance = Bars(trades)
+
+    def test_time_bars(self) -> None:
+        """
+        Test time bars.
+        """
+        bars = self.bars_instance.time_bars('1min')
+        btc = bars.xs('BTC/USDT', level='ticker')
+
+        assert isinstance(bars.index, pd.MultiIndex)
+        assert list(btc.index) == [pd.Timestamp('1970-01-01 00:00'), pd.Timestamp('1970-01-01 00:01')]
+        assert list(btc.iloc[0][['open', 'high', 'low', 'close', 'volume', 'trades']]) == \
+               [100.0, 110.0, 90.0, 90.0, 4.0, 3]
+        assert btc.vwap.iloc[0] == pytest.approx((100 + 220 + 90) / 4)
+        assert list(btc.buy_volume) == [2.0, 3.0]
+        assert list(btc.sell_volume) == [2.0, 1.0]
+        assert bars.loc[(pd.Timestamp('1970-01-01'), 'ETH/USDT'), 'volume_quote_ccy'] == 50.0
+
+    def test_volume_bars(self) -> None:
+        """
+        Test volume bars close on multiples of the volume threshold, without splitting trades.
+        """
+        btc = self.bars_instance.volume_bars(3.0).xs('BTC/USDT', level='ticker')
+
+        assert list(btc.volume) == [3.0, 1.0, 4.0], "Trades should be in the bar their cumulative volume ends in."
+        assert list(btc.trades) == [2, 1, 2]
+        assert btc.index[0] == pd.Timestamp(10, unit='ms'), "Bars should be labeled with their last trade."
+
+    def test_dollar_and_tick_bars(self) -> None:
+        """
+        Test dollar bars and tick bars.
+        """
+        dollar = self.bars_instance.dollar_bars(400.0).xs('BTC/USDT', level='ticker')
+        tick = self.bars_instance.tick_bars(2).xs('BTC/USDT', level='ticker')
+
+        assert list(dollar.volume_quote_ccy) == [320.0, 405.0, 95.0]
+        assert list(tick.trades) == [2, 2, 1]
+        assert np.isclose(tick.vwap.iloc[-1], 95.0)
@@ -0,0 +1,72 @@
+import threading
+from time import sleep
+
+from cryptodatapy.util.catalog_cache import CatalogCache
+
+
+def test_get_or_fetch() -> None:
+    """
+    Test a catalog is fetched once, then reused within its TTL.
+    """
+    cache = CatalogCache()
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return ['btc', 'eth']
+
+    key = cache.make_key('coinmetrics', 'assets', access='community')
+    assert cache.get_or_fetch(key, fetch) == ['btc', 'eth']
+    assert cache.get_or_fetch(key, fetch) == ['btc', 'eth']
+    assert len(fetches) == 1
+
+
+def test_make_key() -> None:
+    """
+    Test catalogs with different arguments have different keys, independent of argument order.
+    """
+    assert CatalogCache.make_key('coinmetrics', 'markets', exchange='binance', access='pro') == \
+        CatalogCache.make_key('coinmetrics', 'markets', access='pro', exchange='binance')
+    assert CatalogCache.make_key('coinmetrics', 'markets', exchange='binance') != \
+        CatalogCache.make_key('coinmetrics', 'markets', exchange='coinbase')
+
+
+def test_expired() -> None:
+    """
+    Test an expired catalog is fetched again, and a failed fetch is not stored.
+    """
+    cache = CatalogCache(ttl=0)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return None if len(fetches) == 1 else ['btc']
+
+    assert cache.get_or_fetch('key', fetch) is None
+    assert cache.get_or_fetch('key', fetch) == ['btc']
+    assert cache.get_or_fetch('key', fetch) == ['btc']
+    assert len(fetches) == 3
+
+
+def test_concurrent_fetch() -> None:
+    """
+    Test concurrent callers for the same catalog share a single fetch.
+    """
+    cache = CatalogCache()
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        sleep(0.1)
+        return ['btc']
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch('key', fetch)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [['btc']] * 5
+    assert len(fetches) == 1
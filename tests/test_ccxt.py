@@ -1,3 +1,6 @@
+import asyncio
+from time import monotonic
+
 import pandas as pd
 import pytest
 from unittest.mock import AsyncMock, Mock
@@ -6,7 +9,10 @@ import ccxt.async_support as ccxt_async
 
 from cryptodatapy.transform import ConvertParams
 from cryptodatapy.extract.datarequest import DataRequest
-from cryptodatapy.extract.libraries.ccxt_api import CCXT
+from cryptodatapy.extract.libraries.ccxt_api import CCXT, TRADES_SCHEMA
+from cryptodatapy.util.partitioned_writer import PartitionedWriter
+from cryptodatapy.util.rate_limiter import rate_limiters
+from cryptodatapy.util.timestamp_store import TimestampStore
 
 
 class TestCCXT:
@@ -139,6 +145,301 @@ class TestCCXT:
         assert data[0]['timestamp'] == 1737525600000
         assert data[0]['datetime'] == '2025-01-22T06:00:00.000Z'
 
+    @pytest.mark.asyncio
+    async def test_fetch_all_ohlcv_concurrent(self):
+        """
+        Test tickers are fetched concurrently, under the concurrency cap, and returned in ticker order.
+        """
+        tickers = [f"T{i}/USDT" for i in range(8)]
+        active, max_active = [0], [0]
+
+        async def fetch_ohlcv(ticker, freq, since=None, limit=None, params=None):
+            active[0] += 1
+            max_active[0] = max(max_active[0], active[0])
+            await asyncio.sleep(0.1)
+            active[0] -= 1
+            return [[params['until'], float(tickers.index(ticker)), 1.0, 1.0, 1.0, 1.0]]
+
+        exchange_async = AsyncMock()
+        exchange_async.id = "concurrent_test"
+        exchange_async.has = {"fetchOHLCV": True}
+        exchange_async.rateLimit = 250  # 4 requests per second
+        exchange_async.fetch_ohlcv.side_effect = fetch_ohlcv
+        self.ccxt_instance.exchange_async = exchange_async
+        rate_limiters.configure("ccxt:concurrent_test", rate=1000, burst=8)  # isolate the concurrency cap
+
+        data_resp = await self.ccxt_instance._fetch_all_ohlcv_async(
+            tickers, "1h", 1625097600000, 1625184000000, exch="concurrent_test"
+        )
+
+        assert [data[0][1] for data in data_resp] == list(range(8)), "Results should be in ticker order."
+        assert max_active[0] == 4, "Concurrency should be capped by the exchange rate limit."
+        exchange_async.close.assert_not_awaited()  # pooled sessions stay open until shutdown
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_ohlcv_shared_semaphore(self):
+        """
+        Test fetches use the semaphore shared by aiter_data chunks instead of their own.
+        """
+        active, max_active = [0], [0]
+
+        async def fetch_ohlcv(ticker, freq, since=None, limit=None, params=None):
+            active[0] += 1
+            max_active[0] = max(max_active[0], active[0])
+            await asyncio.sleep(0.05)
+            active[0] -= 1
+            return []
+
+        exchange_async = AsyncMock()
+        exchange_async.id = "shared_semaphore_test"
+        exchange_async.has = {"fetchOHLCV": True}
+        exchange_async.rateLimit = 10
+        exchange_async.fetch_ohlcv.side_effect = fetch_ohlcv
+        self.ccxt_instance.exchange_async = exchange_async
+        rate_limiters.configure("ccxt:shared_semaphore_test", rate=1000, burst=8)
+        self.ccxt_instance._semaphore = asyncio.Semaphore(2)
+
+        await asyncio.gather(*(
+            self.ccxt_instance._fetch_all_ohlcv_async(chunk, "1h", 1000, 10_000_000, exch="shared_semaphore_test")
+            for chunk in (["BTC/USDT", "ETH/USDT"], ["SOL/USDT", "XRP/USDT"])
+        ))
+
+        assert max_active[0] == 2, "Concurrency should be capped across chunks."
+
+    def test_get_ohlcv_shards(self):
+        """
+        Test date range is split into windows of max_obs_per_call candles aligned to the timeframe.
+        """
+        self.ccxt_instance.max_obs_per_call = 10
+        shards = self.ccxt_instance._get_ohlcv_shards("1m", 90_000, 1_500_000)
+
+        assert shards[0] == (90_000, 659_999), "Windows should be aligned to the timeframe."
+        assert shards[1] == (660_000, 1_259_999)
+        assert shards[-1] == (1_260_000, 1_500_000), "Last window should end at the end date."
+
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_sharded(self):
+        """
+        Test a single market's history is fetched in concurrent windows and stitched without duplicates.
+        """
+        minute = 60_000
+
+        async def fetch_ohlcv(ticker, freq, since=None, limit=None, params=None):
+            await asyncio.sleep(0.05)
+            # return one candle past the window, as exchanges with an inclusive until do
+            until = min(params['until'] + minute, since + limit * minute)
+            return [[ts, 1.0, 1.0, 1.0, 1.0, 1.0] for ts in range(since - since % minute, until, minute)
+                    if ts >= since][:limit]
+
+        exchange_async = AsyncMock()
+        exchange_async.id = "sharded_test"
+        exchange_async.has = {"fetchOHLCV": True}
+        exchange_async.rateLimit = 10
+        exchange_async.fetch_ohlcv.side_effect = fetch_ohlcv
+        self.ccxt_instance.exchange_async = exchange_async
+        self.ccxt_instance.max_obs_per_call = 100
+        self.ccxt_instance.shard_ohlcv = True
+        rate_limiters.configure("ccxt:sharded_test", rate=1000, burst=16)
+
+        start_date, end_date = 0, 1000 * minute - 1
+        data_resp = await self.ccxt_instance._fetch_all_ohlcv_async(
+            ["BTC/USDT"], "1m", start_date, end_date, exch="sharded_test"
+        )
+
+        timestamps = [candle[0] for candle in data_resp[0]]
+        assert timestamps == list(range(0, 1000 * minute, minute)), "Windows should be stitched without gaps " \
+                                                                    "or duplicates."
+        assert exchange_async.fetch_ohlcv.await_count <= 20, "Each window should need at most one extra request."
+
+    def test_get_start_dates(self):
+        """
+        Test incremental start dates follow explicit last timestamps, then the timestamp store.
+        """
+        self.ccxt_instance.data_req = self.data_req
+        self.ccxt_instance.timestamp_store = TimestampStore()
+        ticker = self.data_req.source_markets[0]
+        last_ts = self.data_req.source_start_date + 3_600_000
+
+        assert self.ccxt_instance._get_start_dates('ohlcv') == {}, "Markets without a timestamp should be omitted."
+
+        self.ccxt_instance.timestamp_store.update(self.data_req.exch, 'ohlcv', {ticker: last_ts}, freq='1h')
+        assert self.ccxt_instance._get_start_dates('ohlcv') == {ticker: last_ts + 1}
+        assert self.ccxt_instance._get_start_dates('funding_rates') == {}, "Data types should be tracked separately."
+
+        explicit = {ticker: pd.Timestamp(last_ts + 7_200_000, unit='ms')}
+        assert self.ccxt_instance._get_start_dates('ohlcv', explicit) == {ticker: last_ts + 7_200_001}
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_ohlcv_start_dates(self):
+        """
+        Test each ticker is fetched from its own start date in incremental updates.
+        """
+        exchange_async = AsyncMock()
+        exchange_async.id = "incremental_test"
+        exchange_async.has = {"fetchOHLCV": True}
+        exchange_async.rateLimit = 10
+        exchange_async.fetch_ohlcv.return_value = []
+        self.ccxt_instance.exchange_async = exchange_async
+        rate_limiters.configure("ccxt:incremental_test", rate=1000, burst=8)
+
+        await self.ccxt_instance._fetch_all_ohlcv_async(
+            ["BTC/USDT", "ETH/USDT"], "1h", 1000, 10_000_000, exch="incremental_test",
+            start_dates={"ETH/USDT": 5_000_001}
+        )
+
+        since = {call.args[0]: call.kwargs['since'] for call in exchange_async.fetch_ohlcv.await_args_list}
+        assert since == {"BTC/USDT": 1000, "ETH/USDT": 5_000_001}
+
+    def test_update_timestamps(self):
+        """
+        Test only closed OHLCV candles are recorded in the timestamp store.
+        """
+        self.ccxt_instance.data_req = self.data_req
+        self.ccxt_instance.timestamp_store = TimestampStore()
+        ticker = self.data_req.source_markets[0]
+        hour = 3_600_000
+        now_ms = int(pd.Timestamp.utcnow().value // 10 ** 6)
+        open_candle = now_ms - now_ms % hour
+        self.ccxt_instance.data_resp = [[[open_candle - hour, 1.0, 1.0, 1.0, 1.0, 1.0],
+                                         [open_candle, 1.0, 1.0, 1.0, 1.0, 1.0]]]
+
+        self.ccxt_instance._update_timestamps('ohlcv')
+
+        assert self.ccxt_instance.timestamp_store.get(self.data_req.exch, 'ohlcv', ticker, '1h') \
+            == open_candle - hour
+
+    @pytest.mark.asyncio
+    async def test_get_data_async_concurrent_data_types(self):
+        """
+        Test OHLCV, funding rates and open interest are fetched concurrently and joined into one dataframe.
+        """
+        self.ccxt_instance.data_req = self.data_req
+        ticker = self.data_req.source_markets[0]
+        ts = 1625097600000
+
+        async def fetch_ohlcv(*args, **kwargs):
+            await asyncio.sleep(0.2)
+            return [[[ts, 1.0, 2.0, 0.5, 1.5, 100.0]]]
+
+        async def fetch_funding_rates(*args, **kwargs):
+            await asyncio.sleep(0.2)
+            return [[{'symbol': ticker, 'fundingRate': 0.0001, 'timestamp': ts,
+                      'datetime': '2021-07-01T00:00:00.000Z'}]]
+
+        async def fetch_open_interest(*args, **kwargs):
+            await asyncio.sleep(0.2)
+            return [{'symbol': ticker, 'openInterestAmount': 85765.538, 'timestamp': ts,
+                     'datetime': '2021-07-01T00:00:00.000Z'}]
+
+        self.ccxt_instance._fetch_all_ohlcv_async = fetch_ohlcv
+        self.ccxt_instance._fetch_all_funding_rates_async = fetch_funding_rates
+        self.ccxt_instance._fetch_all_open_interest_async = fetch_open_interest
+
+        start = monotonic()
+        df = await self.ccxt_instance.get_data_async(self.data_req)
+
+        assert monotonic() - start < 0.5, "Data types should be fetched concurrently."
+        assert list(df.columns) == ["open", "high", "low", "close", "volume", "funding_rate", "oi"]
+        assert len(df) == 1, "Data types should be joined on the same index."
+
+    def test_iter_data(self):
+        """
+        Test iter_data yields a tidy dataframe per chunk of markets.
+        """
+        tickers = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+        self.data_req.source_markets = tickers
+        self.data_req.fields = ['close']
+        self.ccxt_instance.data_req = self.data_req
+        self.ccxt_instance._fetch_all_ohlcv = lambda markets, *args, **kwargs: \
+            [[[1625097600000, 1.0, 1.0, 1.0, float(tickers.index(ticker) + 1), 1.0]] for ticker in markets]
+
+        dfs = list(self.ccxt_instance.iter_data(self.data_req, chunk_size=2))
+
+        assert [list(df.index.get_level_values('ticker')) for df in dfs] == [tickers[:2], tickers[2:]]
+        assert all(list(df.columns) == ['close'] for df in dfs)
+        assert dfs[1].close.iloc[0] == 3.0
+
+    @pytest.mark.asyncio
+    async def test_aiter_data(self):
+        """
+        Test aiter_data yields each market as soon as it finishes.
+        """
+        tickers = ["BTC/USDT", "ETH/USDT"]
+        self.data_req.source_markets = tickers
+        self.data_req.fields = ['close']
+        self.ccxt_instance.data_req = self.data_req
+        self.ccxt_instance.exchange_async = self.ccxt_instance.exchange
+        self.ccxt_instance.exchange_async.rateLimit = 10  # allow both markets in flight
+
+        async def fetch_ohlcv(markets, *args, **kwargs):
+            await asyncio.sleep(0.2 if markets[0] == "BTC/USDT" else 0.01)
+            return [[[1625097600000, 1.0, 1.0, 1.0, 1.0, 1.0]]]
+
+        self.ccxt_instance._fetch_all_ohlcv_async = fetch_ohlcv
+
+        order = [df.index.get_level_values('ticker')[0] async for df in self.ccxt_instance.aiter_data(self.data_req)]
+
+        assert order == ["ETH/USDT", "BTC/USDT"], "Markets should be yielded in completion order."
+
+    def test_wrangle_ohlcv(self):
+        """
+        Test OHLCV responses are wrangled into a sorted tidy dataframe without duplicates or 0 values.
+        """
+        self.data_req.source_markets = ["ETH/USDT", "BTC/USDT"]
+        self.ccxt_instance.data_req = self.data_req
+        data_resp = [
+            [[1625097660000, 2.0, 2.0, 2.0, 2.0, 0.0], [1625097600000, 1.0, 1.0, 1.0, 1.0, 10.0]],
+            [[1625097600000, 3.0, 3.0, 3.0, 3.0, 30.0], [1625097600000, 3.0, 3.0, 3.0, 3.0, 30.0]]
+        ]
+
+        df = self.ccxt_instance.wrangle_data_resp('ohlcv', data_resp=data_resp)
+
+        assert list(df.index) == [(pd.Timestamp('2021-07-01 00:00'), "BTC/USDT"),
+                                  (pd.Timestamp('2021-07-01 00:00'), "ETH/USDT"),
+                                  (pd.Timestamp('2021-07-01 00:01'), "ETH/USDT")]
+        assert list(df.close) == [3.0, 1.0, 2.0]
+        assert df.volume.isna().iloc[-1], "0 values should be removed."
+        assert (df.dtypes == 'Float64').all(), "Data types are not Float64."
+
+    @pytest.mark.asyncio
+    async def test_fetch_trades(self, tmp_path):
+        """
+        Test trades are paginated without gaps or duplicates and spilled to disk.
+        """
+        trades = [{'timestamp': ts, 'id': str(i), 'side': 'buy', 'price': 1.0, 'amount': 1.0, 'cost': 1.0}
+                  for i, ts in enumerate([0, 1, 1, 1, 5, 9, 12])]
+
+        async def fetch_trades(ticker, since=None, limit=None, params=None):
+            return [trade for trade in trades if trade['timestamp'] >= since][:limit]
+
+        exchange_async = AsyncMock()
+        exchange_async.id = "trades_test"
+        exchange_async.has = {"fetchTrades": True}
+        exchange_async.rateLimit = 10
+        exchange_async.fetch_trades.side_effect = fetch_trades
+        self.ccxt_instance.exchange_async = exchange_async
+        self.ccxt_instance.max_obs_per_call = 3
+        rate_limiters.configure("ccxt:trades_test", rate=1000, burst=16)
+
+        with PartitionedWriter(str(tmp_path), TRADES_SCHEMA) as writer:
+            n_trades = await self.ccxt_instance._fetch_all_trades_async(["BTC/USDT"], 0, 10, "trades_test", writer)
+
+        ids = writer.dataset().to_table().sort_by('id').column('id').to_pylist()
+        assert n_trades == [6]
+        assert ids == ['0', '1', '2', '3', '4', '5'], "Trades sharing a millisecond should all be written once."
+
+    def test_next_trades_page_full_millisecond(self, caplog):
+        """
+        Test a full page of trades already written moves past the millisecond with a warning.
+        """
+        trades = [{'timestamp': 1, 'id': str(i)} for i in range(3)]
+
+        page, since, seen_ids, done = self.ccxt_instance._next_trades_page(trades, 1, 10, {'0', '1', '2'},
+                                                                           ticker="BTC/USDT")
+
+        assert (page, since, seen_ids, done) == ([], 2, set(), False)
+        assert "BTC/USDT" in caplog.text and "at 1." in caplog.text, "Skipped trades should be logged."
+
     @pytest.mark.asyncio
     async def test_fetch_tidy_ohlcv(self, exch='binance'):
         """
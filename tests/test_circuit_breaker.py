@@ -0,0 +1,87 @@
+from time import sleep
+
+import pytest
+import responses
+
+from cryptodatapy.util.api_requester import APIRequester
+from cryptodatapy.util.circuit_breaker import CircuitBreaker, circuit_breakers
+
+
+@pytest.fixture(autouse=True)
+def clear_breakers():
+    circuit_breakers.clear()
+    yield
+    circuit_breakers.clear()
+
+
+def test_breaker_opens_and_half_opens() -> None:
+    """
+    Test circuit opens after consecutive failures, then lets one probe through after the cooldown.
+    """
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.1)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == 'closed', "Failures should be consecutive."
+
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow_request()
+
+    sleep(0.15)
+    assert breaker.state == 'half_open'
+    assert breaker.allow_request()
+    assert not breaker.allow_request(), "Only one probe should be let through."
+
+    breaker.record_failure()
+    assert breaker.state == 'open', "Failed probe should re-open the circuit."
+
+    sleep(0.15)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == 'closed'
+
+
+def test_make_key() -> None:
+    """
+    Test breakers are keyed by vendor host.
+    """
+    assert circuit_breakers.make_key("https://API.llama.fi/protocols?x=1") == "https://api.llama.fi"
+    assert circuit_breakers.get("https://api.llama.fi") is circuit_breakers.get("https://api.llama.fi")
+
+
+@responses.activate
+def test_get_request_fails_fast_during_outage() -> None:
+    """
+    Test requests are short-circuited once the vendor's circuit opens.
+    """
+    url = "https://api.example-outage.com/v1/data"
+    responses.add(responses.GET, url, status=503)
+    circuit_breakers.configure(failure_threshold=3)
+    try:
+        assert APIRequester.get_request(url, params={}, trials=5, pause=0) is None
+        assert len(responses.calls) == 3, "Retries should stop once the circuit opens."
+
+        assert APIRequester.get_request(url, params={"page": 2}, trials=5, pause=0) is None
+        assert len(responses.calls) == 3, "Later requests should be short-circuited."
+    finally:
+        circuit_breakers.configure(failure_threshold=5)
+
+
+@responses.activate
+def test_client_errors_do_not_open_circuit() -> None:
+    """
+    Test client errors and rate limits don't count as vendor failures.
+    """
+    url = "https://api.example-client.com/v1/data"
+    responses.add(responses.GET, url, status=404)
+
+    for _ in range(3):
+        APIRequester.get_request(url, params={}, trials=3, pause=0)
+
+    assert circuit_breakers.get(circuit_breakers.make_key(url)).state == 'closed'
+    assert len(responses.calls) == 9
+
+
+if __name__ == "__main__":
+    pytest.main()
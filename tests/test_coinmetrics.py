@@ -1,10 +1,15 @@
 from datetime import datetime
+import json
+import os
 import pandas as pd
 import pytest
+import responses
 from time import sleep
 
+from cryptodatapy.extract.adapters.vendors.coinmetrics_adapter import CoinMetricsAdapter
 from cryptodatapy.extract.data_vendors.coinmetrics_api import CoinMetrics
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.util.api_requester import AsyncAPIRequester
 
 
 @pytest.fixture
@@ -12,6 +17,136 @@ def data_req():
     return DataRequest(tickers=['btc', 'eth', 'sol'], fields=["add_act", "tx_count", "close"])
 
 
+def test_get_time_windows() -> None:
+    """
+    Test date ranges are split into consecutive windows aligned to the hour, with naive and tz-aware bounds.
+    """
+    windows = CoinMetricsAdapter._get_time_windows('2024-01-01', '2024-01-01T10:00:00Z', 4)
+
+    assert windows == [
+        ('2024-01-01T00:00:00Z', '2024-01-01T02:00:00Z'),
+        ('2024-01-01T02:00:00Z', '2024-01-01T05:00:00Z'),
+        ('2024-01-01T05:00:00Z', '2024-01-01T07:00:00Z'),
+        ('2024-01-01T07:00:00Z', '2024-01-01T10:00:00Z'),
+    ], "Windows should be consecutive and aligned to the hour."
+    assert CoinMetricsAdapter._get_time_windows('2024-01-01T00:00:00+02:00', '2024-01-01', 2) == [
+        ('2023-12-31T22:00:00Z', '2023-12-31T23:00:00Z'),
+        ('2023-12-31T23:00:00Z', '2024-01-01'),
+    ], "Tz-aware bounds should be converted to UTC."
+    assert CoinMetricsAdapter._get_time_windows('2024-01-01', None, 2)[-1][1] is None, \
+        "Last window should keep the request's end time."
+
+
+def test_partition_requests() -> None:
+    """
+    Test requests are split by ticker and time window, in ticker and time order.
+    """
+    cm = CoinMetricsAdapter(config={'time_partitions': 2, 'max_tickers_per_partition': 2})
+    request = {'endpoint': '/timeseries/market-candles', 'markets': 'a,b,c',
+               'start_time': '2024-01-01', 'end_time': '2024-01-02T00:00:00Z'}
+
+    partitions, owners = cm._partition_requests([request, {**request, 'markets': 'd'}])
+
+    assert owners == [0, 0, 0, 0, 1, 1]
+    assert [p['markets'] for p in partitions] == ['a,b', 'a,b', 'c', 'c', 'd', 'd']
+    assert [(p['start_time'], p['end_time']) for p in partitions[:2]] == [
+        ('2024-01-01T00:00:00Z', '2024-01-01T12:00:00Z'), ('2024-01-01T12:00:00Z', '2024-01-02T00:00:00Z')
+    ]
+    assert [p.get('end_inclusive') for p in partitions] == ['false', None] * 3, \
+        "Every window but the last should exclude its end time."
+
+
+def test_partition_boundaries() -> None:
+    """
+    Test a data point falling exactly on a window boundary is in exactly one window.
+    """
+    cm = CoinMetricsAdapter(config={'time_partitions': 3})
+    request = {'endpoint': '/timeseries/asset-metrics', 'assets': 'btc',
+               'start_time': '2024-01-01', 'end_time': '2024-01-01T03:00:00Z'}
+    partitions, _ = cm._partition_requests([request])
+
+    def _in_window(time: pd.Timestamp, partition: dict) -> bool:
+        start, end = pd.Timestamp(partition['start_time']), pd.Timestamp(partition['end_time'])
+        return start <= time < end if partition.get('end_inclusive') == 'false' else start <= time <= end
+
+    for time in pd.date_range('2024-01-01', '2024-01-01T03:00:00', freq='h', tz='UTC'):
+        assert sum(_in_window(time, partition) for partition in partitions) == 1, \
+            f"{time} should be in exactly one window."
+
+
+@responses.activate
+def test_get_tick_data(tmp_path) -> None:
+    """
+    Test trades are paged from the start and finished days are written to disk as pages arrive.
+    """
+    base_url = "https://community-api.coinmetrics.io/v4"
+    url = f"{base_url}/timeseries/market-trades"
+    market = "binance-btc-usdt-spot"
+
+    def _trade(time: str, trade_id: str) -> dict:
+        return {"market": market, "time": time, "coin_metrics_id": trade_id, "amount": "0.5", "price": "42000.1",
+                "side": "buy"}
+
+    responses.add(responses.GET, url, status=200, json={
+        "data": [_trade("2024-01-01T12:00:00.000000000Z", "1"), _trade("2024-01-01T13:00:00.000000000Z", "2")],
+        "next_page_url": f"{url}?next_page_token=abc"
+    })
+    responses.add(responses.GET, url, status=200, json={"data": [_trade("2024-01-02T01:00:00.000000000Z", "3")]})
+
+    cm = CoinMetricsAdapter(config={"api_key": None, "base_url": base_url})
+    request = {"endpoint": "/timeseries/market-trades", "markets": market, "start_time": "2024-01-01",
+               "end_time": "2024-01-03", "page_size": 2}
+    cm._convert_params_to_vendor = lambda data_req: {"requests": [request]}
+
+    # rows written to disk after each page
+    rows_written = []
+
+    def _write_tick_page(writer, data):
+        CoinMetricsAdapter._write_tick_page(writer, data)
+        rows_written.append(writer.rows_written)
+
+    cm._write_tick_page = _write_tick_page
+
+    dataset = cm.get_tick_data(DataRequest(), str(tmp_path))
+
+    assert "paging_from=start" in responses.calls[0].request.url, "Pages should be requested in ascending order."
+    assert rows_written == [0, 2], "Earlier days should be written to disk as later pages arrive."
+    assert dataset.to_table().num_rows == 3
+    assert sorted(os.listdir(tmp_path / f"ticker={market}")) == ["date=2024-01-01", "date=2024-01-02"]
+
+
+
+@responses.activate
+def test_fetch_all_pages_independent_chains() -> None:
+    """
+    Test each request's page chain is followed on its own, so a slow page doesn't stall the other chains.
+    """
+    base_url = "https://community-api.coinmetrics.io/v4"
+    url = f"{base_url}/timeseries/asset-metrics"
+    n_pages = {"btc": 2, "eth": 3}
+    calls = []
+
+    def _callback(request):
+        asset, page = request.params["assets"], int(request.params.get("next_page_token", 1))
+        calls.append((asset, page))
+        # slow first page for btc
+        if asset == "btc" and page == 1:
+            sleep(0.5)
+        body = {"data": [{"asset": asset, "time": f"2024-01-0{page}T00:00:00.000000000Z", "AdrActCnt": "1"}]}
+        if page < n_pages[asset]:
+            body["next_page_url"] = f"{url}?assets={asset}&next_page_token={page + 1}"
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(responses.GET, url, callback=_callback)
+
+    cm = CoinMetricsAdapter(config={"api_key": None, "base_url": base_url})
+    requests = [{"endpoint": "/timeseries/asset-metrics", "assets": asset} for asset in n_pages]
+    pages = AsyncAPIRequester.run(cm._fetch_all_pages(requests=requests, pause=0))
+
+    assert calls.index(("eth", 3)) < calls.index(("btc", 2)), "Chains should not wait on each other's pages."
+    assert [page.num_rows for page in pages] == [2, 3]
+
+
 class TestCoinMetrics:
     """
     Test class for CoinMetrics.
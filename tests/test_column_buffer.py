@@ -0,0 +1,105 @@
+import pandas as pd
+
+from cryptodatapy.util.column_buffer import ColumnBuffer, decode_csv, decode_json_stream
+
+
+def test_to_frame() -> None:
+    """
+    Test pages are concatenated once, in order.
+    """
+    pages = ColumnBuffer()
+    pages.append({'time': ['2024-01-01', '2024-01-02'], 'asset': ['btc', 'btc'], 'PriceUSD': ['42000.1', '45000.2']})
+    pages.append({'time': ['2024-01-03'], 'asset': ['btc'], 'PriceUSD': ['44000.3']})
+    pages.append({})
+
+    assert len(pages) == 3
+    df = pages.to_frame()
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == ['time', 'asset', 'PriceUSD']
+    assert df.time.tolist() == ['2024-01-01', '2024-01-02', '2024-01-03']
+    assert df.PriceUSD.tolist() == ['42000.1', '45000.2', '44000.3']
+    assert len(pages) == 0
+
+
+def test_missing_columns() -> None:
+    """
+    Test columns missing from some pages are filled with nulls.
+    """
+    pages = ColumnBuffer()
+    pages.append({'time': ['2024-01-01'], 'market': ['binance-btc-usdt-spot'], 'price_close': ['42000.1']})
+    pages.append({'time': ['2024-01-01'], 'market': ['binance-eth-usdt-spot'], 'price_close': [None],
+                  'vwap': ['2300.5']})
+
+    df = pages.to_frame()
+    assert df.shape == (2, 4)
+    assert pd.isna(df.loc[0, 'vwap'])
+    assert pd.isna(df.loc[1, 'price_close'])
+    assert df.loc[1, 'vwap'] == '2300.5'
+
+
+def test_mixed_types() -> None:
+    """
+    Test columns with mixed types are kept as strings.
+    """
+    pages = ColumnBuffer()
+    pages.append({'time': ['2024-01-01', '2024-01-02'], 'value': [1, 'a']})
+
+    assert pages.to_frame().value.tolist() == ['1', 'a']
+
+
+def test_conflicting_types() -> None:
+    """
+    Test pages with different inferred types for a column are cast to a common type.
+    """
+    pages = ColumnBuffer()
+    pages.append({'time': ['2024-01-01'], 'value': [1], 'flag': ['a']})
+    pages.append({'time': ['2024-01-02'], 'value': [1.5], 'flag': [2.5]})
+    pages.append(decode_csv(b"time,value,flag\n2024-01-03,2.5,b\n")['data'])
+
+    df = pages.to_frame()
+    assert df.value.tolist() == [1.0, 1.5, 2.5], "Mixed numeric types should be cast to float."
+    assert df.flag.tolist() == ['a', '2.5', 'b'], "Strings and numbers should be cast to strings."
+
+
+def test_extend() -> None:
+    """
+    Test the pages of buffers are merged.
+    """
+    first, second = ColumnBuffer(), ColumnBuffer()
+    first.append({'time': ['2024-01-01'], 'value': ['1']})
+    second.append({'time': ['2024-01-02'], 'value': ['2']})
+    first.extend(second)
+
+    assert len(first) == 2
+    assert first.to_frame().value.tolist() == ['1', '2']
+
+
+def test_decode_csv() -> None:
+    """
+    Test CSV responses are parsed into typed columns.
+    """
+    content = (b"asset,time,PriceUSD,AdrActCnt\n"
+               b"btc,2024-01-01T00:00:00.000000000Z,42000.1,900000\n"
+               b"btc,2024-01-02T00:00:00.000000000Z,45000.2,\n")
+    pages = ColumnBuffer()
+    pages.append(decode_csv(content)['data'])
+    pages.append(decode_csv(b"")['data'])
+
+    df = pages.to_frame()
+    assert df.shape == (2, 4)
+    assert df.asset.tolist() == ['btc', 'btc']
+    assert df.PriceUSD.tolist() == [42000.1, 45000.2]
+    assert pd.isna(df.loc[1, 'AdrActCnt'])
+
+
+def test_decode_json_stream() -> None:
+    """
+    Test newline-delimited JSON responses are parsed into columns.
+    """
+    content = (b'{"market":"binance-btc-usdt-spot","time":"2024-01-01T00:00:00.000000000Z","price_close":"42000.1"}\n'
+               b'{"market":"binance-btc-usdt-spot","time":"2024-01-01T01:00:00.000000000Z","price_close":"42100.5"}\n')
+    df = decode_json_stream(content)['data'].to_pandas()
+
+    assert df.shape == (2, 3)
+    assert df.market.tolist() == ['binance-btc-usdt-spot'] * 2
+    assert df.price_close.tolist() == ['42000.1', '42100.5']
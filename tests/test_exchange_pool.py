@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from cryptodatapy.extract.libraries.ccxt_api import CCXT
+from cryptodatapy.util.exchange_pool import ExchangePool, exchange_pool
+
+
+def test_sync_instances_shared() -> None:
+    """
+    Test sync instances are reused across CCXT objects and keyed by options.
+    """
+    pool = ExchangePool()
+
+    assert pool.get('binance') is pool.get('binance')
+    assert pool.get('binance') is not pool.get('binance', options={'enableRateLimit': False})
+    assert pool.get('binance', options={'a': 1, 'b': 2}) is pool.get('binance', options={'b': 2, 'a': 1})
+    with pytest.raises(ValueError):
+        pool.get('not_an_exchange')
+
+
+def test_ccxt_objects_share_exchange() -> None:
+    """
+    Test CCXT objects use the shared pool.
+    """
+    first, second = CCXT(), CCXT()
+    first.get_frequencies_info('kraken')
+    second.get_frequencies_info('kraken')
+
+    assert first.exchange is second.exchange is exchange_pool.get('kraken')
+
+
+def test_async_instances_per_loop() -> None:
+    """
+    Test async instances are reused on an event loop, and closed and removed on shutdown.
+    """
+    pool = ExchangePool()
+
+    async def run():
+        exchange = pool.get_async('binance')
+        assert pool.get_async('binance') is exchange
+        await pool.close_async()
+        assert pool.get_async('binance') is not exchange, "Closed instances should be removed from the pool."
+        await pool.close_async()
+        return exchange
+
+    first = asyncio.run(run())
+    second = asyncio.run(run())
+    assert first is not second, "Async instances should not be shared across event loops."
+
+
+def test_async_instances_closed_on_loop_shutdown() -> None:
+    """
+    Test async instances are closed when their event loop shuts down.
+    """
+    pool = ExchangePool()
+    closed = []
+
+    class FakeExchange:
+        id = 'fake'
+
+        async def close(self):
+            closed.append(self)
+
+    pool._create = lambda exch, module, options=None: FakeExchange()
+
+    async def run():
+        return pool.get_async('binance')
+
+    exchange = asyncio.run(run())
+    assert closed == [exchange], "Sessions should be closed on loop shutdown."
+
+
+def test_ccxt_exchange_async_per_loop() -> None:
+    """
+    Test CCXT objects look up the pooled async instance for each event loop.
+    """
+    ccxt_instance = CCXT()
+
+    async def run():
+        exchange = ccxt_instance._load_exchange_async('binance')
+        assert ccxt_instance.exchange_async is exchange
+        return exchange
+
+    first = asyncio.run(run())
+    second = asyncio.run(run())
+    assert first is not second, "A new event loop should get a new async instance."
+    assert ccxt_instance.exchange_async is None, "Pooled instances should not be returned outside their loop."
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,97 @@
+import json
+
+import pandas as pd
+import pytest
+import responses
+
+from cryptodatapy.core.data_request import DataRequest
+from cryptodatapy.extract.adapters.vendors.coinmetrics_adapter import CoinMetricsAdapter
+from cryptodatapy.util.api_requester import APIRequester
+from cryptodatapy.util.circuit_breaker import circuit_breakers
+from cryptodatapy.util.json_decoder import JSONDecoder
+
+
+@pytest.fixture
+def page():
+    return json.dumps({
+        "data": [
+            {"asset": "btc", "time": "2024-01-01T00:00:00.000000000Z", "PriceUSD": "42000.1"},
+            {"asset": "btc", "time": "2024-01-02T00:00:00.000000000Z", "PriceUSD": "44000.2"},
+            {"asset": "eth", "time": "2024-01-01T00:00:00.000000000Z"},
+        ],
+        "next_page_url": "https://community-api.coinmetrics.io/v4/timeseries/asset-metrics?next_page_token=abc"
+    }).encode()
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_loads(page, backend) -> None:
+    """
+    Test decoding with each backend.
+    """
+    pytest.importorskip(backend)
+    decoder = JSONDecoder(backend=backend)
+
+    assert decoder.backend == backend
+    assert decoder.loads(page) == json.loads(page)
+
+
+def test_invalid_backend() -> None:
+    """
+    Test invalid backend.
+    """
+    with pytest.raises(ValueError):
+        JSONDecoder(backend="yaml")
+
+
+def test_decode_columns(page) -> None:
+    """
+    Test records array is decoded into columns, filling missing keys with None.
+    """
+    decoded = JSONDecoder().decode_columns(page)
+
+    assert decoded["data"] == {
+        "asset": ["btc", "btc", "eth"],
+        "time": ["2024-01-01T00:00:00.000000000Z", "2024-01-02T00:00:00.000000000Z",
+                 "2024-01-01T00:00:00.000000000Z"],
+        "PriceUSD": ["42000.1", "44000.2", None],
+    }
+    assert decoded["next_page_url"].endswith("next_page_token=abc"), "Other keys should be unchanged."
+    assert JSONDecoder.records_to_columns([]) == {}
+
+
+@responses.activate
+def test_get_request_columns(page) -> None:
+    """
+    Test requester returns columns when a columns key is provided.
+    """
+    url = "https://api.example.com/v4/timeseries"
+    responses.add(responses.GET, url, body=page, status=200, content_type="application/json")
+
+    resp = APIRequester.get_request(url, params={}, columns_key="data")
+    assert list(resp["data"]) == ["asset", "time", "PriceUSD"]
+
+
+@responses.activate
+def test_coinmetrics_pages_to_df(page) -> None:
+    """
+    Test CoinMetrics pages are decoded into columns and combined into a DataFrame.
+    """
+    circuit_breakers.clear()  # earlier tests may have opened the circuit without network access
+    base_url = "https://community-api.coinmetrics.io/v4"
+    last_page = json.dumps({"data": [{"asset": "eth", "time": "2024-01-02T00:00:00.000000000Z",
+                                      "PriceUSD": "2300.5"}]})
+    responses.add(responses.GET, base_url + "/timeseries/asset-metrics", body=page, status=200)
+    responses.add(responses.GET, base_url + "/timeseries/asset-metrics?next_page_token=abc", body=last_page,
+                  status=200)
+
+    adapter = CoinMetricsAdapter(config={"base_url": base_url, "api_key": None})
+    df = adapter._fetch_raw_data(DataRequest(pause=0),
+                                 {"requests": [{"endpoint": "/timeseries/asset-metrics", "assets": "btc,eth"}]})
+
+    assert isinstance(df, pd.DataFrame)
+    assert df.shape == (4, 3), "All pages should be combined."
+    assert df.PriceUSD.tolist() == ["42000.1", "44000.2", None, "2300.5"]
+
+
+if __name__ == "__main__":
+    pytest.main()
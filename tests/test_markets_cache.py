@@ -0,0 +1,86 @@
+import ccxt
+import pytest
+
+from cryptodatapy.util.markets_cache import MarketsCache
+
+MARKETS = {
+    'BTC/USDT': {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC',
+                 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True,
+                 'precision': {'amount': 5, 'price': 2}, 'limits': {}, 'info': {}}
+}
+CURRENCIES = {
+    'BTC': {'id': 'BTC', 'code': 'BTC', 'precision': 8},
+    'USDT': {'id': 'USDT', 'code': 'USDT', 'precision': 8}
+}
+
+
+class FakeExchange:
+    """
+    Exchange stub counting markets loaded over the network.
+    """
+    timeframes = {'1m': '1m', '1h': '1h'}
+
+    def __init__(self):
+        self.markets, self.currencies, self.loads = None, None, 0
+
+    def load_markets(self, reload=False):
+        self.loads += 1
+        self.markets, self.currencies = MARKETS, CURRENCIES
+        return self.markets
+
+    def set_markets(self, markets, currencies=None):
+        self.markets, self.currencies = markets, currencies
+
+
+def test_load_markets_from_snapshot(tmp_path) -> None:
+    """
+    Test markets are loaded from the exchange once, then hydrated from the snapshot across processes.
+    """
+    cache = MarketsCache(cache_dir=str(tmp_path), persist=True)
+    first, second = FakeExchange(), FakeExchange()
+
+    assert cache.load_markets('binance', first) == MARKETS
+    assert cache.load_markets('binance', second) == MARKETS
+    assert (first.loads, second.loads) == (1, 0), "Second instance should be hydrated from the snapshot."
+
+    # new process, same cache dir
+    third = FakeExchange()
+    assert MarketsCache(cache_dir=str(tmp_path), persist=True).load_markets('binance', third) == MARKETS
+    assert third.loads == 0, "Snapshot should be read from disk."
+    assert third.currencies == CURRENCIES
+
+
+def test_snapshot_ttl(tmp_path) -> None:
+    """
+    Test expired snapshots and reloads go to the exchange.
+    """
+    cache = MarketsCache(cache_dir=str(tmp_path), ttl=0)
+    exchange = FakeExchange()
+    cache.load_markets('binance', exchange)
+    assert cache.get('binance') is None, "Snapshot should expire after its TTL."
+
+    cache.configure(ttl=60)
+    cache.load_markets('binance', exchange, reload=True)
+    assert exchange.loads == 2
+    assert cache.get('binance')['timeframes'] == FakeExchange.timeframes
+
+
+def test_hydrate_ccxt_exchange(tmp_path) -> None:
+    """
+    Test a ccxt exchange is hydrated with set_markets, without a network request.
+    """
+    cache = MarketsCache(cache_dir=str(tmp_path))
+    assert not cache.hydrate('binance', ccxt.binance()), "No snapshot should be available yet."
+
+    loaded = FakeExchange()
+    loaded.load_markets()
+    cache.store('binance', loaded)
+
+    exchange = ccxt.binance()
+    assert cache.hydrate('binance', exchange)
+    assert exchange.symbols == ['BTC/USDT']
+    assert exchange.market('BTC/USDT')['id'] == 'BTCUSDT'
+
+
+if __name__ == "__main__":
+    pytest.main()
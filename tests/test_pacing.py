@@ -0,0 +1,81 @@
+from time import time
+
+import pytest
+import responses
+
+from cryptodatapy.util.api_requester import APIRequester
+from cryptodatapy.util.pacing import PacingController
+from cryptodatapy.util.rate_limiter import TokenBucket
+
+
+@pytest.fixture
+def pacer():
+    return PacingController(min_factor=0.1, max_factor=2.0, safety_margin=0.0)
+
+
+def test_parse_headers(pacer) -> None:
+    """
+    Test parsing of delta seconds, Unix timestamps and HTTP dates.
+    """
+    now = time()
+    rate_limit = pacer.parse_headers({'Retry-After': '5', 'X-RateLimit-Remaining': '42',
+                                      'X-RateLimit-Reset': str(int(now) + 30)})
+    assert rate_limit['retry_after'] == 5.0
+    assert rate_limit['remaining'] == 42.0
+    assert rate_limit['reset'] == pytest.approx(30, abs=1.5)
+
+    rate_limit = pacer.parse_headers({'RateLimit-Reset': str(int(now * 1000) + 10000),
+                                      'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    assert rate_limit['reset'] == pytest.approx(10, abs=1.5)
+    assert rate_limit['retry_after'] == 0.0, "HTTP dates in the past should not wait."
+    assert rate_limit['remaining'] is None
+
+
+@responses.activate
+def test_update_adjusts_rate() -> None:
+    """
+    Test pace is raised when quota is plentiful and lowered as it runs out.
+    """
+    url = "https://api.example.com/v1/data"
+    limiter = TokenBucket(rate=10)
+
+    responses.add(responses.GET, url, json={}, headers={'X-RateLimit-Remaining': '1000', 'X-RateLimit-Reset': '10'})
+    responses.add(responses.GET, url, json={}, headers={'X-RateLimit-Remaining': '20', 'X-RateLimit-Reset': '10'})
+
+    APIRequester.get_request(url, params={}, rate_limiter=limiter)
+    assert limiter.rate == 20.0, "Rate should be raised up to the max factor."
+    APIRequester.get_request(url, params={}, rate_limiter=limiter)
+    assert limiter.rate == pytest.approx(1.8), "Rate should be lowered to spread the remaining quota, less the margin."
+    assert limiter.base_rate == 10.0, "Base rate should be unchanged."
+
+
+@responses.activate
+def test_429_waits_for_retry_after() -> None:
+    """
+    Test a 429 response blocks the limiter for the advertised time before retrying.
+    """
+    url = "https://api.example.com/v1/data"
+    limiter = TokenBucket(rate=100, burst=5)
+    responses.add(responses.GET, url, json={}, status=429, headers={'Retry-After': '0.3'})
+    responses.add(responses.GET, url, json={"data": 1}, status=200)
+
+    start = time()
+    resp = APIRequester.get_request(url, params={}, trials=2, pause=0, rate_limiter=limiter)
+    assert resp == {"data": 1}
+    assert time() - start == pytest.approx(0.3, abs=0.1), "Retry should wait for the Retry-After time."
+
+
+def test_429_without_limiter(pacer) -> None:
+    """
+    Test the advertised wait is returned when there is no limiter to block.
+    """
+    class Resp:
+        status_code = 429
+        headers = {'X-RateLimit-Reset': '2'}
+
+    assert pacer.update(Resp()) == 2.0
+    assert pacer.update(None) is None
+
+
+if __name__ == "__main__":
+    pytest.main()
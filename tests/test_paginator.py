@@ -0,0 +1,118 @@
+import json
+import threading
+from time import sleep, monotonic
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import responses
+
+from cryptodatapy.extract.exchanges.dydx import Dydx
+from cryptodatapy.util.paginator import Paginator, split_date_range
+
+
+def test_cursor_pagination_overlaps_fetch_and_parse() -> None:
+    """
+    Test the next page is fetched while the current page is parsed.
+    """
+    pages = {0: {'data': [0], 'next': 1}, 1: {'data': [1], 'next': 2}, 2: {'data': [2], 'next': None}}
+    in_flight = []
+
+    def fetch(cursor):
+        in_flight.append(cursor)
+        sleep(0.1)
+        return pages[cursor]
+
+    def parse(page):
+        sleep(0.1)
+        return page['data'][0]
+
+    start = monotonic()
+    result = Paginator(fetch=fetch, first_request=0, next_request=lambda req, page: page['next'],
+                       parse=parse).collect()
+
+    assert result == [0, 1, 2]
+    assert monotonic() - start < 0.5, "Fetching and parsing should overlap."
+
+
+def test_window_pagination_prefetch_and_order() -> None:
+    """
+    Test window requests are prefetched up to the prefetch depth and returned in request order.
+    """
+    lock, active, max_active = threading.Lock(), [0], [0]
+
+    def fetch(window):
+        with lock:
+            active[0] += 1
+            max_active[0] = max(max_active[0], active[0])
+        sleep(0.05 * (3 - window % 3))  # later windows complete first
+        with lock:
+            active[0] -= 1
+        return window
+
+    result = Paginator(fetch=fetch, requests=range(6), prefetch=3).collect()
+
+    assert result == list(range(6)), "Pages should be returned in request order."
+    assert max_active[0] == 3, "No more than prefetch pages should be in flight."
+
+
+def test_max_pages_and_failed_page() -> None:
+    """
+    Test pagination stops at max_pages, and fails at a failed page unless partial results are allowed.
+    """
+    assert Paginator(fetch=lambda n: n, first_request=0, next_request=lambda req, page: req + 1,
+                     max_pages=4).collect() == [0, 1, 2, 3]
+    assert Paginator(fetch=lambda n: None, first_request=0,
+                     next_request=lambda req, page: req + 1).collect() == [], "A failed first page has no pages."
+    with pytest.raises(Exception, match="incomplete history"):
+        Paginator(fetch=lambda n: n if n < 2 else None, first_request=0,
+                  next_request=lambda req, page: req + 1).collect()
+    with pytest.raises(Exception, match="incomplete history"):
+        Paginator(fetch=lambda n: n if n != 2 else None, requests=range(4)).collect()
+    assert Paginator(fetch=lambda n: n if n < 2 else None, first_request=0, next_request=lambda req, page: req + 1,
+                     allow_partial=True).collect() == [0, 1]
+    with pytest.raises(ValueError):
+        Paginator(fetch=lambda n: n)
+
+
+def test_split_date_range() -> None:
+    """
+    Test date range is split into consecutive windows.
+    """
+    windows = split_date_range('2024-01-01', '2024-01-10', '4D')
+    assert windows == [
+        (pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-05')),
+        (pd.Timestamp('2024-01-05'), pd.Timestamp('2024-01-09')),
+        (pd.Timestamp('2024-01-09'), pd.Timestamp('2024-01-10')),
+    ]
+
+
+@responses.activate
+def test_dydx_ohlcv_walk_back() -> None:
+    """
+    Test dYdX OHLCV pages are walked back from the end date until the start date.
+    """
+    url = "https://indexer.dydx.trade/v4/candles/perpetualMarkets/BTC-USD"
+    end = pd.Timestamp('2024-01-01 23:59', tz='UTC')
+    times = pd.date_range(end=end, periods=1500, freq='min')[::-1]
+    candles = [{'ticker': 'BTC-USD', 'startedAt': t.strftime('%Y-%m-%dT%H:%M:%S.000Z'), 'close': '1'} for t in times]
+
+    def callback(request):
+        to_iso = pd.Timestamp(request.params['toISO'])
+        page = [c for c in candles if pd.Timestamp(c['startedAt']) <= to_iso][:1000]
+        return 200, {}, json.dumps({'candles': page})
+
+    responses.add_callback(responses.GET, url, callback=callback)
+
+    dydx = Dydx()
+    dydx.data_req = SimpleNamespace(source_start_date='2024-01-01T00:00:00Z', source_end_date='2024-01-01T23:59:00Z',
+                                    source_freq='1MIN', source_tickers=['BTC'])
+    df = dydx._fetch_ohlcv()
+
+    assert len(responses.calls) == 2, "Pagination should stop once the start date is reached."
+    assert len(df) == 1440
+    assert df.startedAt.is_monotonic_increasing and df.startedAt.is_unique
+
+
+if __name__ == "__main__":
+    pytest.main()
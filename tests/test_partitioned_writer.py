@@ -0,0 +1,71 @@
+import pyarrow as pa
+import pytest
+
+from cryptodatapy.util.partitioned_writer import PartitionedWriter
+
+SCHEMA = pa.schema([('timestamp', pa.timestamp('ms')), ('price', pa.float64())])
+DAY_MS = 86_400_000
+
+
+@pytest.mark.parametrize("file_format", ['parquet', 'ipc'])
+def test_write_partitions(tmp_path, file_format) -> None:
+    """
+    Test pages are written to files partitioned by ticker and day, and read back lazily.
+    """
+    with PartitionedWriter(str(tmp_path), SCHEMA, file_format=file_format) as writer:
+        writer.write('BTC/USDT', {'timestamp': [0, DAY_MS - 1, DAY_MS], 'price': [1.0, 2.0, 3.0]})
+        writer.write('ETH/USDT', {'timestamp': [10], 'price': [4.0]})
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['ticker=BTC%2FUSDT', 'ticker=ETH%2FUSDT']
+    assert sorted(p.name for p in (tmp_path / 'ticker=BTC%2FUSDT').iterdir()) == ['date=1970-01-01',
+                                                                                 'date=1970-01-02']
+
+    table = writer.dataset().to_table().sort_by('price')
+    assert table.column('price').to_pylist() == [1.0, 2.0, 3.0, 4.0]
+    assert table.column('ticker').to_pylist() == ['BTC/USDT', 'BTC/USDT', 'BTC/USDT', 'ETH/USDT']
+    assert table.column('date').to_pylist()[:3] == ['1970-01-01', '1970-01-01', '1970-01-02']
+
+
+def test_spill_bounds_memory(tmp_path) -> None:
+    """
+    Test full partitions and finished days are written to disk instead of buffered.
+    """
+    writer = PartitionedWriter(str(tmp_path), SCHEMA, chunk_rows=2)
+    writer.write('BTC/USDT', {'timestamp': [0, 1, 2], 'price': [1.0, 1.0, 1.0]})
+    assert writer.rows_written == 3, "Partition over chunk_rows should be written."
+
+    writer.write('BTC/USDT', {'timestamp': [DAY_MS], 'price': [1.0]})
+    writer.write('BTC/USDT', {'timestamp': [2 * DAY_MS], 'price': [1.0]})
+    assert writer.rows_written == 4, "Finished days should be written."
+
+    writer.close()
+    assert writer.rows_written == 5
+
+
+def test_rerun_replaces_partitions(tmp_path) -> None:
+    """
+    Test re-running a download into the same path replaces the partitions it writes, without duplicating rows.
+    """
+    with PartitionedWriter(str(tmp_path), SCHEMA, chunk_rows=1) as writer:
+        writer.write('BTC/USDT', {'timestamp': [0, 1, DAY_MS], 'price': [1.0, 2.0, 3.0]})
+
+    with PartitionedWriter(str(tmp_path), SCHEMA, chunk_rows=1) as writer:
+        writer.write('BTC/USDT', {'timestamp': [0, 1], 'price': [1.0, 2.0]})
+
+    table = writer.dataset().to_table().sort_by('price')
+    assert table.column('price').to_pylist() == [1.0, 2.0, 3.0], "Rewritten partitions should not be duplicated " \
+                                                                 "and other partitions should be kept."
+
+
+def test_write_finer_timestamps(tmp_path) -> None:
+    """
+    Test timestamps finer than milliseconds are partitioned by day without losing precision.
+    """
+    schema = pa.schema([('time', pa.timestamp('us')), ('price', pa.float64())])
+    with PartitionedWriter(str(tmp_path), schema, time_col='time') as writer:
+        writer.write('binance-btc-usdt-spot', {'time': [1, DAY_MS * 1000 - 1, DAY_MS * 1000], 'price': [1.0, 2.0, 3.0]})
+
+    assert sorted(p.name for p in (tmp_path / 'ticker=binance-btc-usdt-spot').iterdir()) == ['date=1970-01-01',
+                                                                                          'date=1970-01-02']
+    table = writer.dataset().to_table().sort_by('price')
+    assert table.column('time').cast(pa.int64()).to_pylist() == [1, DAY_MS * 1000 - 1, DAY_MS * 1000]
@@ -0,0 +1,108 @@
+import asyncio
+from time import monotonic
+
+import pytest
+
+from cryptodatapy.util.rate_limiter import RateLimiterRegistry, SQLiteRateLimitBackend, TokenBucket, rate_limiters
+
+
+def test_token_bucket_burst() -> None:
+    """
+    Test requests up to the burst size are not delayed.
+    """
+    limiter = TokenBucket(rate=1, burst=3)
+    waits = [limiter.reserve() for _ in range(3)]
+
+    assert waits == [0.0, 0.0, 0.0], "Requests within the burst should not wait."
+    assert limiter.reserve() == pytest.approx(1.0, abs=0.05), "Next request should wait for a token to refill."
+
+
+def test_token_bucket_acquire() -> None:
+    """
+    Test acquire paces requests at the configured rate.
+    """
+    limiter = TokenBucket(rate=50, burst=1)
+    start = monotonic()
+    for _ in range(6):
+        limiter.acquire()
+
+    assert monotonic() - start == pytest.approx(0.1, abs=0.05), "Requests should be paced at 50 req/s."
+
+
+def test_token_bucket_acquire_async() -> None:
+    """
+    Test concurrent async requests share the bucket.
+    """
+    limiter = TokenBucket(rate=50, burst=1)
+
+    async def main():
+        await asyncio.gather(*[limiter.acquire_async() for _ in range(6)])
+
+    start = monotonic()
+    asyncio.run(main())
+    assert monotonic() - start == pytest.approx(0.1, abs=0.05), "Requests should be paced at 50 req/s."
+
+
+def test_token_bucket_invalid_params() -> None:
+    """
+    Test invalid rate and burst values.
+    """
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_registry() -> None:
+    """
+    Test limiters are shared by key and reconfigured in place.
+    """
+    registry = RateLimiterRegistry(default_rate=5.0)
+    limiter = registry.get('vendor', rate=2.0, burst=4)
+
+    assert registry.get('vendor', rate=100.0) is limiter, "Limiter should be shared by key."
+    assert (limiter.rate, limiter.burst) == (2.0, 4), "Seed values should only apply to new limiters."
+    assert registry.get('other').rate == 5.0, "Incorrect default rate."
+
+    registry.configure('vendor', rate=10.0, burst=2)
+    assert (limiter.rate, limiter.burst) == (10.0, 2), "Limiter should be reconfigured in place."
+    assert isinstance(rate_limiters, RateLimiterRegistry)
+
+
+def test_sqlite_backend_shared_quota(tmp_path) -> None:
+    """
+    Test limiters in different processes share one quota through the SQLite backend.
+    """
+    path = str(tmp_path / "rate_limits.db")
+    # separate backends on the same file, as in separate worker processes
+    limiter1 = TokenBucket(rate=1, burst=2, key='vendor', backend=SQLiteRateLimitBackend(path))
+    limiter2 = TokenBucket(rate=1, burst=2, key='vendor', backend=SQLiteRateLimitBackend(path))
+    other = TokenBucket(rate=1, burst=2, key='other', backend=SQLiteRateLimitBackend(path))
+
+    assert limiter1.reserve() == 0.0
+    assert limiter2.reserve() == 0.0
+    assert limiter1.reserve() == pytest.approx(1.0, abs=0.05), "Burst should be shared across backends."
+    assert limiter2.reserve() == pytest.approx(2.0, abs=0.05), "Reservations should queue across backends."
+    assert other.reserve() == 0.0, "Buckets should be separate by key."
+
+
+def test_registry_set_backend(tmp_path) -> None:
+    """
+    Test setting a backend on the registry applies to existing and new limiters.
+    """
+    registry = RateLimiterRegistry()
+    limiter = registry.get('vendor', rate=1.0)
+    backend = SQLiteRateLimitBackend(str(tmp_path / "rate_limits.db"))
+    registry.set_backend(backend)
+
+    assert limiter.backend is backend, "Existing limiters should use the backend."
+    assert registry.get('other').backend is backend, "New limiters should use the backend."
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(1.0, abs=0.05), "Tokens should be drawn from the backend."
+
+    backend.reset()
+    assert limiter.reserve() == 0.0, "Reset should refill the buckets."
+
+
+if __name__ == "__main__":
+    pytest.main()
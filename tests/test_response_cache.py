@@ -0,0 +1,97 @@
+import pytest
+import responses
+
+from cryptodatapy.extract.adapters.vendors.coinmetrics_adapter import CoinMetricsAdapter
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.util.api_requester import APIRequester
+from cryptodatapy.util.response_cache import ResponseCache, response_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """
+    Enables the shared response cache in a temporary directory.
+    """
+    settings = response_cache.cache_dir, dict(response_cache.ttls), response_cache.enabled
+    response_cache.configure(cache_dir=str(tmp_path), enabled=True)
+    yield response_cache
+    response_cache.cache_dir, response_cache.ttls, response_cache.enabled = settings
+
+
+def test_canonicalize() -> None:
+    """
+    Test cache key ignores api keys, param order and host case.
+    """
+    key1 = ResponseCache.canonicalize("https://API.llama.fi/protocols?b=2", {"api_key": "abc", "a": 1})
+    key2 = ResponseCache.canonicalize("https://api.llama.fi/protocols", {"a": 1, "b": 2, "api_key": "xyz"})
+
+    assert key1 == key2 == ("api.llama.fi/protocols", "a=1&b=2")
+
+
+def test_get_ttl() -> None:
+    """
+    Test TTLs by endpoint class.
+    """
+    cache = ResponseCache()
+    assert cache.get_ttl("community-api.coinmetrics.io/v4/catalog/assets") == 86400
+    assert cache.get_ttl("api.llama.fi/v2/chains") == 3600
+    assert cache.get_ttl("min-api.cryptocompare.com/data/all/coinlist") == 86400
+    assert cache.get_ttl("api.llama.fi/protocol/aave") is None, "Time series should not be cached."
+
+
+@responses.activate
+def test_fresh_response_served_from_cache(cache) -> None:
+    """
+    Test fresh responses are served without a request.
+    """
+    url = "https://api.llama.fi/protocols"
+    responses.add(responses.GET, url, json=[{"name": "aave"}], status=200)
+
+    assert APIRequester.get_request(url, params={"api_key": "abc"}) == [{"name": "aave"}]
+    assert APIRequester.get_request(url, params={"api_key": "xyz"}) == [{"name": "aave"}]
+    assert DataRequest().get_req(url, params={}) == [{"name": "aave"}]
+    assert len(responses.calls) == 1, "Cached response should be reused."
+
+
+@responses.activate
+def test_stale_response_revalidated(cache) -> None:
+    """
+    Test stale responses are revalidated with ETag/Last-Modified and reused on 304.
+    """
+    cache.configure(ttls={r'example\.com/meta$': 0})
+    url = "https://example.com/meta"
+    responses.add(responses.GET, url, json={"v": 1}, status=200,
+                  headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    responses.add(responses.GET, url, status=304)
+
+    assert APIRequester.get_request(url, params={}) == {"v": 1}
+    assert APIRequester.get_request(url, params={}) == {"v": 1}, "Cached response should be reused on 304."
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert responses.calls[1].request.headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+@responses.activate
+def test_coinmetrics_catalog_served_from_cache(cache) -> None:
+    """
+    Test CoinMetrics catalogs are fetched once and then served from the cache.
+    """
+    base_url = "https://community-api.coinmetrics.io/v4"
+    responses.add(responses.GET, f"{base_url}/reference-data/assets",
+                  json={"data": [{"asset": "eth"}, {"asset": "btc"}]}, status=200)
+    cm = CoinMetricsAdapter(config={"api_key": None, "base_url": base_url})
+
+    assert cm.get_assets_info(as_list=True) == ["btc", "eth"]
+    assert cm.get_assets_info(as_list=True) == ["btc", "eth"]
+    assert len(responses.calls) == 1, "Cached catalog should be reused."
+
+
+def test_cache_disabled() -> None:
+    """
+    Test requests are not cached when the cache is disabled.
+    """
+    cache = ResponseCache(enabled=False)
+    assert cache.lookup("https://api.llama.fi/protocols") is None
+
+
+if __name__ == "__main__":
+    pytest.main()
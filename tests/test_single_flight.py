@@ -0,0 +1,71 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+
+import pytest
+import responses
+
+from cryptodatapy.util.api_requester import APIRequester, AsyncAPIRequester
+from cryptodatapy.util.single_flight import SingleFlight
+
+
+def slow_callback(request):
+    sleep(0.2)
+    return 200, {}, json.dumps({"data": [1, 2, 3]})
+
+
+@responses.activate
+def test_concurrent_identical_requests_coalesced() -> None:
+    """
+    Test identical concurrent requests share one response.
+    """
+    url = "https://api.example.com/v1/slow"
+    responses.add_callback(responses.GET, url, callback=slow_callback)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        resps = list(executor.map(lambda _: APIRequester.get_request(url, params={"a": 1}), range(5)))
+
+    assert len(responses.calls) == 1, "Identical in-flight requests should be coalesced."
+    assert all(resp == {"data": [1, 2, 3]} for resp in resps)
+    assert resps[0] is not resps[1], "Each caller should get its own decoded copy of the response."
+
+
+@responses.activate
+def test_async_identical_requests_coalesced() -> None:
+    """
+    Test identical async requests share one response, while different requests do not.
+    """
+    url = "https://api.example.com/v1/slow"
+    responses.add_callback(responses.GET, url, callback=slow_callback)
+
+    reqs = [{"url": url, "params": {"a": 1}}] * 4 + [{"url": url, "params": {"a": 2}}]
+    resps = AsyncAPIRequester.run(AsyncAPIRequester.get_many(reqs, vendor="example", max_concurrency=5))
+
+    assert len(responses.calls) == 2, "Only distinct requests should be sent."
+    assert resps == [{"data": [1, 2, 3]}] * 5
+
+
+def test_exceptions_shared_and_calls_cleared() -> None:
+    """
+    Test errors are raised to every waiting caller and completed calls are not reused.
+    """
+    group = SingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        sleep(0.1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(group.do, "key", fail) for _ in range(3)]
+    for future in futures:
+        with pytest.raises(ValueError):
+            future.result()
+    assert len(calls) == 1, "Concurrent callers should share the failed call."
+
+    assert group.do("key", lambda: 42) == 42, "Completed calls should not be reused."
+
+
+if __name__ == "__main__":
+    pytest.main()
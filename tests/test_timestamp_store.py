@@ -0,0 +1,42 @@
+from cryptodatapy.util.timestamp_store import TimestampStore
+
+
+def test_update_and_get(tmp_path) -> None:
+    """
+    Test last timestamps are stored by exchange, data type, frequency and market, and persisted across processes.
+    """
+    store = TimestampStore(path=str(tmp_path / 'timestamps.json'), persist=True)
+    store.update('binance', 'ohlcv', {'BTC/USDT': 1625097600000}, freq='1h')
+
+    assert store.get('binance', 'ohlcv', 'BTC/USDT', freq='1h') == 1625097600000
+    assert store.get('binance', 'ohlcv', 'BTC/USDT', freq='1d') is None, "Frequencies should be stored separately."
+    assert store.get('binance', 'funding_rates', 'BTC/USDT') is None, "Data types should be stored separately."
+
+    # new process, same file
+    assert TimestampStore(path=str(tmp_path / 'timestamps.json'), persist=True).get(
+        'binance', 'ohlcv', 'BTC/USDT', freq='1h') == 1625097600000
+
+
+def test_update_never_moves_backwards() -> None:
+    """
+    Test an older timestamp doesn't overwrite a newer one.
+    """
+    store = TimestampStore()
+    store.update('binance', 'funding_rates', {'BTC/USDT:USDT': 2000})
+    store.update('binance', 'funding_rates', {'BTC/USDT:USDT': 1000, 'ETH/USDT:USDT': 1500})
+
+    assert store.get('binance', 'funding_rates', 'BTC/USDT:USDT') == 2000
+    assert store.get('binance', 'funding_rates', 'ETH/USDT:USDT') == 1500
+
+
+def test_clear(tmp_path) -> None:
+    """
+    Test timestamps are removed in memory and on disk.
+    """
+    path = tmp_path / 'timestamps.json'
+    store = TimestampStore(path=str(path), persist=True)
+    store.update('binance', 'ohlcv', {'BTC/USDT': 1000}, freq='1h')
+    store.clear()
+
+    assert not path.exists()
+    assert store.get('binance', 'ohlcv', 'BTC/USDT', freq='1h') is None